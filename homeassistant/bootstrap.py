@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 import contextlib
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 import logging.handlers
 import os
@@ -16,7 +18,7 @@ from typing import TYPE_CHECKING, Any
 import voluptuous as vol
 import yarl
 
-from . import config as conf_util, config_entries, core, loader
+from . import config as conf_util, config_entries, core, loader, requirements
 from .components import http
 from .const import (
     FORMAT_DATETIME,
@@ -41,6 +43,7 @@ from .setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -250,6 +253,7 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         issue_registry.async_load(hass),
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
+        template.async_load_bytecode_cache(hass),
         restore_state.async_load(hass),
     )
 
@@ -536,6 +540,184 @@ async def async_setup_multi_components(
             )
 
 
+class _IntegrationSetupScheduler:
+    """Set up integrations as soon as the integrations they depend on are set up.
+
+    An integration waits for its dependencies and for its after dependencies
+    which were added to the scheduler in the same or an earlier call. After
+    dependencies added later are ignored, they are only marked to be loaded
+    once every integration that ignored them is done.
+    """
+
+    def __init__(
+        self,
+        hass: core.HomeAssistant,
+        config: dict[str, Any],
+        integration_cache: dict[str, loader.Integration],
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.config = config
+        self._integration_cache = integration_cache
+        self._start_time = monotonic()
+        self._timeline: dict[str, dict[str, Any]] = {}
+        hass.data[DATA_SETUP_TIMELINE] = self._timeline
+        self._domains: set[str] = set()
+        self._done: set[str] = set()
+        self._tasks: dict[str, asyncio.Task[bool]] = {}
+        # Domains which are waiting on other domains to be set up
+        self._waiting: dict[str, set[str]] = {}
+        self._dependents: defaultdict[str, set[str]] = defaultdict(set)
+        # The domain each waiting domain waited on last
+        self._blocked_by: dict[str, str] = {}
+        # After dependencies which were ignored and the domains ignoring them
+        self._ignored_by: defaultdict[str, set[str]] = defaultdict(set)
+        self._ignored_after_deps: defaultdict[str, set[str]] = defaultdict(set)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        # Domains which are waited on and the future to resolve once done
+        self._waiters: list[tuple[set[str], asyncio.Future[None]]] = []
+
+    @core.callback
+    def async_add(self, domains: set[str]) -> None:
+        """Add domains to set up and start the ones which are not waiting."""
+        self._domains |= domains
+        ready: list[str] = []
+        for domain in domains:
+            if (integration := self._integration_cache.get(domain)) is None:
+                ready.append(domain)
+                continue
+            for dep in integration.after_dependencies:
+                if dep not in self._domains:
+                    self._ignored_by[dep].add(domain)
+                    self._ignored_after_deps[domain].add(dep)
+            if (
+                waiting := (
+                    integration.all_dependencies.union(integration.after_dependencies)
+                    & self._domains
+                )
+                - self._done
+            ):
+                self._waiting[domain] = waiting
+                for dep in waiting:
+                    self._dependents[dep].add(domain)
+            else:
+                ready.append(domain)
+
+        async_set_domains_to_be_loaded(
+            self.hass,
+            {domain for domain in domains if not self._ignored_by.get(domain)},
+        )
+        if domains:
+            self._idle.clear()
+        for domain in ready:
+            self._async_start(domain)
+        self._async_check_progress()
+
+    async def async_wait(self, domains: set[str] | None = None) -> None:
+        """Wait until the given domains or all added domains are done."""
+        if domains is None:
+            await self._idle.wait()
+            return
+        if not (pending := domains - self._done):
+            return
+        waiter = (pending, self.hass.loop.create_future())
+        self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    @core.callback
+    def _async_start(self, domain: str) -> None:
+        """Start setting up a domain."""
+        critical_path: list[str] = []
+        if (blocked_by := self._blocked_by.pop(domain, None)) is not None:
+            critical_path = [*self._timeline[blocked_by]["critical_path"], blocked_by]
+        self._timeline[domain] = {
+            "started": monotonic() - self._start_time,
+            "critical_path": critical_path,
+        }
+        task = self._tasks[domain] = self.hass.async_create_task(
+            async_setup_component(self.hass, domain, self.config),
+            f"setup component {domain}",
+        )
+        task.add_done_callback(partial(self._async_setup_done, domain))
+
+    @core.callback
+    def _async_setup_done(self, domain: str, task: asyncio.Task[bool]) -> None:
+        """Start setting up the domains which were waiting on a domain."""
+        try:
+            task.result()
+        except BaseException as err:  # pylint: disable=broad-except
+            _LOGGER.error(
+                "Error setting up integration %s - received exception",
+                domain,
+                exc_info=(type(err), err, err.__traceback__),
+            )
+        del self._tasks[domain]
+        self._done.add(domain)
+        self._timeline[domain]["finished"] = monotonic() - self._start_time
+
+        for pending, future in self._waiters:
+            pending.discard(domain)
+            if not pending and not future.done():
+                future.set_result(None)
+
+        for dep in self._ignored_after_deps.pop(domain, ()):
+            ignored_by = self._ignored_by[dep]
+            ignored_by.discard(domain)
+            if not ignored_by and dep in self._domains and dep not in self._done:
+                if (dep_task := self._tasks.get(dep)) is None or not dep_task.done():
+                    async_set_domains_to_be_loaded(self.hass, {dep})
+
+        ready: list[str] = []
+        for dependent in self._dependents.pop(domain, ()):
+            waiting = self._waiting[dependent]
+            waiting.discard(domain)
+            if not waiting:
+                del self._waiting[dependent]
+                self._blocked_by[dependent] = domain
+                ready.append(dependent)
+        for dependent in ready:
+            self._async_start(dependent)
+        self._async_check_progress()
+
+    @core.callback
+    def _async_check_progress(self) -> None:
+        """Mark the scheduler idle or break after dependency cycles."""
+        if self._tasks:
+            return
+        if not self._waiting:
+            self._idle.set()
+            return
+        # Only after dependencies can form a cycle, start the remaining
+        # domains and let the setup of each domain sort it out
+        _LOGGER.warning(
+            "Integrations are waiting on each other as after dependencies: %s",
+            ", ".join(self._waiting),
+        )
+        waiting = list(self._waiting)
+        self._waiting.clear()
+        self._dependents.clear()
+        for domain in waiting:
+            self._async_start(domain)
+
+
+async def _async_process_requirements(
+    hass: core.HomeAssistant, domains: set[str]
+) -> None:
+    """Process the requirements of domains, errors are logged by their setup."""
+    await asyncio.gather(
+        *(
+            requirements.async_get_integration_with_requirements(hass, domain)
+            for domain in domains
+        ),
+        return_exceptions=True,
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -638,32 +820,44 @@ async def _async_set_up_integrations(
         - stage_1_domains
     )
 
-    # Enables after dependencies when setting up stage 1 domains
-    async_set_domains_to_be_loaded(hass, stage_1_domains)
+    # Each integration is set up as soon as the integrations it depends on
+    # are set up, stage 1 integrations ignore after dependencies on stage 2
+    scheduler = _IntegrationSetupScheduler(hass, config, integration_cache)
 
-    # Start setup
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 1 - moving forward")
-
-    # Add after dependencies when setting up stage 2 domains
-    async_set_domains_to_be_loaded(hass, stage_2_domains)
+        scheduler.async_add(stage_1_domains)
+
+        # Discovery integrations need to update their requirements before
+        # stage 2 integrations can load them inadvertently
+        if discovery_domains := stage_1_domains.intersection(DISCOVERY_INTEGRATIONS):
+            try:
+                async with hass.timeout.async_timeout(
+                    STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await _async_process_requirements(hass, discovery_domains)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+        scheduler.async_add(stage_2_domains)
+
+    # Stage 2 integrations are already being set up while waiting for stage 1
+    if stage_1_domains:
         try:
             async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await scheduler.async_wait(stage_1_domains)
         except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 2 - moving forward")
+            _LOGGER.warning("Setup timed out for stage 1 - moving forward")
+
+    try:
+        async with hass.timeout.async_timeout(STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME):
+            await scheduler.async_wait()
+    except asyncio.TimeoutError:
+        _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
@@ -20,6 +20,7 @@ from homeassistant.helpers.data_entry_flow import (
     FlowManagerResourceView,
 )
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.json import json_fragment
 from homeassistant.loader import (
     Integration,
     IntegrationNotFound,
@@ -496,7 +497,7 @@ async def config_entries_subscribe(
 
 async def async_matching_config_entries(
     hass: HomeAssistant, type_filter: list[str] | None, domain: str | None
-) -> list[dict[str, Any]]:
+) -> list[json_fragment]:
     """Return matching config entries by type and/or domain."""
     kwargs = {}
     if domain:
@@ -535,25 +536,6 @@ async def async_matching_config_entries(
 
 
 @callback
-def entry_json(entry: config_entries.ConfigEntry) -> dict:
+def entry_json(entry: config_entries.ConfigEntry) -> json_fragment:
     """Return JSON value of a config entry."""
-    handler = config_entries.HANDLERS.get(entry.domain)
-    # work out if handler has support for options flow
-    supports_options = handler is not None and handler.async_supports_options_flow(
-        entry
-    )
-
-    return {
-        "entry_id": entry.entry_id,
-        "domain": entry.domain,
-        "title": entry.title,
-        "source": entry.source,
-        "state": entry.state.value,
-        "supports_options": supports_options,
-        "supports_remove_device": entry.supports_remove_device or False,
-        "supports_unload": entry.supports_unload or False,
-        "pref_disable_new_entities": entry.pref_disable_new_entities,
-        "pref_disable_polling": entry.pref_disable_polling,
-        "disabled_by": entry.disabled_by,
-        "reason": entry.reason,
-    }
+    return entry.as_json_fragment
@@ -5,3 +5,10 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The number of states serialized at a time when
+# building history responses from the database
+HISTORY_BATCH_SIZE = 1000
+
+# The smallest number of states a client can ask to be sent at a time
+HISTORY_MIN_BATCH_SIZE = 100
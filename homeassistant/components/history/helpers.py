@@ -1,9 +1,12 @@
 """Helpers for the history integration."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from datetime import datetime as dt
+import math
+from typing import Any
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -21,3 +24,130 @@ def entities_may_have_state_changes_after(
             return True
 
     return False
+
+
+def _numeric_state(state: dict[str, Any]) -> float | None:
+    """Return the state as a finite float or None if it is not numeric."""
+    try:
+        value = float(state[COMPRESSED_STATE_STATE])
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+class StateDownsampler:
+    """Downsample the compressed states of one entity with min/max bucketing.
+
+    The period is split into max_points // 2 buckets and only the states
+    holding the minimum and maximum value of each bucket are kept, so
+    peaks survive. The first and last states are always kept, as are
+    states that are not numeric since they mark gaps in the graph.
+    """
+
+    __slots__ = (
+        "_start_time_ts",
+        "_bucket_width",
+        "_bucket_count",
+        "_bucket",
+        "_min",
+        "_max",
+        "_last",
+        "_last_emitted",
+    )
+
+    def __init__(
+        self, start_time_ts: float, end_time_ts: float, max_points: int
+    ) -> None:
+        """Initialize the downsampler."""
+        self._start_time_ts = start_time_ts
+        self._bucket_count = max(1, max_points // 2)
+        self._bucket_width = (
+            max(end_time_ts - start_time_ts, 0.0) / self._bucket_count or 1.0
+        )
+        self._bucket: int | None = None
+        self._min: tuple[float, dict[str, Any]] | None = None
+        self._max: tuple[float, dict[str, Any]] | None = None
+        self._last: dict[str, Any] | None = None
+        self._last_emitted: dict[str, Any] | None = None
+
+    def add(self, states: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Add states in time order and return the states ready to be sent."""
+        result: list[dict[str, Any]] = []
+        for state in states:
+            if self._last is None:
+                self._emit(result, state)
+            elif (value := _numeric_state(state)) is None:
+                self._flush_bucket(result)
+                self._emit(result, state)
+            else:
+                bucket = min(
+                    int(
+                        (state[COMPRESSED_STATE_LAST_UPDATED] - self._start_time_ts)
+                        / self._bucket_width
+                    ),
+                    self._bucket_count - 1,
+                )
+                if bucket != self._bucket:
+                    self._flush_bucket(result)
+                    self._bucket = bucket
+                if self._min is None or value < self._min[0]:
+                    self._min = (value, state)
+                if self._max is None or value > self._max[0]:
+                    self._max = (value, state)
+            self._last = state
+        return result
+
+    def flush(self) -> list[dict[str, Any]]:
+        """Return the states still held back once all states were added."""
+        result: list[dict[str, Any]] = []
+        self._flush_bucket(result)
+        if self._last is not None and self._last is not self._last_emitted:
+            self._emit(result, self._last)
+        return result
+
+    def _emit(self, result: list[dict[str, Any]], state: dict[str, Any]) -> None:
+        """Emit a state unless it was just emitted."""
+        if state is not self._last_emitted:
+            result.append(state)
+            self._last_emitted = state
+
+    def _flush_bucket(self, result: list[dict[str, Any]]) -> None:
+        """Emit the minimum and maximum states of the current bucket in order."""
+        if self._min is None or self._max is None:
+            return
+        min_state = self._min[1]
+        max_state = self._max[1]
+        if (
+            min_state[COMPRESSED_STATE_LAST_UPDATED]
+            > max_state[COMPRESSED_STATE_LAST_UPDATED]
+        ):
+            min_state, max_state = max_state, min_state
+        self._emit(result, min_state)
+        self._emit(result, max_state)
+        self._bucket = self._min = self._max = None
+
+
+def downsample_entity_batches(
+    batches: Iterable[tuple[str, list[dict[str, Any]]]],
+    start_time_ts: float,
+    end_time_ts: float,
+    max_points: int,
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """Downsample batches of compressed states while they are streamed.
+
+    The batches of an entity are read one after another, so each entity
+    is flushed before the next one starts and its batches stay together.
+    """
+    current: tuple[str, StateDownsampler] | None = None
+    for entity_id, states in batches:
+        if current is None or current[0] != entity_id:
+            if current and (downsampled := current[1].flush()):
+                yield current[0], downsampled
+            current = (
+                entity_id,
+                StateDownsampler(start_time_ts, end_time_ts, max_points),
+            )
+        if downsampled := current[1].add(states):
+            yield entity_id, downsampled
+    if current and (downsampled := current[1].flush()):
+        yield current[0], downsampled
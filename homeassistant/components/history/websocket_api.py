@@ -36,10 +36,16 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
+from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_BATCH_SIZE,
+    HISTORY_MIN_BATCH_SIZE,
+    MAX_PENDING_HISTORY_STATES,
+)
+from .helpers import downsample_entity_batches, entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,35 +68,134 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _significant_states_batches(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+    batch_size: int,
+) -> Iterable[tuple[str, list[dict[str, Any]]]]:
+    """Return the compressed significant states batches, downsampled if asked."""
+    batches = cast(
+        Iterable[tuple[str, list[dict[str, Any]]]],
+        history.get_significant_states_batches(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+            batch_size,
+        ),
+    )
+    if max_points:
+        batches = downsample_entity_batches(
+            batches,
+            start_time.timestamp(),
+            (end_time or dt_util.utcnow()).timestamp(),
+            max_points,
+        )
+    return batches
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
     start_time: dt,
     end_time: dt | None,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None = None,
 ) -> str:
-    """Fetch history significant_states and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
-    )
+    """Fetch history significant_states and convert them to json in the executor.
+
+    The states are serialized one batch at a time as they are read from
+    the database so the full history is never held as python objects,
+    and the json is joined once. If max_points is set, numeric series are
+    downsampled as they are read.
+    """
+    fragments: list[str] = []
+    last_entity_id: str | None = None
+    for entity_id, states in _significant_states_batches(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        max_points,
+        HISTORY_BATCH_SIZE,
+    ):
+        # The batches of an entity are read one after another
+        if entity_id == last_entity_id:
+            fragments.append(",")
+        else:
+            fragments.append(
+                f"{JSON_DUMP(entity_id)}:["
+                if last_entity_id is None
+                else f"],{JSON_DUMP(entity_id)}:["
+            )
+            last_entity_id = entity_id
+        # Strip the enclosing brackets so the batches can be joined
+        fragments.append(JSON_DUMP(states)[1:-1])
+    if last_entity_id is not None:
+        fragments.append("]")
+    return messages.construct_result_message(msg_id, f'{{{"".join(fragments)}}}')
+
+
+def _ws_send_significant_states_batches(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+    batch_size: int,
+) -> str:
+    """Send history significant_states in batches from the executor.
+
+    Each batch of at most batch_size states is sent as an event message
+    as soon as it has been read from the database, so neither the states
+    nor their json are ever held for the full history. The next batch is
+    only read once the event loop has sent the previous one. The returned
+    result message, without states, tells the client all were sent.
+    """
+    for entity_id, states in _significant_states_batches(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        max_points,
+        batch_size,
+    ):
+        run_callback_threadsafe(
+            hass.loop,
+            connection.send_message,
+            JSON_DUMP(messages.event_message(msg_id, {"states": {entity_id: states}})),
+        ).result()
+    return JSON_DUMP(messages.result_message(msg_id, {}))
 
 
 @websocket_api.websocket_command(
@@ -103,6 +208,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
+        vol.Optional("batch_size"): vol.All(int, vol.Range(min=HISTORY_MIN_BATCH_SIZE)),
     }
 )
 @websocket_api.async_response
@@ -154,6 +261,26 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if batch_size := msg.get("batch_size"):
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_send_significant_states_batches,
+                hass,
+                connection,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                msg.get("max_points"),
+                batch_size,
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -166,6 +293,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -263,34 +391,123 @@ def _generate_historical_response(
     )
 
 
+def _send_historical_response_batches(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    send_empty: bool,
+    batch_size: int,
+) -> tuple[float, dt | None, str | None]:
+    """Send a historical response in batches of at most batch_size states.
+
+    Every batch except the last one is sent as soon as it has been read
+    from the database, and the next batch is only read once the event
+    loop has sent it. The last batch is returned with the start_time
+    and end_time of the historical response so the client knows all the
+    historical states have been received.
+    """
+    last_time_ts = 0.0
+    pending: dict[str, list[dict[str, Any]]] = {}
+    for entity_id, states in cast(
+        Iterable[tuple[str, list[dict[str, Any]]]],
+        history.get_significant_states_batches(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+            batch_size,
+        ),
+    ):
+        if msg_id not in connection.subscriptions:
+            # The client unsubscribed while we were reading the history
+            return last_time_ts, None, None
+        if (state_last_time := states[-1][COMPRESSED_STATE_LAST_UPDATED]) > (
+            last_time_ts
+        ):
+            last_time_ts = cast(float, state_last_time)
+        if pending:
+            run_callback_threadsafe(
+                hass.loop,
+                connection.send_message,
+                JSON_DUMP(messages.event_message(msg_id, {"states": pending})),
+            ).result()
+        pending = {entity_id: states}
+
+    if last_time_ts == 0:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        if not send_empty:
+            return last_time_ts, None, None
+        last_time_dt = end_time
+    else:
+        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
+
+    return (
+        last_time_ts,
+        last_time_dt,
+        _generate_websocket_response(msg_id, start_time, last_time_dt, pending),
+    )
+
+
 async def _async_send_historical_states(
     hass: HomeAssistant,
     connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    batch_size: int | None = None,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
+    if batch_size:
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _send_historical_response_batches,
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+            batch_size,
+        )
+    else:
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+        )
     if payload:
         connection.send_message(payload)
     return last_time_dt if last_time_ts != 0 else None
@@ -404,6 +621,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("batch_size"): vol.All(int, vol.Range(min=HISTORY_MIN_BATCH_SIZE)),
     }
 )
 @websocket_api.async_response
@@ -443,6 +661,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    batch_size: int | None = msg.get("batch_size")
 
     if end_time and end_time <= utc_now:
         if (
@@ -469,6 +688,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            batch_size,
         )
         return
 
@@ -533,6 +753,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        batch_size,
     )
 
     if msg_id not in connection.subscriptions:
@@ -574,4 +795,5 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        batch_size=batch_size,
     )
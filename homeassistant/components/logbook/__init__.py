@@ -44,6 +44,7 @@ from .const import (  # noqa: F401
     LOGBOOK_ENTRY_SOURCE,
 )
 from .models import LazyEventPartialState, LogbookConfig
+from .processor import LogbookResultCache
 
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
@@ -135,7 +136,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     external_events: dict[
         str, tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]]
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    hass.data[DOMAIN] = LogbookConfig(
+        external_events, filters, entities_filter, LogbookResultCache()
+    )
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
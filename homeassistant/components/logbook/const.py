@@ -1,6 +1,8 @@
 """Event parser and human readable log generator."""
 from __future__ import annotations
 
+from datetime import timedelta
+
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.counter import DOMAIN as COUNTER_DOMAIN
 from homeassistant.components.proximity import DOMAIN as PROXIMITY_DOMAIN
@@ -44,3 +46,17 @@ AUTOMATION_EVENTS = {EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED}
 
 # Events that are built-in to the logbook or core
 BUILT_IN_EVENTS = {EVENT_LOGBOOK_ENTRY, EVENT_CALL_SERVICE}
+
+# Events older than this are expected to be committed to the
+# database and can be kept in the shared logbook result cache
+LOGBOOK_CACHE_SETTLE_TIME = timedelta(minutes=5)
+
+# Requests are grouped by the hour their time window starts in
+LOGBOOK_CACHE_BUCKET_SECONDS = 3600
+
+# The number of time windows kept in the shared logbook result cache
+LOGBOOK_CACHE_MAX_ENTRIES = 16
+
+# Time windows with more events than this are not kept in the
+# shared logbook result cache
+LOGBOOK_CACHE_MAX_EVENTS = 5000
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.engine.row import Row
 
@@ -20,6 +20,9 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+if TYPE_CHECKING:
+    from .processor import LogbookResultCache
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -30,6 +33,7 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    result_cache: LogbookResultCache | None = None
 
 
 class LazyEventPartialState:
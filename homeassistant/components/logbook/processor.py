@@ -1,13 +1,16 @@
 """Event parser and human readable log generator."""
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections.abc import Callable, Generator, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+import threading
 from typing import Any
 
+from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
 
@@ -51,6 +54,10 @@ from .const import (
     CONTEXT_STATE,
     CONTEXT_USER_ID,
     DOMAIN,
+    LOGBOOK_CACHE_BUCKET_SECONDS,
+    LOGBOOK_CACHE_MAX_ENTRIES,
+    LOGBOOK_CACHE_MAX_EVENTS,
+    LOGBOOK_CACHE_SETTLE_TIME,
     LOGBOOK_ENTRY_DOMAIN,
     LOGBOOK_ENTRY_ENTITY_ID,
     LOGBOOK_ENTRY_ICON,
@@ -67,6 +74,10 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# The queries exclude events at the end time, so the cache selects events
+# up to a bit later and keeps those at its end time itself
+_CACHE_END_OVERLAP_SECONDS = 1.0
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -95,6 +106,7 @@ class EventProcessor:
         context_id: str | None = None,
         timestamp: bool = False,
         include_entity_name: bool = True,
+        cache_results: bool = True,
     ) -> None:
         """Init the event stream."""
         assert not (
@@ -106,8 +118,13 @@ class EventProcessor:
         self.entity_ids = entity_ids
         self.device_ids = device_ids
         self.context_id = context_id
+        self.timestamp = timestamp
+        self.include_entity_name = include_entity_name
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.result_cache: LogbookResultCache | None = (
+            logbook_config.result_cache if cache_results and not context_id else None
+        )
         format_time = (
             _row_time_fired_timestamp if timestamp else _row_time_fired_isoformat
         )
@@ -141,6 +158,16 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        if self.result_cache is not None:
+            return self.result_cache.get_events(self, start_day, end_day)
+        return self.get_events_from_database(start_day, end_day)
+
+    def get_events_from_database(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> list[dict[str, Any]]:
+        """Get events for a period of time from the database."""
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -183,6 +210,142 @@ class EventProcessor:
         )
 
 
+@dataclass(slots=True)
+class _LogbookCacheEntry:
+    """Humanified events of a time window shared between requests."""
+
+    processor: EventProcessor
+    start_ts: float
+    end_ts: float
+    events: list[dict[str, Any]]
+    lock: threading.Lock
+    too_large: bool = False
+
+
+class LogbookResultCache:
+    """A shared cache of humanified logbook events.
+
+    Logbook cards on dashboards ask for nearly the same time window
+    over and over again. Events which are old enough to be committed to
+    the database are kept per entity and device ids and the hour the
+    window starts in, so later requests only have to select and humanify
+    the events that happened since the previous request.
+
+    A cached window holds the events after its start time up to and
+    including its end time. Windows with more than LOGBOOK_CACHE_MAX_EVENTS
+    events are no longer cached.
+
+    Cached events are shared between requests and must not be modified.
+    """
+
+    def __init__(self) -> None:
+        """Init the cache."""
+        self._entries: LRU = LRU(LOGBOOK_CACHE_MAX_ENTRIES)
+        self._lock = threading.Lock()
+
+    def _get_entry(
+        self, processor: EventProcessor, start_ts: float
+    ) -> _LogbookCacheEntry:
+        """Get the entry for a request or create a new one."""
+        key = (
+            frozenset(processor.event_types),
+            tuple(processor.entity_ids or ()),
+            tuple(processor.device_ids or ()),
+            processor.include_entity_name,
+            int(start_ts // LOGBOOK_CACHE_BUCKET_SECONDS),
+        )
+        with self._lock:
+            entry: _LogbookCacheEntry | None = self._entries.get(key)
+            if entry is not None and entry.start_ts <= start_ts:
+                return entry
+            self._entries[key] = entry = _LogbookCacheEntry(
+                EventProcessor(
+                    processor.hass,
+                    processor.event_types,
+                    processor.entity_ids,
+                    processor.device_ids,
+                    timestamp=True,
+                    include_entity_name=processor.include_entity_name,
+                    cache_results=False,
+                ),
+                start_ts,
+                start_ts,
+                [],
+                threading.Lock(),
+            )
+            return entry
+
+    def get_events(
+        self, processor: EventProcessor, start_day: dt, end_day: dt
+    ) -> list[dict[str, Any]]:
+        """Get events for a period of time for a processor."""
+        start_ts = dt_util.utc_to_timestamp(start_day)
+        end_ts = dt_util.utc_to_timestamp(end_day)
+        settled_ts = dt_util.utc_to_timestamp(
+            dt_util.utcnow() - LOGBOOK_CACHE_SETTLE_TIME
+        )
+        if start_ts >= settled_ts:
+            return processor.get_events_from_database(start_day, end_day)
+
+        entry = self._get_entry(processor, start_ts)
+        with entry.lock:
+            if (
+                not entry.too_large
+                and (cache_end_ts := min(end_ts, settled_ts)) > entry.end_ts
+            ):
+                self._extend_entry(entry, cache_end_ts)
+            if entry.too_large:
+                return processor.get_events_from_database(start_day, end_day)
+            cached_end_ts = entry.end_ts
+            events = entry.events
+            # The database selects events between the start
+            # and end time, excluding both
+            events = events[
+                bisect_right(events, start_ts, key=_entry_when_timestamp) : bisect_left(
+                    events, end_ts, key=_entry_when_timestamp
+                )
+            ]
+            if len(entry.events) > LOGBOOK_CACHE_MAX_EVENTS:
+                entry.too_large = True
+                entry.events = []
+
+        if not processor.timestamp:
+            events = [
+                {
+                    **event,
+                    LOGBOOK_ENTRY_WHEN: _timestamp_to_isoformat(
+                        event[LOGBOOK_ENTRY_WHEN]
+                    ),
+                }
+                for event in events
+            ]
+        if end_ts > cached_end_ts:
+            events.extend(
+                processor.get_events_from_database(
+                    dt_util.utc_from_timestamp(cached_end_ts), end_day
+                )
+            )
+        return events
+
+    def _extend_entry(self, entry: _LogbookCacheEntry, end_ts: float) -> None:
+        """Add the events up to and including end_ts to an entry.
+
+        The lock of the entry must be held.
+        """
+        processor = entry.processor
+        events = processor.get_events_from_database(
+            dt_util.utc_from_timestamp(entry.end_ts),
+            dt_util.utc_from_timestamp(end_ts + _CACHE_END_OVERLAP_SECONDS),
+        )
+        del events[bisect_right(events, end_ts, key=_entry_when_timestamp) :]
+        # Every selection also selects the rows of the contexts of its events,
+        # so the rows kept to look up contexts are not needed afterwards
+        processor.logbook_run.context_lookup.clear()
+        processor.logbook_run.event_cache.clear()
+        entry.events.extend(events)
+        entry.end_ts = end_ts
+
+
 def _humanify(
     rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result,
     ent_reg: er.EntityRegistry,
@@ -389,6 +552,16 @@ def _row_time_fired_timestamp(row: Row | EventAsRow) -> float:
     return row.time_fired_ts or process_datetime_to_timestamp(dt_util.utcnow())
 
 
+def _entry_when_timestamp(event: dict[str, Any]) -> float:
+    """Return the timestamp of a cached logbook entry."""
+    return event[LOGBOOK_ENTRY_WHEN]  # type: ignore[no-any-return]
+
+
+def _timestamp_to_isoformat(timestamp: float) -> str:
+    """Convert the timestamp of a cached logbook entry to isoformat."""
+    return process_timestamp_to_utc_isoformat(dt_util.utc_from_timestamp(timestamp))
+
+
 class EntityNameCache:
     """A cache to lookup the name for an entity.
 
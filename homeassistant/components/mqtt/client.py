@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
 from functools import lru_cache
 from itertools import chain, groupby
 import logging
@@ -93,6 +94,8 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+MAX_MESSAGES_PER_BATCH = 500
 
 MQTT_ENTRIES_NAMING_BLOG_URL = (
     "https://developers.home-assistant.io/blog/2023-057-21-change-naming-mqtt-entities/"
@@ -217,7 +220,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None] = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -289,6 +291,96 @@ def _is_simple_match(topic: str) -> bool:
     return not ("+" in topic or "#" in topic)
 
 
+class _SubscriptionTrieNode:
+    """Node of the subscription trie for one topic level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Trie of wildcard subscriptions keyed by topic level.
+
+    Matching a topic only visits the branches for its levels and the
+    `+` and `#` wildcards instead of testing every subscription.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions in the trie."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription and prune the nodes left empty.
+
+        Raises KeyError or ValueError if the subscription is unknown.
+        """
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there is a subscription for a topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        levels = topic.split("/")
+        num_levels = len(levels)
+        # Wildcards do not match topics starting with $ at the first level
+        normal = not topic.startswith("$")
+        matches: list[Subscription] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            if (normal or index) and (multi := children.get("#")):
+                matches.extend(multi.subscriptions)
+            if index == num_levels:
+                matches.extend(node.subscriptions)
+                continue
+            if child := children.get(levels[index]):
+                stack.append((child, index + 1))
+            if (normal or index) and (single := children.get("+")):
+                stack.append((single, index + 1))
+        return matches
+
+
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -380,12 +472,18 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
         # which has subscribed messages.
         self._retained_topics: dict[Subscription, set[str]] = {}
+        # Messages received by the paho thread waiting to be handled
+        # in the event loop, with the monotonic time they were received
+        self._message_queue: deque[tuple[float, mqtt.MQTTMessage]] = deque()
+        self._message_drain_scheduled = False
+        self._message_queue_max_depth = 0
+        self._message_queue_max_latency = 0.0
         self.connected = False
         self._ha_started = asyncio.Event()
         self._cleanup_on_unload: list[Callable[[], None]] = []
@@ -483,8 +581,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_topic(topic)
         )
 
     async def async_publish(
@@ -580,7 +678,7 @@ class MQTT:
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -633,9 +731,7 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -805,17 +901,63 @@ class MQTT:
     def _mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are queued and handed off to the event loop in batches
+        so a burst of messages only wakes up the loop once.
+        """
+        self._message_queue.append((time.monotonic(), msg))
+        if not self._message_drain_scheduled:
+            self._message_drain_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._mqtt_handle_queued_messages)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @callback
+    def _mqtt_handle_queued_messages(self) -> None:
+        """Handle a batch of the messages queued by the paho thread.
+
+        Messages are handled in the order they were received. If more than
+        MAX_MESSAGES_PER_BATCH are queued, the rest are handled in the next
+        iteration of the event loop so other work is not starved.
+        """
+        queue = self._message_queue
+        if (depth := len(queue)) > self._message_queue_max_depth:
+            self._message_queue_max_depth = depth
+        if queue:
+            latency = time.monotonic() - queue[0][0]
+            if latency > self._message_queue_max_latency:
+                self._message_queue_max_latency = latency
+        for _ in range(min(depth, MAX_MESSAGES_PER_BATCH)):
+            msg = queue.popleft()[1]
+            # A failing subscriber must not stop the queue from being drained
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling message on %s", msg.topic)
+        if depth > MAX_MESSAGES_PER_BATCH:
+            self.hass.loop.call_soon(self._mqtt_handle_queued_messages)
+            return
+        # Clear the flag before checking the queue again so a message
+        # appended by the paho thread in the meantime is never missed
+        self._message_drain_scheduled = False
+        if queue:
+            self._message_drain_scheduled = True
+            self.hass.loop.call_soon(self._mqtt_handle_queued_messages)
+
+    @callback
+    def message_queue_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics for the queue of received messages."""
+        return {
+            "depth": len(self._message_queue),
+            "max_depth": self._message_queue_max_depth,
+            "max_latency": self._message_queue_max_latency,
+        }
+
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+        subscriptions.extend(self._wildcard_subscriptions.match(topic))
         return subscriptions
 
     @callback
@@ -960,13 +1102,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
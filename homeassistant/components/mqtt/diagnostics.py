@@ -52,6 +52,7 @@ def _async_get_diagnostics(
     data = {
         "connected": is_connected(hass),
         "mqtt_config": redacted_config,
+        "message_queue": mqtt_instance.message_queue_diagnostics(),
     }
 
     if device:
@@ -40,6 +40,10 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 KEEPALIVE_TIME = 30
 
+# An unfinished purge is stored so it is resumed after a restart
+PURGE_CURSOR_STORAGE_KEY = f"{DOMAIN}.purge"
+PURGE_CURSOR_STORAGE_VERSION = 1
+
 
 EXCLUDE_ATTRIBUTES = f"{DOMAIN}_exclude_attributes_by_domain"
 
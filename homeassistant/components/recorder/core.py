@@ -36,6 +36,7 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
@@ -54,6 +55,8 @@ from .const import (
     MAX_QUEUE_BACKLOG_MIN_VALUE,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    PURGE_CURSOR_STORAGE_KEY,
+    PURGE_CURSOR_STORAGE_VERSION,
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
@@ -78,6 +81,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -88,7 +92,7 @@ from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import PendingState, StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -215,6 +219,9 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._bulk_insert_states = False
+        self._events_since_commit = 0
+        self.commit_events_per_second: float | None = None
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -245,6 +252,11 @@ class Recorder(threading.Thread):
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
 
+        self.purge_progress: PurgeProgress | None = None
+        self._purge_cursor_store: Store[dict[str, Any]] = Store(
+            hass, PURGE_CURSOR_STORAGE_VERSION, PURGE_CURSOR_STORAGE_KEY
+        )
+
     @property
     def backlog(self) -> int:
         """Return the number of items in the recorder backlog."""
@@ -661,6 +673,8 @@ class Recorder(threading.Thread):
                 name="Recorder commit",
             )
 
+        self.hass.async_create_task(self._async_resume_purge(), "recorder resume purge")
+
         # Run nightly tasks at 4:12am
         self._nightly_listener = async_track_time_change(
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
@@ -671,6 +685,32 @@ class Recorder(threading.Thread):
             self.hass, self._async_five_minute_tasks, minute=range(0, 60, 5), second=10
         )
 
+    @callback
+    def async_save_purge_cursor(self, cursor: dict[str, Any]) -> None:
+        """Store an unfinished purge so it is resumed after a restart."""
+        self._purge_cursor_store.async_delay_save(lambda: cursor)
+
+    @callback
+    def async_remove_purge_cursor(self) -> None:
+        """Remove the stored purge once it finished."""
+        self.hass.async_create_task(
+            self._purge_cursor_store.async_remove(), "recorder remove purge cursor"
+        )
+
+    async def _async_resume_purge(self) -> None:
+        """Resume a purge which did not finish before the last shutdown."""
+        if not (cursor := await self._purge_cursor_store.async_load()) or not (
+            purge_before := dt_util.parse_datetime(cursor["purge_before"])
+        ):
+            return
+        _LOGGER.debug("Resuming purge of data before %s", purge_before)
+        repack: bool = cursor["repack"]
+        apply_filter: bool = cursor["apply_filter"]
+        self.purge_progress = PurgeProgress(
+            purge_before, repack, apply_filter, cursor_saved=True
+        )
+        self.queue_task(PurgeTask(purge_before, repack, apply_filter))
+
     async def _async_wait_for_started(self) -> object | None:
         """Wait for the hass started future."""
         return await self._hass_started
@@ -1015,6 +1055,7 @@ class Recorder(threading.Thread):
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
+        self._events_since_commit += 1
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
@@ -1072,7 +1113,13 @@ class Recorder(threading.Thread):
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
+        dbstate: States | PendingState
+        # The bulk insert path only writes the current schema so it waits
+        # until the entity_id migration to the states_meta table is done
+        if self._bulk_insert_states and states_meta_manager.active:
+            dbstate = PendingState(event)
+        else:
+            dbstate = States.from_event(event)
 
         states_manager = self.states_manager
         if old_state := states_manager.pop_pending(entity_id):
@@ -1136,6 +1183,10 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
+        if isinstance(dbstate, PendingState):
+            self._event_session_has_pending_writes = True
+            states_manager.add_bulk_pending(dbstate)
+            return
         self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
@@ -1175,8 +1226,14 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        start = time.monotonic()
+        self.states_manager.write_bulk_pending(session)
         session.commit()
         self._event_session_has_pending_writes = False
+        # Track how many events per second the database writes can keep up with
+        if elapsed := time.monotonic() - start:
+            self.commit_events_per_second = self._events_since_commit / elapsed
+        self._events_since_commit = 0
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1395,6 +1452,12 @@ class Recorder(threading.Thread):
 
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
+        # Write states with executemany inserts when the dialect can
+        # return the new primary keys in order, otherwise fall back
+        # to the ORM unit of work which can link old_state_id for us
+        self._bulk_insert_states = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
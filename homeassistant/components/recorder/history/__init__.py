@@ -1,8 +1,9 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import Generator, MutableMapping
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -16,6 +17,7 @@ from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_batches as _modern_get_significant_states_batches,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -27,6 +29,7 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_batches",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +118,52 @@ def get_significant_states(
     )
 
 
+def get_significant_states_batches(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    batch_size: int,
+) -> Generator[tuple[str, list[State | dict[str, Any]]], None, None]:
+    """Yield (entity_id, states) batches of significant states during a time period."""
+    if recorder.get_instance(hass).states_meta_manager.active:
+        yield from _modern_get_significant_states_batches(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            batch_size,
+        )
+        return
+    # The legacy schema has no streaming path, fall back to
+    # fetching all states at once and split them afterwards
+    for entity_id, states in get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    ).items():
+        states_iter = iter(states)
+        while batch := list(islice(states_iter, batch_size)):
+            yield entity_id, batch
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1,9 +1,9 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from collections.abc import Callable, Generator, Iterable, Iterator, MutableMapping
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby, islice
 from operator import itemgetter
 from typing import Any, cast
 
@@ -211,6 +211,97 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = query
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_batches(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    batch_size: int,
+) -> Generator[tuple[str, list[State | dict[str, Any]]], None, None]:
+    """Yield significant states as they are read from the database.
+
+    States are yielded as (entity_id, states) batches of at most
+    batch_size states. The batches of an entity are yielded one after
+    another in last_updated order, so the caller never has to hold the
+    full history in memory.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                stream=True,
+            )
+        ):
+            return
+        rows, start_time_ts, entity_id_to_metadata_id = query
+        yield from _sorted_states_to_entity_batches(
+            rows,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes,
+            batch_size,
+        )
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    stream: bool = False,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Execute the significant states query.
+
+    Returns the rows, the start time to use for the start time states and the
+    metadata ids of the entities, or None if none of the entities have states.
+    If stream is set, the rows are read from the database as they are consumed.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +310,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,14 +348,12 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    return (
+        execute_stmt_lambda_element(
+            session, stmt, None, end_time, orm_rows=False, stream=stream
+        ),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -648,6 +737,47 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
+    # Set all entity IDs to empty lists in result set to maintain the order
+    result: dict[str, list[State | dict[str, Any]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    for entity_id, ent_results in _sorted_states_to_entity_batches(
+        states,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+    ):
+        result[entity_id].extend(ent_results)
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_entity_batches(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+    batch_size: int | None = None,
+) -> Generator[tuple[str, list[State | dict[str, Any]]], None, None]:
+    """Convert SQL results into (entity_id, states) batches.
+
+    States must be sorted by entity_id and last_updated
+
+    Each entity is yielded as a single batch unless batch_size is given, in
+    which case the states of an entity are split into consecutive batches
+    of at most batch_size states.
+    """
     field_map = _FIELD_MAP
     state_class: Callable[
         [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
@@ -662,10 +792,6 @@ def _sorted_states_to_dict(
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
-    # Set all entity IDs to empty lists in result set to maintain the order
-    result: dict[str, list[State | dict[str, Any]]] = {
-        entity_id: [] for entity_id in entity_ids
-    }
     metadata_id_to_entity_id: dict[int, str] = {}
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
@@ -683,17 +809,18 @@ def _sorted_states_to_dict(
 
     state_idx = field_map["state"]
     last_updated_ts_idx = field_map["last_updated_ts"]
+    _utc_from_timestamp = dt_util.utc_from_timestamp
 
     # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
+        ent_states: Iterator[State | dict[str, Any]]
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
-            ent_results.extend(
+            ent_states = (
                 state_class(
                     db_state,
                     attr_cache,
@@ -705,62 +832,61 @@ def _sorted_states_to_dict(
                 )
                 for db_state in group
             )
-            continue
-
-        prev_state: str | None = None
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
+        else:
+            # With minimal response we only provide a native
+            # State for the first and last response. All the states
+            # in-between only provide the "state" and the
+            # "last_changed".
             if (first_state := next(group, None)) is None:
                 continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
-                )
+            prev_state: str | None = first_state[state_idx]
+            first = state_class(
+                first_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                prev_state,  # type: ignore[arg-type]
+                first_state[last_updated_ts_idx],
+                no_attributes,
             )
+            #
+            # minimal_response only makes sense with last_updated == last_updated
+            #
+            # We use last_updated for for last_changed since its the same
+            #
+            # With minimal response we do not care about attribute
+            # changes so we can filter out duplicate states
+            if compressed_state_format:
+                # Compressed state format uses the timestamp directly
+                ent_states = chain(
+                    (first,),
+                    (
+                        {
+                            attr_state: (prev_state := state),
+                            attr_time: row[last_updated_ts_idx],
+                        }
+                        for row in group
+                        if (state := row[state_idx]) != prev_state
+                    ),
+                )
+            else:
+                # Non-compressed state format returns an ISO formatted string
+                ent_states = chain(
+                    (first,),
+                    (
+                        {
+                            attr_state: (prev_state := state),  # noqa: F841
+                            attr_time: _utc_from_timestamp(
+                                row[last_updated_ts_idx]
+                            ).isoformat(),
+                        }
+                        for row in group
+                        if (state := row[state_idx]) != prev_state
+                    ),
+                )
 
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: row[last_updated_ts_idx],
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
-            )
+        if batch_size is None:
+            yield entity_id, list(ent_states)
             continue
-
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            {
-                attr_state: (prev_state := state),  # noqa: F841
-                attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
-            }
-            for row in group
-            if (state := row[state_idx]) != prev_state
-        )
-
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+        while batch := list(islice(ent_states, batch_size)):
+            yield entity_id, batch
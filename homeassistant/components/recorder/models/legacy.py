@@ -246,6 +246,12 @@ class LegacyLazyState(State):
         """Set last updated datetime."""
         self._last_updated_ts = process_timestamp(value).timestamp()
 
+    @property
+    def last_updated_timestamp(self) -> float:
+        """Last updated timestamp."""
+        assert self._last_updated_ts is not None
+        return self._last_updated_ts
+
     def as_dict(self) -> dict[str, Any]:  # type: ignore[override]
         """Return a dict representation of the LazyState.
 
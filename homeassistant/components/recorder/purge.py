@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -53,6 +54,82 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The time a single purge run may hold the recorder thread before the
+# next run is made smaller, live events are written between runs
+PURGE_RUN_TIME_BUDGET = 1.0
+# Purge runs are as small as possible while the backlog is above this
+PURGE_BACKLOG_PERCENTAGE = 50
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge which is split over several purge runs."""
+
+    purge_before: datetime
+    repack: bool
+    apply_filter: bool
+    started: datetime = field(default_factory=dt_util.utcnow)
+    states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE
+    events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE
+    runs: int = 0
+    states_purged: int = 0
+    events_purged: int = 0
+    cursor_saved: bool = False
+
+    def merge(self, purge_before: datetime, repack: bool, apply_filter: bool) -> bool:
+        """Merge another purge into this one.
+
+        Purging the data before a later time also purges the data before an
+        earlier one, so only the purge with the latest purge_before is run
+        and it repacks and applies the filter if any of the purges asked to.
+        Returns False if the other purge is covered by this one.
+        """
+        self.repack |= repack
+        self.apply_filter |= apply_filter
+        if purge_before < self.purge_before:
+            return False
+        self.purge_before = purge_before
+        return True
+
+    def adjust_batch_sizes(self, run_time: float, backlog_high: bool) -> None:
+        """Size the next purge run to fit in the run time budget."""
+        if backlog_high:
+            self.states_batch_size = self.events_batch_size = 1
+        elif run_time > PURGE_RUN_TIME_BUDGET:
+            scale = PURGE_RUN_TIME_BUDGET / run_time
+            self.states_batch_size = max(1, int(self.states_batch_size * scale))
+            self.events_batch_size = max(1, int(self.events_batch_size * scale))
+        elif run_time < PURGE_RUN_TIME_BUDGET / 2:
+            self.states_batch_size = min(
+                DEFAULT_STATES_BATCHES_PER_PURGE, self.states_batch_size * 2
+            )
+            self.events_batch_size = min(
+                DEFAULT_EVENTS_BATCHES_PER_PURGE, self.events_batch_size * 2
+            )
+
+    def as_cursor(self) -> dict[str, Any]:
+        """Return the data needed to resume the purge after a restart."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "repack": self.repack,
+            "apply_filter": self.apply_filter,
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress of the purge."""
+        elapsed = (dt_util.utcnow() - self.started).total_seconds()
+        rows_purged = self.states_purged + self.events_purged
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "started": self.started.isoformat(),
+            "runs": self.runs,
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "rows_per_second": round(rows_purged / elapsed, 1) if elapsed else None,
+            "states_batch_size": self.states_batch_size,
+            "events_batch_size": self.events_batch_size,
+        }
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -62,6 +139,7 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
@@ -87,10 +165,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
@@ -176,6 +254,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -197,6 +276,8 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        if progress:
+            progress.states_purged += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
@@ -212,6 +293,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -229,6 +311,8 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        if progress:
+            progress.events_purged += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
@@ -1,7 +1,98 @@
 """Support managing States."""
 from __future__ import annotations
 
-from ..db_schema import States
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, State
+import homeassistant.util.dt as dt_util
+
+from ..db_schema import EVENT_ORIGIN_TO_IDX, StateAttributes, States, StatesMeta
+from ..models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+_INSERT_STATES_RETURNING_ID = insert(States).returning(
+    States.state_id, sort_by_parameter_order=True
+)
+
+
+class PendingState:
+    """A state row waiting to be written with a bulk insert.
+
+    This mirrors the attributes of States that are set when processing
+    a state_changed event, without the ORM instrumentation.
+    """
+
+    __slots__ = (
+        "state_id",
+        "entity_id",
+        "state",
+        "attributes",
+        "last_updated_ts",
+        "last_changed_ts",
+        "context_id_bin",
+        "context_user_id_bin",
+        "context_parent_id_bin",
+        "origin_idx",
+        "old_state",
+        "old_state_id",
+        "state_attributes",
+        "attributes_id",
+        "states_meta_rel",
+        "metadata_id",
+    )
+
+    def __init__(self, event: Event) -> None:
+        """Create a pending state from a state_changed event."""
+        self.state_id: int | None = None
+        self.entity_id: str | None = event.data["entity_id"]
+        self.attributes: str | None = None
+        self.context_id_bin = ulid_to_bytes_or_none(event.context.id)
+        self.context_user_id_bin = uuid_hex_to_bytes_or_none(event.context.user_id)
+        self.context_parent_id_bin = ulid_to_bytes_or_none(event.context.parent_id)
+        self.origin_idx = EVENT_ORIGIN_TO_IDX.get(event.origin)
+        self.old_state: States | PendingState | None = None
+        self.old_state_id: int | None = None
+        self.state_attributes: StateAttributes | None = None
+        self.attributes_id: int | None = None
+        self.states_meta_rel: StatesMeta | None = None
+        self.metadata_id: int | None = None
+        state: State | None = event.data.get("new_state")
+        # None state means the state was removed from the state machine
+        if state is None:
+            self.state: str | None = ""
+            self.last_updated_ts = dt_util.utc_to_timestamp(event.time_fired)
+            self.last_changed_ts: float | None = None
+            return
+        self.state = state.state
+        self.last_updated_ts = dt_util.utc_to_timestamp(state.last_updated)
+        if state.last_updated == state.last_changed:
+            self.last_changed_ts = None
+        else:
+            self.last_changed_ts = dt_util.utc_to_timestamp(state.last_changed)
+
+    def as_insert_params(self) -> dict[str, Any]:
+        """Return the insert parameters once the linked rows have ids."""
+        return {
+            "entity_id": self.entity_id,
+            "state": self.state,
+            "last_updated_ts": self.last_updated_ts,
+            "last_changed_ts": self.last_changed_ts,
+            "context_id_bin": self.context_id_bin,
+            "context_user_id_bin": self.context_user_id_bin,
+            "context_parent_id_bin": self.context_parent_id_bin,
+            "origin_idx": self.origin_idx,
+            "old_state_id": self.old_state.state_id
+            if self.old_state is not None
+            else self.old_state_id,
+            "attributes_id": self.state_attributes.attributes_id
+            if self.state_attributes is not None
+            else self.attributes_id,
+            "metadata_id": self.states_meta_rel.metadata_id
+            if self.states_meta_rel is not None
+            else self.metadata_id,
+        }
 
 
 class StatesManager:
@@ -9,10 +100,11 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, States | PendingState] = {}
         self._last_committed_id: dict[str, int] = {}
+        self._bulk_pending: list[PendingState] = []
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> States | PendingState | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -33,7 +125,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: States | PendingState) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -50,8 +142,57 @@ class StatesManager:
         recorder thread.
         """
         for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+            if db_states.state_id is not None:
+                self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._bulk_pending.clear()
+
+    def add_bulk_pending(self, state: PendingState) -> None:
+        """Add a state to write with the next bulk insert.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._bulk_pending.append(state)
+
+    def write_bulk_pending(self, session: Session) -> None:
+        """Insert the pending states with executemany inserts.
+
+        The session is flushed first so the attributes and metadata
+        rows the states link to have their ids. States that link to
+        another pending state are inserted in a following round once
+        the state_id of their old state is known, so an entity that
+        changed n times since the last commit needs n rounds.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (pending := self._bulk_pending):
+            return
+        session.flush()
+        waiting = set(pending)
+        try:
+            while pending:
+                ready: list[PendingState] = []
+                deferred: list[PendingState] = []
+                for state in pending:
+                    if state.old_state in waiting:
+                        deferred.append(state)
+                    else:
+                        ready.append(state)
+                state_ids = session.execute(
+                    _INSERT_STATES_RETURNING_ID,
+                    [state.as_insert_params() for state in ready],
+                ).scalars()
+                for state, state_id in zip(ready, state_ids, strict=True):
+                    state.state_id = state_id
+                waiting.difference_update(ready)
+                pending = deferred
+        except Exception:
+            # The transaction will be rolled back so the ids are not valid
+            for state in self._bulk_pending:
+                state.state_id = None
+            raise
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -61,6 +202,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._bulk_pending.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
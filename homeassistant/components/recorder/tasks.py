@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import Event
@@ -110,9 +111,36 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
+        progress = instance.purge_progress
+        if progress is None:
+            progress = instance.purge_progress = purge.PurgeProgress(
+                self.purge_before, self.repack, self.apply_filter
+            )
+        else:
+            cursor = progress.as_cursor()
+            merged = progress.merge(self.purge_before, self.repack, self.apply_filter)
+            if progress.cursor_saved and progress.as_cursor() != cursor:
+                instance.hass.add_job(
+                    instance.async_save_purge_cursor, progress.as_cursor()
+                )
+            if not merged:
+                # The unfinished purge of later data also purges this data,
+                # for example a resumed purge when the nightly purge is queued
+                return
+        progress.runs += 1
+        start = time.monotonic()
         if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+            instance,
+            progress.purge_before,
+            progress.repack,
+            progress.apply_filter,
+            events_batch_size=progress.events_batch_size,
+            states_batch_size=progress.states_batch_size,
+            progress=progress,
         ):
+            instance.purge_progress = None
+            if progress.cursor_saved:
+                instance.hass.add_job(instance.async_remove_purge_cursor)
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -120,9 +148,20 @@ class PurgeTask(RecorderTask):
             # tasks happen after a vacuum.
             periodic_db_cleanups(instance)
             return
-        # Schedule a new purge task if this one didn't finish
+        # Schedule a new purge task if this one didn't finish, it runs after
+        # the events which were queued while this one was running
+        # pylint: disable-next=[protected-access]
+        backlog_high = instance._reached_max_backlog_percentage(
+            purge.PURGE_BACKLOG_PERCENTAGE
+        )
+        progress.adjust_batch_sizes(time.monotonic() - start, backlog_high)
+        if not progress.cursor_saved:
+            progress.cursor_saved = True
+            instance.hass.add_job(
+                instance.async_save_purge_cursor, progress.as_cursor()
+            )
         instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
+            PurgeTask(progress.purge_before, progress.repack, progress.apply_filter)
         )
 
 
@@ -200,6 +200,7 @@ def execute_stmt_lambda_element(
     end_time: datetime | None = None,
     yield_per: int = DEFAULT_YIELD_STATES_ROWS,
     orm_rows: bool = True,
+    stream: bool = False,
 ) -> Sequence[Row] | Result:
     """Execute a StatementLambdaElement.
 
@@ -211,8 +212,13 @@ def execute_stmt_lambda_element(
     when selecting non-ranged rows (ie selecting
     specific entities) since they are usually faster
     with .all().
+
+    If stream is set, yield_per is always used so the rows
+    can be consumed without holding all of them in memory.
     """
-    use_all = not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
+    use_all = not stream and (
+        not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
+    )
     for tryno in range(RETRIES):
         try:
             if orm_rows:
@@ -9,7 +9,7 @@ from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal, InvalidOperation as DecimalInvalidOperation
 import logging
 from math import ceil, floor, isfinite, log10
-from typing import Any, Final, Self, cast, final
+from typing import TYPE_CHECKING, Any, Final, Self, cast, final
 
 from homeassistant.config_entries import ConfigEntry
 
@@ -259,14 +259,13 @@ class SensorEntity(Entity):
         """
         return self.device_class not in (None, SensorDeviceClass.ENUM)
 
-    @property
-    def device_class(self) -> SensorDeviceClass | None:
-        """Return the class of this entity."""
-        if hasattr(self, "_attr_device_class"):
-            return self._attr_device_class
-        if hasattr(self, "entity_description"):
-            return self.entity_description.device_class
-        return None
+    if TYPE_CHECKING:
+        # The device class is provided by Entity, which allows its state
+        # attributes to be memoized
+
+        @property
+        def device_class(self) -> SensorDeviceClass | None:
+            """Return the class of this entity."""
 
     @final
     @property
@@ -1,6 +1,7 @@
 """Statistics helper for sensor."""
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
 from collections.abc import Callable, Iterable, MutableMapping
 import datetime
@@ -71,6 +72,9 @@ WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -84,51 +88,81 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
-def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
-) -> float:
-    """Calculate a time weighted average.
+def _datetime_to_us(utc_dt: datetime.datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch."""
+    return (utc_dt - _EPOCH) // _ONE_MICROSECOND
+
+
+def _timestamps_to_us(timestamps: list[float]) -> list[int]:
+    """Convert timestamps to integer microseconds since the epoch.
+
+    The fractions are rounded the same way datetime.fromtimestamp does, so the
+    results match the microseconds of dt_util.utc_from_timestamp(timestamp).
+    """
+    return [
+        int(seconds) * 1_000_000 + round(fraction * 1_000_000)
+        for fraction, seconds in map(math.modf, timestamps)
+    ]
+
+
+def _time_weighted_averages_min_max(
+    entities_fstates: list[list[tuple[float, State]]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> list[tuple[float, float, float]]:
+    """Calculate the time weighted average, min and max of many entities.
+
+    The values and last_updated times of all entities are flattened into
+    arrays which are then reduced per entity. Times are handled as integer
+    microseconds, which gives the same durations as datetime arithmetic
+    without creating datetime objects for every state.
 
     The average is calculated by weighting the states by duration in seconds between
     state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
+    values = array("d")
+    times = array("q")
+    bounds = [0]
+    for fstates in entities_fstates:
+        values.extend([fstate for fstate, _ in fstates])
+        times.extend(
+            _timestamps_to_us([state.last_updated_timestamp for _, state in fstates])
+        )
+        bounds.append(len(values))
 
-    for fstate, state in fstates:
+    start_us = _datetime_to_us(start)
+    end_us = _datetime_to_us(end)
+    results: list[tuple[float, float, float]] = []
+    for lower, upper in itertools.pairwise(bounds):
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
+        period_start_us = old_time_us = max(times[lower], start_us)
+        old_fstate = values[lower]
+        accumulated = 0.0
+        for fstate, time_us in zip(values[lower + 1 : upper], times[lower + 1 : upper]):
+            time_us = max(time_us, start_us)
             # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
+            accumulated += old_fstate * ((time_us - old_time_us) / 1_000_000)
+            old_fstate = fstate
+            old_time_us = time_us
         # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    period_seconds = (end - start).total_seconds()
-    if period_seconds == 0:
-        # If the only state changed that happened was at the exact moment
-        # at the end of the period, we can't calculate a meaningful average
-        # so we return 0.0 since it represents a time duration smaller than
-        # we can measure. This probably means the precision of statistics
-        # column schema in the database is incorrect but it is actually possible
-        # to happen if the state change event fired at the exact microsecond
-        return 0.0
-    return accumulated / period_seconds
+        accumulated += old_fstate * ((end_us - old_time_us) / 1_000_000)
+
+        if (period_us := end_us - period_start_us) == 0:
+            # If the only state changed that happened was at the exact moment
+            # at the end of the period, we can't calculate a meaningful average
+            # so we return 0.0 since it represents a time duration smaller than
+            # we can measure. This probably means the precision of statistics
+            # column schema in the database is incorrect but it is actually possible
+            # to happen if the state change event fired at the exact microsecond
+            mean = 0.0
+        else:
+            mean = accumulated / (period_us / 1_000_000)
+        entity_values = values[lower:upper]
+        results.append((mean, min(entity_values), max(entity_values)))
+
+    return results
 
 
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
@@ -486,12 +520,8 @@ def _compile_statistics(  # noqa: C901
     last_stats = statistics.get_latest_short_term_statistics(
         hass, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
-    for (  # pylint: disable=too-many-nested-blocks
-        entity_id,
-        statistics_unit,
-        state_class,
-        valid_float_states,
-    ) in to_process:
+    to_compile: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    for entity_id, statistics_unit, state_class, valid_float_states in to_process:
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
             if not _equivalent_units(
@@ -516,7 +546,26 @@ def _compile_statistics(  # noqa: C901
                         LINK_DEV_STATISTICS,
                     )
                 continue
+        to_compile.append((entity_id, statistics_unit, state_class, valid_float_states))
+
+    # Calculate mean, min and max for all entities which want them in one batch
+    entities_mean_min_max = [
+        valid_float_states
+        for entity_id, _, _, valid_float_states in to_compile
+        if "mean" in wanted_statistics[entity_id]
+        or "min" in wanted_statistics[entity_id]
+        or "max" in wanted_statistics[entity_id]
+    ]
+    mean_min_max = iter(
+        _time_weighted_averages_min_max(entities_mean_min_max, start, end)
+    )
 
+    for (  # pylint: disable=too-many-nested-blocks
+        entity_id,
+        statistics_unit,
+        state_class,
+        valid_float_states,
+    ) in to_compile:
         # Set meta data
         meta: StatisticMetaData = {
             "has_mean": "mean" in wanted_statistics[entity_id],
@@ -529,23 +578,15 @@ def _compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
-                )
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
-                )
-            )
-
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+        wanted = wanted_statistics[entity_id]
+        if "mean" in wanted or "min" in wanted or "max" in wanted:
+            mean, min_, max_ = next(mean_min_max)
+            if "max" in wanted:
+                stat["max"] = max_
+            if "min" in wanted:
+                stat["min"] = min_
+            if "mean" in wanted:
+                stat["mean"] = mean
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
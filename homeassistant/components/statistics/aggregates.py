@@ -0,0 +1,369 @@
+"""Aggregates maintained incrementally over the samples of a statistics sensor."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+# Finite floats are multiples of the smallest subnormal float, 2**-1074, so
+# they can be summed exactly as integers scaled by 2**1074.
+_SCALE_BITS = 1074
+# Bit width used to round square roots of fractions correctly, see
+# _float_sqrt_of_frac in the statistics module.
+_SQRT_BIT_WIDTH = 2 * 53 + 3
+
+
+def _scaled(value: float) -> int:
+    """Return a finite float as an integer scaled by 2**1074."""
+    numerator, denominator = value.as_integer_ratio()
+    return numerator << (_SCALE_BITS - denominator.bit_length() + 1)
+
+
+def _float_of_frac(numerator: int, denominator: int) -> float:
+    """Return numerator / denominator as a float, correctly rounded."""
+    try:
+        return numerator / denominator
+    except OverflowError:
+        return math.inf if numerator > 0 else -math.inf
+
+
+def _float_sqrt_of_frac(numerator: int, denominator: int) -> float:
+    """Return the square root of numerator / denominator, correctly rounded."""
+    # Round to odd with extra bits of precision before rounding to a float,
+    # which gives the same result as statistics.stdev.
+    shift = (numerator.bit_length() - denominator.bit_length() - _SQRT_BIT_WIDTH) // 2
+    if shift >= 0:
+        denominator <<= 2 * shift
+        divisor = 1
+    else:
+        numerator <<= -2 * shift
+        divisor = 1 << -shift
+    root = math.isqrt(numerator // denominator)
+    root |= root * root * denominator != numerator
+    if shift >= 0:
+        root <<= shift
+    return _float_of_frac(root, divisor)
+
+
+class ExactSum:
+    """Exact running sum of floats.
+
+    Non-finite values can not be summed exactly. They are only counted, and
+    the sum is not a number or infinite while any of them are included.
+    """
+
+    __slots__ = (
+        "total",
+        "total_of_squares",
+        "nan",
+        "positive_infinite",
+        "negative_infinite",
+        "_squares",
+    )
+
+    def __init__(self, squares: bool = False) -> None:
+        """Initialize the sum."""
+        self.total = 0
+        self.total_of_squares = 0
+        self.nan = 0
+        self.positive_infinite = 0
+        self.negative_infinite = 0
+        self._squares = squares
+
+    @property
+    def exact(self) -> bool:
+        """Return if only finite values are included in the sum."""
+        return not (self.nan or self.positive_infinite or self.negative_infinite)
+
+    def _count_non_finite(self, value: float, increment: int) -> None:
+        """Count a value which is not finite."""
+        if math.isnan(value):
+            self.nan += increment
+        elif value > 0:
+            self.positive_infinite += increment
+        else:
+            self.negative_infinite += increment
+
+    def add(self, value: float) -> None:
+        """Add a value to the sum."""
+        if not math.isfinite(value):
+            self._count_non_finite(value, 1)
+            return
+        scaled = _scaled(value)
+        self.total += scaled
+        if self._squares:
+            self.total_of_squares += scaled * scaled
+
+    def remove(self, value: float) -> None:
+        """Remove a value which was added before from the sum."""
+        if not math.isfinite(value):
+            self._count_non_finite(value, -1)
+            return
+        scaled = _scaled(value)
+        self.total -= scaled
+        if self._squares:
+            self.total_of_squares -= scaled * scaled
+
+    def _non_finite_sum(self) -> float:
+        """Return the sum while values which are not finite are included."""
+        if self.nan or (self.positive_infinite and self.negative_infinite):
+            return math.nan
+        return math.inf if self.positive_infinite else -math.inf
+
+    def mean(self, count: int) -> float:
+        """Return the mean of count values, like statistics.mean."""
+        if not self.exact:
+            return self._non_finite_sum() / count
+        return _float_of_frac(self.total, count << _SCALE_BITS)
+
+    def _sum_of_square_deviations(self, count: int) -> int:
+        """Return the sum of square deviations from the mean, scaled by count."""
+        total = self.total
+        return count * self.total_of_squares - total * total
+
+    def variance(self, count: int) -> float:
+        """Return the sample variance of count values, like statistics.variance.
+
+        Only finite values may be included.
+        """
+        return _float_of_frac(
+            self._sum_of_square_deviations(count),
+            count * (count - 1) << 2 * _SCALE_BITS,
+        )
+
+    def stdev(self, count: int) -> float:
+        """Return the sample standard deviation, like statistics.stdev.
+
+        Only finite values may be included.
+        """
+        return _float_sqrt_of_frac(
+            self._sum_of_square_deviations(count),
+            count * (count - 1) << 2 * _SCALE_BITS,
+        )
+
+
+class MonotonicExtreme:
+    """The maximum or minimum of a sliding window of values.
+
+    Values which can never become the extreme are dropped when they are
+    added, so the extreme is always the first value held. Of equal values
+    the oldest one is kept first, like max and min do.
+    """
+
+    __slots__ = ("_values", "_maximum")
+
+    def __init__(self, maximum: bool) -> None:
+        """Initialize the extreme."""
+        self._values: deque[tuple[int, float]] = deque()
+        self._maximum = maximum
+
+    @property
+    def index(self) -> int:
+        """Return the index of the extreme value."""
+        return self._values[0][0]
+
+    @property
+    def value(self) -> float:
+        """Return the extreme value."""
+        return self._values[0][1]
+
+    def add(self, index: int, value: float) -> None:
+        """Add the value with the next index to the window."""
+        values = self._values
+        if self._maximum:
+            while values and values[-1][1] < value:
+                values.pop()
+        else:
+            while values and values[-1][1] > value:
+                values.pop()
+        values.append((index, value))
+
+    def remove(self, index: int) -> None:
+        """Remove the value with the oldest index from the window."""
+        values = self._values
+        if values and values[0][0] == index:
+            values.popleft()
+
+
+class SortedValues:
+    """The values of a sliding window kept in sorted order."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self) -> None:
+        """Initialize the sorted values."""
+        self._values: list[float] = []
+
+    def add(self, value: float) -> None:
+        """Add a value."""
+        insort(self._values, value)
+
+    def remove(self, value: float) -> None:
+        """Remove a value which was added before."""
+        values = self._values
+        del values[bisect_left(values, value)]
+
+    def median(self) -> float:
+        """Return the median, like statistics.median."""
+        values = self._values
+        count = len(values)
+        if count % 2 == 1:
+            return values[count // 2]
+        middle = count // 2
+        return (values[middle - 1] + values[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile, like statistics.quantiles with n=100.
+
+        The exclusive method is used, and at least two values are required.
+        """
+        values = self._values
+        count = len(values)
+        scaled = percentile * (count + 1)
+        index = min(max(scaled // 100, 1), count - 1)
+        delta = scaled - index * 100
+        return (values[index - 1] * (100 - delta) + values[index] * delta) / 100
+
+
+class SampleWindow:
+    """The samples of a statistics sensor with aggregates maintained over them.
+
+    The aggregates are updated when samples enter or leave the window, so
+    characteristics do not need to go through all samples on every update.
+    Only the aggregates which are asked for are maintained.
+
+    For the sums over consecutive samples, the terms of each pair of samples
+    are kept, the differences between the samples and the areas under the
+    samples over time. They are summed in order when asked for, so the sums
+    are rounded the same as adding the terms one by one. The area of a
+    binary window is the number of seconds the samples were on.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None,
+        *,
+        is_binary: bool = False,
+        values: bool = False,
+        squares: bool = False,
+        extremes: bool = False,
+        ordered: bool = False,
+        differences: bool = False,
+        areas: bool = False,
+    ) -> None:
+        """Initialize the window."""
+        self.states: deque[float | bool] = deque(maxlen=max_size)
+        self.ages: deque[datetime] = deque(maxlen=max_size)
+        self._max_size = max_size
+        self._is_binary = is_binary
+        self._values = values or squares
+        self._extremes = extremes
+        self._ordered = ordered
+        self._differences = differences
+        self._areas = areas
+        self._next_index = 0
+
+        self.on_count = 0
+        # Samples which are not a number are left out of the extremes and the
+        # sorted values, which must not be used while there are any
+        self.nan_count = 0
+        self.values = ExactSum(squares)
+        self.maximum = MonotonicExtreme(True)
+        self.minimum = MonotonicExtreme(False)
+        self.sorted_values = SortedValues()
+        self.differences: deque[float] = deque()
+        self.nonnegative_differences: deque[float] = deque()
+        self.linear_area: deque[float] = deque()
+        self.step_area: deque[float] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def age_of_index(self, index: int) -> datetime:
+        """Return the age of the sample with an index."""
+        return self.ages[index - self._next_index + len(self.states)]
+
+    def append(self, state: float | bool, age: datetime) -> None:
+        """Add a sample to the window, removing the oldest if it is full."""
+        if len(self.states) == self._max_size:
+            self.popleft()
+        if self.states:
+            self._add_pair(self.states[-1], self.ages[-1], state, age)
+        self._add_value(self._next_index, state)
+        self._next_index += 1
+        self.states.append(state)
+        self.ages.append(age)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample from the window."""
+        state = self.states.popleft()
+        self.ages.popleft()
+        self._remove_value(self._next_index - len(self.states) - 1, state)
+        if self.states:
+            self._remove_pair()
+
+    def _add_value(self, index: int, state: float | bool) -> None:
+        """Add a sample to the aggregates of values."""
+        if self._is_binary:
+            self.on_count += state is True
+            return
+        if self._values:
+            self.values.add(state)
+        if math.isnan(state):
+            self.nan_count += 1
+            return
+        if self._extremes:
+            self.maximum.add(index, state)
+            self.minimum.add(index, state)
+        if self._ordered:
+            self.sorted_values.add(state)
+
+    def _remove_value(self, index: int, state: float | bool) -> None:
+        """Remove a sample from the aggregates of values."""
+        if self._is_binary:
+            self.on_count -= state is True
+            return
+        if self._values:
+            self.values.remove(state)
+        if math.isnan(state):
+            self.nan_count -= 1
+            return
+        if self._extremes:
+            self.maximum.remove(index)
+            self.minimum.remove(index)
+        if self._ordered:
+            self.sorted_values.remove(state)
+
+    def _add_pair(
+        self,
+        previous_state: float | bool,
+        previous_age: datetime,
+        state: float | bool,
+        age: datetime,
+    ) -> None:
+        """Add the terms of the newest pair of consecutive samples."""
+        if self._differences:
+            self.differences.append(abs(state - previous_state))
+            self.nonnegative_differences.append(
+                state - previous_state if state >= previous_state else state - 0
+            )
+        if self._areas:
+            seconds = (age - previous_age).total_seconds()
+            if self._is_binary:
+                self.step_area.append(seconds if previous_state is True else 0)
+                return
+            self.step_area.append(previous_state * seconds)
+            self.linear_area.append(0.5 * (state + previous_state) * seconds)
+
+    def _remove_pair(self) -> None:
+        """Remove the terms of the oldest pair of consecutive samples."""
+        for terms in (
+            self.differences,
+            self.nonnegative_differences,
+            self.linear_area,
+            self.step_area,
+        ):
+            if terms:
+                terms.popleft()
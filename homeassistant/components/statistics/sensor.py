@@ -1,7 +1,6 @@
 """Support for statistics for sensor values."""
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
@@ -56,6 +55,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .aggregates import SampleWindow
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -179,6 +179,38 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Statistics which are computed from aggregates maintained over the samples
+STATS_AGGREGATE_VALUES = {
+    STAT_AVERAGE_TIMELESS,
+    STAT_MEAN,
+}
+STATS_AGGREGATE_SQUARES = {
+    STAT_DISTANCE_95P,
+    STAT_DISTANCE_99P,
+    STAT_STANDARD_DEVIATION,
+    STAT_VARIANCE,
+}
+STATS_AGGREGATE_EXTREMES = {
+    STAT_DATETIME_VALUE_MAX,
+    STAT_DATETIME_VALUE_MIN,
+    STAT_DISTANCE_ABSOLUTE,
+    STAT_VALUE_MAX,
+    STAT_VALUE_MIN,
+}
+STATS_AGGREGATE_ORDERED = {
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+}
+STATS_AGGREGATE_DIFFERENCES = {
+    STAT_NOISINESS,
+    STAT_SUM_DIFFERENCES,
+    STAT_SUM_DIFFERENCES_NONNEGATIVE,
+}
+STATS_AGGREGATE_AREAS = {
+    STAT_AVERAGE_LINEAR,
+    STAT_AVERAGE_STEP,
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -299,8 +331,18 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement: str | None = None
         self._available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self._window = SampleWindow(
+            self._samples_max_buffer_size,
+            is_binary=self.is_binary,
+            values=state_characteristic in STATS_AGGREGATE_VALUES,
+            squares=state_characteristic in STATS_AGGREGATE_SQUARES,
+            extremes=state_characteristic in STATS_AGGREGATE_EXTREMES,
+            ordered=state_characteristic in STATS_AGGREGATE_ORDERED,
+            differences=state_characteristic in STATS_AGGREGATE_DIFFERENCES,
+            areas=state_characteristic in STATS_AGGREGATE_AREAS,
+        )
+        self.states = self._window.states
+        self.ages = self._window.ages
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[
@@ -352,10 +394,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._window.append(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                self._window.append(float(new_state.state), new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -463,8 +504,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._window.popleft()
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
@@ -596,12 +636,8 @@ class StatisticsSensor(SensorEntity):
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
             area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            for term in self._window.linear_area:
+                area += term
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
@@ -609,11 +645,8 @@ class StatisticsSensor(SensorEntity):
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
             area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            for term in self._window.step_area:
+                area += term
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
@@ -653,12 +686,16 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            if self._window.nan_count:
+                return self.ages[self.states.index(max(self.states))]
+            return self._window.age_of_index(self._window.maximum.index)
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            if self._window.nan_count:
+                return self.ages[self.states.index(min(self.states))]
+            return self._window.age_of_index(self._window.minimum.index)
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -673,17 +710,21 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            if self._window.nan_count:
+                return max(self.states) - min(self.states)
+            return self._window.maximum.value - self._window.minimum.value
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self._window.values.mean(len(self.states))
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            if self._window.nan_count:
+                return statistics.median(self.states)
+            return self._window.sorted_values.median()
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -693,13 +734,19 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            if self._window.nan_count:
+                percentiles = statistics.quantiles(
+                    self.states, n=100, method="exclusive"
+                )
+                return percentiles[self._percentile - 1]
+            return self._window.sorted_values.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            if not self._window.values.exact:
+                return statistics.stdev(self.states)
+            return self._window.values.stdev(len(self.states))
         return None
 
     def _stat_sum(self) -> StateType:
@@ -709,19 +756,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum = sum(
-                abs(j - i) for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum
+            return sum(self._window.differences)
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum_nn = sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum_nn
+            return sum(self._window.nonnegative_differences)
         return None
 
     def _stat_total(self) -> StateType:
@@ -729,17 +769,23 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            if self._window.nan_count:
+                return max(self.states)
+            return self._window.maximum.value
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            if self._window.nan_count:
+                return min(self.states)
+            return self._window.minimum.value
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            if not self._window.values.exact:
+                return statistics.variance(self.states)
+            return self._window.values.variance(len(self.states))
         return None
 
     # Statistics for binary sensor
@@ -747,9 +793,8 @@ class StatisticsSensor(SensorEntity):
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
             on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
+            for term in self._window.step_area:
+                on_seconds += term
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return 100 / age_range_seconds * on_seconds
         return None
@@ -761,10 +806,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return self._window.on_count
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - self._window.on_count
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -774,5 +819,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * self._window.on_count
         return None
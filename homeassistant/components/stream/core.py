@@ -76,8 +76,9 @@ class Part:
 
     duration: float = attr.ib()
     has_keyframe: bool = attr.ib()
-    # video data (moof+mdat)
-    data: bytes = attr.ib()
+    # video data (moof+mdat), a view into the data of the segment once the
+    # segment is complete
+    data: bytes | memoryview = attr.ib()
 
 
 @attr.s(slots=True)
@@ -101,6 +102,8 @@ class Segment:
     hls_num_parts_rendered: int = attr.ib(default=0)
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = attr.ib(default=False)
+    # init and the data of all parts, joined once the segment is complete
+    _data_with_init: bytes | None = attr.ib(default=None, init=False)
 
     def __attrs_post_init__(self) -> None:
         """Run after init."""
@@ -134,12 +137,38 @@ class Segment:
         """
         self.parts.append(part)
         self.duration = duration
+        if duration:
+            self._join_data()
         for output in self._stream_outputs:
             output.part_put()
 
-    def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+    def _join_data(self) -> None:
+        """Join the init and parts of a complete segment into a single buffer.
+
+        The data of the parts is replaced by views into the buffer, so the
+        segment and its parts are served without copying them again.
+        """
+        self._data_with_init = b"".join(
+            [self.init, *(part.data for part in self.parts)]
+        )
+        view = memoryview(self._data_with_init)
+        offset = len(self.init)
+        for part in self.parts:
+            end = offset + len(part.data)
+            part.data = view[offset:end]
+            offset = end
+
+    def get_data(self) -> bytes | memoryview:
+        """Return reconstructed data for all parts, without init."""
+        if self._data_with_init is None:
+            return b"".join([part.data for part in self.parts])
+        return memoryview(self._data_with_init)[len(self.init) :]
+
+    def get_data_with_init(self) -> bytes:
+        """Return reconstructed data for all parts, with init."""
+        if self._data_with_init is None:
+            return b"".join([self.init, *(part.data for part in self.parts)])
+        return self._data_with_init
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
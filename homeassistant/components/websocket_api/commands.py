@@ -47,7 +47,11 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
+    async_get_loaded_integrations,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -93,7 +97,7 @@ def pong_message(iden: int) -> dict[str, Any]:
 
 
 def _forward_events_check_permissions(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+    send_message: Callable[[str | dict[str, Any] | messages.StateChangedMessage], None],
     user: User,
     msg_id: int,
     event: Event,
@@ -106,7 +110,7 @@ def _forward_events_check_permissions(
         POLICY_READ
     ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
         return
-    send_message(messages.cached_event_message(msg_id, event))
+    send_message(messages.StateChangedMessage(msg_id, event, False))
 
 
 def _forward_events_unconditional(
@@ -303,7 +307,7 @@ def _send_handle_get_states_response(
 
 
 def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+    send_message: Callable[[str | dict[str, Any] | messages.StateChangedMessage], None],
     entity_ids: set[str],
     user: User,
     msg_id: int,
@@ -320,7 +324,7 @@ def _forward_entity_changes(
         POLICY_READ
     ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
         return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    send_message(messages.StateChangedMessage(msg_id, event, True))
 
 
 @callback
@@ -472,10 +476,15 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    timeline: dict[str, dict[str, Any]] = hass.data.get(DATA_SETUP_TIMELINE, {})
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
+            {
+                "domain": integration,
+                "seconds": timedelta.total_seconds(),
+                **timeline.get(integration, {}),
+            }
             for integration, timedelta in cast(
                 dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
             ).items()
@@ -25,6 +25,9 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Number of pending messages after which state changes are conflated
+# per entity for connections which support it.
+CONFLATE_MSG_THRESHOLD: Final = 256
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -49,3 +52,4 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_CONFLATE_MESSAGES = "conflate_messages"
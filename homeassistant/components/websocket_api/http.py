@@ -19,6 +19,7 @@ from homeassistant.util.json import json_loads
 
 from .auth import AuthPhase, auth_required_message
 from .const import (
+    CONFLATE_MSG_THRESHOLD,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
@@ -28,7 +29,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import StateChangedMessage, message_to_json
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -74,6 +75,9 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_conflated_messages",
+        "_conflated_count",
+        "_queue_depth_peak",
         "_ready_future",
     )
 
@@ -94,8 +98,13 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[str | tuple[int, str] | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # State changes which are merged per subscription and entity while
+        # the client is falling behind. The message queue holds their keys.
+        self._conflated_messages: dict[tuple[int, str], StateChangedMessage] = {}
+        self._conflated_count = 0
+        self._queue_depth_peak = 0
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -119,6 +128,7 @@ class WebSocketHandler:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
+        conflated_messages = self._conflated_messages
         logger = self._logger
         wsock = self._wsock
         send_str = wsock.send_str
@@ -137,6 +147,8 @@ class WebSocketHandler:
                 # A None message is used to signal the end of the connection
                 if (message := message_queue.popleft()) is None:
                     return
+                if isinstance(message, tuple):
+                    message = conflated_messages.pop(message).as_json()
 
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
@@ -156,6 +168,8 @@ class WebSocketHandler:
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
                         return
+                    if isinstance(message, tuple):
+                        message = conflated_messages.pop(message).as_json()
                     messages.append(message)
                     messages_remaining -= 1
 
@@ -182,11 +196,16 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | dict[str, Any] | StateChangedMessage
+    ) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
 
+        State changes are conflated per entity instead when the client
+        supports it, which bounds the queue by the number of entities.
+
         Async friendly.
         """
         if self._closing:
@@ -194,11 +213,38 @@ class WebSocketHandler:
             # max pending messages.
             return
 
-        if isinstance(message, dict):
+        message_queue = self._message_queue
+        conflated_messages = self._conflated_messages
+        # Conflated messages are bounded by the number of entities
+        # so they do not count towards the pending messages
+        queue_size_before_add = len(message_queue) - len(conflated_messages)
+
+        if isinstance(message, StateChangedMessage):
+            key = message.key
+            if (pending_message := conflated_messages.get(key)) is not None:
+                pending_message.conflate(message)
+                self._conflated_count += 1
+                return
+            if (
+                queue_size_before_add < CONFLATE_MSG_THRESHOLD
+                or not (connection := self._connection)
+                or not connection.can_conflate
+            ):
+                message = message.as_json()
+            else:
+                if not conflated_messages:
+                    self._logger.debug(
+                        "%s: Client is falling behind with %s pending messages;"
+                        " conflating state changes",
+                        self.description,
+                        queue_size_before_add,
+                    )
+                conflated_messages[key] = message
+                self._queue_message(key)
+                return
+        elif isinstance(message, dict):
             message = message_to_json(message)
 
-        message_queue = self._message_queue
-        queue_size_before_add = len(message_queue)
         if queue_size_before_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
@@ -213,10 +259,7 @@ class WebSocketHandler:
             self._cancel()
             return
 
-        message_queue.append(message)
-        ready_future = self._ready_future
-        if ready_future and not ready_future.done():
-            ready_future.set_result(None)
+        self._queue_message(message)
 
         peak_checker_active = self._peak_checker_unsub is not None
 
@@ -230,12 +273,23 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _queue_message(self, message: str | tuple[int, str]) -> None:
+        """Queue a message or the key of a conflated message for the writer."""
+        message_queue = self._message_queue
+        message_queue.append(message)
+        if (queue_depth := len(message_queue)) > self._queue_depth_peak:
+            self._queue_depth_peak = queue_depth
+        ready_future = self._ready_future
+        if ready_future and not ready_future.done():
+            ready_future.set_result(None)
+
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
         self._peak_checker_unsub = None
 
-        if len(self._message_queue) < PENDING_MSG_PEAK:
+        if len(self._message_queue) - len(self._conflated_messages) < PENDING_MSG_PEAK:
             return
 
         self._logger.error(
@@ -439,6 +493,12 @@ class WebSocketHandler:
                     # Make sure all error messages are written before closing
                     await wsock.close()
                 finally:
+                    debug(
+                        "%s: Peak queue depth was %s with %s conflated messages",
+                        self.description,
+                        self._queue_depth_peak,
+                        self._conflated_count,
+                    )
                     if disconnect_warn is None:
                         debug("%s: Disconnected", self.description)
                     else:
@@ -458,6 +518,7 @@ class WebSocketHandler:
                     self._hass = None  # type: ignore[assignment]
                     self._logger = None  # type: ignore[assignment]
                     self._message_queue = None  # type: ignore[assignment]
+                    self._conflated_messages = None  # type: ignore[assignment]
                     self._handle_task = None
                     self._writer_task = None
                     self._ready_future = None
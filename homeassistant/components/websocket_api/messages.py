@@ -121,6 +121,57 @@ def _cached_state_diff_message(event: Event) -> str:
     )
 
 
+class StateChangedMessage:
+    """A state changed event message which can be conflated.
+
+    When a client falls behind, the pending message for an entity is
+    merged with the later state changes of the entity. The merged
+    message goes from the state the client last received straight
+    to the latest state.
+    """
+
+    __slots__ = ("iden", "event", "old_state", "state_diff", "conflated")
+
+    def __init__(self, iden: int, event: Event, state_diff: bool) -> None:
+        """Initialize the message."""
+        self.iden = iden
+        self.event = event
+        self.old_state: State | None = event.data["old_state"]
+        self.state_diff = state_diff
+        self.conflated = False
+
+    @property
+    def key(self) -> tuple[int, str]:
+        """Return the key the message is conflated by."""
+        return (self.iden, self.event.data["entity_id"])
+
+    def conflate(self, message: StateChangedMessage) -> None:
+        """Merge a later message for the same entity into this message."""
+        self.event = message.event
+        self.conflated = True
+
+    def as_json(self) -> str:
+        """Serialize the message to json."""
+        event = self.event
+        if not self.conflated:
+            if self.state_diff:
+                return cached_state_diff_message(self.iden, event)
+            return cached_event_message(self.iden, event)
+        merged_event = Event(
+            event.event_type,
+            {**event.data, "old_state": self.old_state},
+            event.origin,
+            event.time_fired,
+            event.context,
+        )
+        return message_to_json(
+            event_message(
+                self.iden,
+                _state_diff_event(merged_event) if self.state_diff else merged_event,
+            )
+        )
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -173,9 +224,9 @@ def _state_diff(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
+    if (old_attributes := old_state.attributes) is not (
         new_attributes := new_state.attributes
-    ):
+    ) and old_attributes != new_attributes:
         for key, value in new_attributes.items():
             if old_attributes.get(key) != value:
                 additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[key] = value
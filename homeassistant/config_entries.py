@@ -32,6 +32,7 @@ from .helpers.event import (
     async_call_later,
 )
 from .helpers.frame import report
+from .helpers.json import json_bytes, json_fragment
 from .helpers.typing import UNDEFINED, ConfigType, DiscoveryInfoType, UndefinedType
 from .setup import DATA_SETUP_DONE, async_process_deps_reqs, async_setup_component
 from .util import uuid as uuid_util
@@ -220,6 +221,7 @@ class ConfigEntry:
         "reload_lock",
         "_tasks",
         "_background_tasks",
+        "_json_fragment",
     )
 
     def __init__(
@@ -317,6 +319,49 @@ class ConfigEntry:
         self._tasks: set[asyncio.Future[Any]] = set()
         self._background_tasks: set[asyncio.Future[Any]] = set()
 
+        # Cached JSON fragment of the entry
+        self._json_fragment: json_fragment | None = None
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """Set an attribute and clear the cached JSON fragment."""
+        super().__setattr__(key, value)
+        super().__setattr__("_json_fragment", None)
+
+    @property
+    def as_json_fragment(self) -> json_fragment:
+        """Return a cached JSON fragment of the entry for the frontend.
+
+        The fragment is cleared whenever an attribute of the entry is set.
+        """
+        if self._json_fragment is not None:
+            return self._json_fragment
+
+        handler = HANDLERS.get(self.domain)
+        fragment = json_fragment(
+            json_bytes(
+                {
+                    "entry_id": self.entry_id,
+                    "domain": self.domain,
+                    "title": self.title,
+                    "source": self.source,
+                    "state": self.state.value,
+                    # work out if handler has support for options flow
+                    "supports_options": handler is not None
+                    and handler.async_supports_options_flow(self),
+                    "supports_remove_device": self.supports_remove_device or False,
+                    "supports_unload": self.supports_unload or False,
+                    "pref_disable_new_entities": self.pref_disable_new_entities,
+                    "pref_disable_polling": self.pref_disable_polling,
+                    "disabled_by": self.disabled_by,
+                    "reason": self.reason,
+                }
+            )
+        )
+        # Options flow support is unknown until the handler is loaded
+        if handler is not None:
+            super().__setattr__("_json_fragment", fragment)
+        return fragment
+
     async def async_setup(
         self,
         hass: HomeAssistant,
@@ -6,13 +6,16 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
+from collections import UserDict, defaultdict
 from collections.abc import (
     Awaitable,
     Callable,
     Collection,
     Coroutine,
     Iterable,
+    KeysView,
     Mapping,
+    ValuesView,
 )
 import concurrent.futures
 from contextlib import suppress
@@ -979,13 +982,24 @@ _FilterableJobType = tuple[
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_match_all_listeners",
+        "_dispatch",
+        "_match_all_dispatch",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Immutable snapshots of the listeners to call for an event type,
+        # rebuilt when a listener is added or removed so firing an event
+        # does not need to build or copy a list.
+        self._dispatch: dict[str, tuple[_FilterableJobType, ...]] = {}
+        self._match_all_dispatch: tuple[_FilterableJobType, ...] = ()
         self._hass = hass
 
     @callback
@@ -1031,21 +1045,23 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-        match_all_listeners = self._match_all_listeners
+        if (listeners := self._dispatch.get(event_type)) is None:
+            # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+            listeners = (
+                self._match_all_dispatch
+                if event_type != EVENT_HOMEASSISTANT_CLOSE
+                else ()
+            )
+
+        if not listeners and not _LOGGER.isEnabledFor(logging.DEBUG):
+            # Avoid creating the Event when nobody will receive it
+            return
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners and not match_all_listeners:
-            return
-
-        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
-        if event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
-
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -1119,6 +1135,7 @@ class EventBus:
         self, event_type: str, filterable_job: _FilterableJobType
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_update_dispatch(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -1213,6 +1230,34 @@ class EventBus:
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+        self._async_update_dispatch(event_type)
+
+    @callback
+    def _async_update_dispatch(self, event_type: str) -> None:
+        """Rebuild the dispatch tuples after the listeners of event_type changed.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            self._match_all_dispatch = tuple(self._match_all_listeners)
+            for listening_event_type in self._dispatch:
+                self._async_build_dispatch(listening_event_type)
+            return
+        if event_type not in self._listeners:
+            self._dispatch.pop(event_type, None)
+            return
+        self._async_build_dispatch(event_type)
+
+    @callback
+    def _async_build_dispatch(self, event_type: str) -> None:
+        """Build the dispatch tuple for an event type with listeners."""
+        listeners = self._listeners[event_type]
+        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+        if event_type == EVENT_HOMEASSISTANT_CLOSE:
+            self._dispatch[event_type] = tuple(listeners)
+        else:
+            self._dispatch[event_type] = (*self._match_all_listeners, *listeners)
 
 
 class State:
@@ -1265,7 +1310,13 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # A ReadOnlyDict can not be modified, which allows successive
+        # states with unchanged attributes to share the same mapping
+        self.attributes: ReadOnlyDict[str, Any] = (
+            attributes
+            if type(attributes) is ReadOnlyDict
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1281,6 +1332,11 @@ class State:
             "_", " "
         )
 
+    @property
+    def last_updated_timestamp(self) -> float:
+        """Last updated as a UNIX timestamp."""
+        return self.last_updated.timestamp()
+
     def as_dict(self) -> ReadOnlyDict[str, Collection[Any]]:
         """Return a dict representation of the State.
 
@@ -1411,14 +1467,59 @@ class State:
         )
 
 
+class States(UserDict[str, State]):
+    """Container for states, maps entity_id -> State.
+
+    Maintains an additional index:
+    - domain -> dict[str, State]
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+
+    def values(self) -> ValuesView[State]:
+        """Return the underlying values to avoid __iter__ overhead."""
+        return self.data.values()
+
+    def __setitem__(self, key: str, entry: State) -> None:
+        """Add an item."""
+        self.data[key] = entry
+        self._domain_index[entry.domain][entry.entity_id] = entry
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        entry = self[key]
+        del self._domain_index[entry.domain][entry.entity_id]
+        super().__delitem__(key)
+
+    def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
+        """Get all entity_ids for a domain."""
+        # Avoid polluting _domain_index with non-existing domains
+        if key not in self._domain_index:
+            return ()
+        return self._domain_index[key].keys()
+
+    def domain_states(self, key: str) -> ValuesView[State] | tuple[()]:
+        """Get all states for a domain."""
+        # Avoid polluting _domain_index with non-existing domains
+        if key not in self._domain_index:
+            return ()
+        return self._domain_index[key].values()
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_reservations", "_bus", "_loop")
+    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
-        self._states: dict[str, State] = {}
+        self._states = States()
+        # _states_data is used to access the States backing dict directly to speed
+        # up read operations
+        self._states_data = self._states.data
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1439,16 +1540,15 @@ class StateMachine:
         This method must be run in the event loop.
         """
         if domain_filter is None:
-            return list(self._states)
+            return list(self._states_data)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._states.domain_entity_ids(domain_filter.lower()))
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
-        ]
+        entity_ids: list[str] = []
+        for domain in domain_filter:
+            entity_ids.extend(self._states.domain_entity_ids(domain))
+        return entity_ids
 
     @callback
     def async_entity_ids_count(
@@ -1459,13 +1559,13 @@ class StateMachine:
         This method must be run in the event loop.
         """
         if domain_filter is None:
-            return len(self._states)
+            return len(self._states_data)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._states.domain_entity_ids(domain_filter.lower()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._states.domain_entity_ids(domain)) for domain in domain_filter
         )
 
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
@@ -1483,21 +1583,22 @@ class StateMachine:
         This method must be run in the event loop.
         """
         if domain_filter is None:
-            return list(self._states.values())
+            return list(self._states_data.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._states.domain_states(domain_filter.lower()))
 
-        return [
-            state for state in self._states.values() if state.domain in domain_filter
-        ]
+        states: list[State] = []
+        for domain in domain_filter:
+            states.extend(self._states.domain_states(domain))
+        return states
 
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
         Async friendly.
         """
-        return self._states.get(entity_id.lower())
+        return self._states_data.get(entity_id.lower())
 
     def is_state(self, entity_id: str, state: str) -> bool:
         """Test if entity exists and is in specified state.
@@ -1577,7 +1678,7 @@ class StateMachine:
         entity_id are added.
         """
         entity_id = entity_id.lower()
-        if entity_id in self._states or entity_id in self._reservations:
+        if entity_id in self._states_data or entity_id in self._reservations:
             raise HomeAssistantError(
                 "async_reserve must not be called once the state is in the state"
                 " machine."
@@ -1589,7 +1690,9 @@ class StateMachine:
     def async_available(self, entity_id: str) -> bool:
         """Check to see if an entity_id is available to be used."""
         entity_id = entity_id.lower()
-        return entity_id not in self._states and entity_id not in self._reservations
+        return (
+            entity_id not in self._states_data and entity_id not in self._reservations
+        )
 
     @callback
     def async_set(
@@ -1612,13 +1715,17 @@ class StateMachine:
         entity_id = entity_id.lower()
         new_state = str(new_state)
         attributes = attributes or {}
-        if (old_state := self._states.get(entity_id)) is None:
+        if (old_state := self._states_data.get(entity_id)) is None:
             same_state = False
             same_attr = False
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
             same_attr = old_state.attributes == attributes
+            if same_attr:
+                # Share the unchanged attributes with the previous state
+                # instead of holding a copy of them for every state
+                attributes = old_state.attributes
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
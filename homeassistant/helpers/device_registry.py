@@ -1,7 +1,7 @@
 """Provide a way to connect entities belonging to one device."""
 from __future__ import annotations
 
-from collections import UserDict
+from collections import UserDict, defaultdict
 from collections.abc import Coroutine, ValuesView
 from enum import StrEnum
 import logging
@@ -21,7 +21,8 @@ import homeassistant.util.uuid as uuid_util
 from . import storage
 from .debounce import Debouncer
 from .frame import report
-from .json import JSON_DUMP, find_paths_unserializable_data
+from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
+from .registry import RegistryIndexType, unindex_entry_value
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -235,6 +236,9 @@ class DeviceEntry:
     is_new: bool = attr.ib(default=False)
 
     _json_repr: str | None = attr.ib(cmp=False, default=None, init=False, repr=False)
+    _storage_fragment: json_fragment | UndefinedType = attr.ib(
+        cmp=False, default=UNDEFINED, init=False, repr=False
+    )
 
     @property
     def disabled(self) -> bool:
@@ -281,6 +285,46 @@ class DeviceEntry:
             )
         return self._json_repr
 
+    @property
+    def as_storage_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the entry for storage."""
+        return {
+            "area_id": self.area_id,
+            "config_entries": list(self.config_entries),
+            "configuration_url": self.configuration_url,
+            "connections": list(self.connections),
+            "disabled_by": self.disabled_by,
+            "entry_type": self.entry_type,
+            "hw_version": self.hw_version,
+            "id": self.id,
+            "identifiers": list(self.identifiers),
+            "manufacturer": self.manufacturer,
+            "model": self.model,
+            "name_by_user": self.name_by_user,
+            "name": self.name,
+            "sw_version": self.sw_version,
+            "via_device_id": self.via_device_id,
+        }
+
+    @property
+    def as_storage_fragment(self) -> json_fragment | dict[str, Any]:
+        """Return a cached JSON fragment of the entry for storage.
+
+        Entries are immutable so only new or changed entries need to be
+        serialized when the registry is saved. If the entry can't be
+        serialized the dict is returned so the store can report the bad data.
+        """
+        if self._storage_fragment is not UNDEFINED:
+            return self._storage_fragment
+
+        storage_dict = self.as_storage_dict
+        try:
+            fragment = json_fragment(json_bytes(storage_dict))
+        except (ValueError, TypeError):
+            return storage_dict
+        object.__setattr__(self, "_storage_fragment", fragment)
+        return fragment
+
 
 @attr.s(slots=True, frozen=True)
 class DeletedDeviceEntry:
@@ -393,26 +437,30 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
     def __setitem__(self, key: str, entry: _EntryTypeT) -> None:
         """Add an item."""
         if key in self:
-            old_entry = self[key]
-            for connection in old_entry.connections:
-                del self._connections[connection]
-            for identifier in old_entry.identifiers:
-                del self._identifiers[identifier]
+            self._unindex_entry(key)
         # type ignore linked to mypy issue: https://github.com/python/mypy/issues/13596
         super().__setitem__(key, entry)  # type: ignore[assignment]
+        self._index_entry(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        self._unindex_entry(key)
+        super().__delitem__(key)
+
+    def _index_entry(self, key: str, entry: _EntryTypeT) -> None:
+        """Add an entry to the indexes."""
         for connection in entry.connections:
             self._connections[connection] = entry
         for identifier in entry.identifiers:
             self._identifiers[identifier] = entry
 
-    def __delitem__(self, key: str) -> None:
-        """Remove an item."""
+    def _unindex_entry(self, key: str) -> None:
+        """Remove an entry from the indexes."""
         entry = self[key]
         for connection in entry.connections:
             del self._connections[connection]
         for identifier in entry.identifiers:
             del self._identifiers[identifier]
-        super().__delitem__(key)
 
     def get_entry(
         self,
@@ -432,10 +480,56 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry entries.
+
+    Maintains two additional indexes on top of DeviceRegistryItems:
+    - area_id -> dict[device id, True]
+    - config_entry_id -> dict[device id, True]
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: RegistryIndexType = defaultdict(dict)
+        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
+
+    def _index_entry(self, key: str, entry: DeviceEntry) -> None:
+        """Add an entry to the indexes."""
+        super()._index_entry(key, entry)
+        if (area_id := entry.area_id) is not None:
+            self._area_id_index[area_id][key] = True
+        for config_entry_id in entry.config_entries:
+            self._config_entry_id_index[config_entry_id][key] = True
+
+    def _unindex_entry(self, key: str) -> None:
+        """Remove an entry from the indexes."""
+        entry = self[key]
+        super()._unindex_entry(key)
+        if (area_id := entry.area_id) is not None:
+            unindex_entry_value(self._area_id_index, key, area_id)
+        for config_entry_id in entry.config_entries:
+            unindex_entry_value(self._config_entry_id_index, key, config_entry_id)
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
     _device_data: dict[str, DeviceEntry]
 
@@ -776,7 +870,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -836,30 +930,11 @@ class DeviceRegistry:
         self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
     @callback
-    def _data_to_save(self) -> dict[str, list[dict[str, Any]]]:
+    def _data_to_save(self) -> dict[str, list[Any]]:
         """Return data of device registry to store in a file."""
-        data: dict[str, list[dict[str, Any]]] = {}
+        data: dict[str, list[Any]] = {}
 
-        data["devices"] = [
-            {
-                "area_id": entry.area_id,
-                "config_entries": list(entry.config_entries),
-                "configuration_url": entry.configuration_url,
-                "connections": list(entry.connections),
-                "disabled_by": entry.disabled_by,
-                "entry_type": entry.entry_type,
-                "hw_version": entry.hw_version,
-                "id": entry.id,
-                "identifiers": list(entry.identifiers),
-                "manufacturer": entry.manufacturer,
-                "model": entry.model,
-                "name_by_user": entry.name_by_user,
-                "name": entry.name,
-                "sw_version": entry.sw_version,
-                "via_device_id": entry.via_device_id,
-            }
-            for entry in self.devices.values()
-        ]
+        data["devices"] = [entry.as_storage_fragment for entry in self.devices.values()]
         data["deleted_devices"] = [
             {
                 "config_entries": list(entry.config_entries),
@@ -939,7 +1014,7 @@ async def async_load(hass: HomeAssistant) -> None:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -947,11 +1022,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
-from collections.abc import Coroutine, Iterable, Mapping, MutableMapping
+from collections.abc import Callable, Coroutine, Iterable, Mapping, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum, auto
@@ -277,6 +277,10 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _platform_state = EntityPlatformState.NOT_ADDED
 
+    # Memoized static state attributes and the sources they were derived from
+    _static_attributes: dict[str, Any] | None = None
+    _static_attributes_sources: tuple[Any, ...] | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -773,35 +777,54 @@ class Entity(ABC):
             attr.update(self.state_attributes or {})
             attr.update(self.extra_state_attributes or {})
 
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        if assumed_state := self.assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        if (attribution := self.attribution) is not None:
-            attr[ATTR_ATTRIBUTION] = attribution
-
-        if (
-            device_class := (entry and entry.device_class) or self.device_class
-        ) is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
-
-        if (entity_picture := self.entity_picture) is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
+        memoized, calculated = _static_attribute_getters(type(self))
+        for key, getter in calculated:
+            if (value := getter(self, entry)) is not None:
+                attr[key] = value
+        if memoized:
+            attr.update(self._async_memoized_static_attributes(entry, memoized))
 
-        if (icon := (entry and entry.icon) or self.icon) is not None:
-            attr[ATTR_ICON] = icon
+        return (state, attr)
 
+    @callback
+    def _async_memoized_static_attributes(
+        self,
+        entry: er.RegistryEntry | None,
+        getters: tuple[tuple[str, _StaticAttributeGetter], ...],
+    ) -> dict[str, Any]:
+        """Return the static attributes which are memoized for this entity.
+
+        The attributes are calculated again when the registry entry, device
+        entry, entity description or one of the _attr_ attributes they are
+        derived from has changed.
+        """
+        get = self.__dict__.get
+        sources = (
+            entry,
+            self.device_entry,
+            self.platform,
+            get("entity_description", UNDEFINED),
+            get("_attr_assumed_state", UNDEFINED),
+            get("_attr_attribution", UNDEFINED),
+            get("_attr_device_class", UNDEFINED),
+            get("_attr_entity_picture", UNDEFINED),
+            get("_attr_has_entity_name", UNDEFINED),
+            get("_attr_icon", UNDEFINED),
+            get("_attr_name", UNDEFINED),
+            get("_attr_supported_features", UNDEFINED),
+            get("_attr_translation_key", UNDEFINED),
+            get("_attr_unit_of_measurement", UNDEFINED),
+        )
         if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        if (supported_features := self.supported_features) is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
-
-        return (state, attr)
+            static_attributes := self._static_attributes
+        ) is None or sources != self._static_attributes_sources:
+            static_attributes = {}
+            for key, getter in getters:
+                if (value := getter(self, entry)) is not None:
+                    static_attributes[key] = value
+            self._static_attributes = static_attributes
+            self._static_attributes_sources = sources
+        return static_attributes
 
     @callback
     def _async_write_ha_state(self) -> None:
@@ -1219,6 +1242,121 @@ class Entity(ABC):
         return report_issue
 
 
+_StaticAttributeGetter = Callable[[Entity, "er.RegistryEntry | None"], Any]
+
+
+def _unit_of_measurement_attribute(
+    entity: Entity, entry: er.RegistryEntry | None
+) -> str | None:
+    """Return the unit of measurement state attribute."""
+    return entity.unit_of_measurement
+
+
+def _assumed_state_attribute(
+    entity: Entity, entry: er.RegistryEntry | None
+) -> Literal[True] | None:
+    """Return the assumed state state attribute."""
+    return True if entity.assumed_state else None
+
+
+def _attribution_attribute(
+    entity: Entity, entry: er.RegistryEntry | None
+) -> str | None:
+    """Return the attribution state attribute."""
+    return entity.attribution
+
+
+def _device_class_attribute(
+    entity: Entity, entry: er.RegistryEntry | None
+) -> str | None:
+    """Return the device class state attribute."""
+    if (device_class := (entry and entry.device_class) or entity.device_class) is None:
+        return None
+    return str(device_class)
+
+
+def _entity_picture_attribute(
+    entity: Entity, entry: er.RegistryEntry | None
+) -> str | None:
+    """Return the entity picture state attribute."""
+    return entity.entity_picture
+
+
+def _icon_attribute(entity: Entity, entry: er.RegistryEntry | None) -> str | None:
+    """Return the icon state attribute."""
+    return (entry and entry.icon) or entity.icon
+
+
+def _friendly_name_attribute(
+    entity: Entity, entry: er.RegistryEntry | None
+) -> str | None:
+    """Return the friendly name state attribute."""
+    # pylint: disable-next=protected-access
+    return (entry and entry.name) or entity._friendly_name_internal()
+
+
+def _supported_features_attribute(
+    entity: Entity, entry: er.RegistryEntry | None
+) -> int | None:
+    """Return the supported features state attribute."""
+    return entity.supported_features
+
+
+# State attributes which are not expected to change when the state changes,
+# with the entity properties they are derived from. The attributes are
+# memoized for entities which use the default implementations of these
+# properties, as those only depend on _attr_ attributes, the entity
+# description and the registry entries. The name of entities is expected
+# to only depend on their device class.
+_STATIC_ATTRIBUTES: Final[
+    tuple[tuple[str, tuple[str, ...], _StaticAttributeGetter], ...]
+] = (
+    (
+        ATTR_UNIT_OF_MEASUREMENT,
+        ("unit_of_measurement",),
+        _unit_of_measurement_attribute,
+    ),
+    (ATTR_ASSUMED_STATE, ("assumed_state",), _assumed_state_attribute),
+    (ATTR_ATTRIBUTION, ("attribution",), _attribution_attribute),
+    (ATTR_DEVICE_CLASS, ("device_class",), _device_class_attribute),
+    (ATTR_ENTITY_PICTURE, ("entity_picture",), _entity_picture_attribute),
+    (ATTR_ICON, ("icon",), _icon_attribute),
+    (
+        ATTR_FRIENDLY_NAME,
+        (
+            "_friendly_name_internal",
+            "device_class",
+            "has_entity_name",
+            "name",
+            "translation_key",
+            "use_device_name",
+        ),
+        _friendly_name_attribute,
+    ),
+    (ATTR_SUPPORTED_FEATURES, ("supported_features",), _supported_features_attribute),
+)
+
+
+@ft.lru_cache(maxsize=1024)
+def _static_attribute_getters(
+    entity_class: type[Entity],
+) -> tuple[
+    tuple[tuple[str, _StaticAttributeGetter], ...],
+    tuple[tuple[str, _StaticAttributeGetter], ...],
+]:
+    """Return the static attributes which can be memoized and the others."""
+    memoized: list[tuple[str, _StaticAttributeGetter]] = []
+    calculated: list[tuple[str, _StaticAttributeGetter]] = []
+    for key, properties, getter in _STATIC_ATTRIBUTES:
+        if all(
+            getattr(entity_class, prop) is getattr(Entity, prop) for prop in properties
+        ):
+            memoized.append((key, getter))
+        else:
+            calculated.append((key, getter))
+    return tuple(memoized), tuple(calculated)
+
+
 @dataclass(slots=True)
 class ToggleEntityDescription(EntityDescription):
     """A class that describes toggle entities."""
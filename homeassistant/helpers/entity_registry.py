@@ -9,7 +9,7 @@ timer.
 """
 from __future__ import annotations
 
-from collections import UserDict
+from collections import UserDict, defaultdict
 from collections.abc import Callable, Iterable, Mapping, ValuesView
 from datetime import datetime, timedelta
 from enum import StrEnum
@@ -50,7 +50,8 @@ from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, storage
 from .device_registry import EVENT_DEVICE_REGISTRY_UPDATED
-from .json import JSON_DUMP, find_paths_unserializable_data
+from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
+from .registry import RegistryIndexType, unindex_entry_value
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -189,6 +190,9 @@ class RegistryEntry:
     _display_repr: str | None | UndefinedType = attr.ib(
         cmp=False, default=UNDEFINED, init=False, repr=False
     )
+    _storage_fragment: json_fragment | UndefinedType = attr.ib(
+        cmp=False, default=UNDEFINED, init=False, repr=False
+    )
 
     @domain.default
     def _domain_default(self) -> str:
@@ -299,6 +303,54 @@ class RegistryEntry:
         # Mypy doesn't understand the __setattr__ business
         return self._partial_repr  # type: ignore[return-value]
 
+    @property
+    def as_storage_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the entry for storage."""
+        return {
+            "aliases": list(self.aliases),
+            "area_id": self.area_id,
+            "capabilities": self.capabilities,
+            "config_entry_id": self.config_entry_id,
+            "device_class": self.device_class,
+            "device_id": self.device_id,
+            "disabled_by": self.disabled_by,
+            "entity_category": self.entity_category,
+            "entity_id": self.entity_id,
+            "hidden_by": self.hidden_by,
+            "icon": self.icon,
+            "id": self.id,
+            "has_entity_name": self.has_entity_name,
+            "name": self.name,
+            "options": self.options,
+            "original_device_class": self.original_device_class,
+            "original_icon": self.original_icon,
+            "original_name": self.original_name,
+            "platform": self.platform,
+            "supported_features": self.supported_features,
+            "translation_key": self.translation_key,
+            "unique_id": self.unique_id,
+            "unit_of_measurement": self.unit_of_measurement,
+        }
+
+    @property
+    def as_storage_fragment(self) -> json_fragment | dict[str, Any]:
+        """Return a cached JSON fragment of the entry for storage.
+
+        Entries are immutable so only new or changed entries need to be
+        serialized when the registry is saved. If the entry can't be
+        serialized the dict is returned so the store can report the bad data.
+        """
+        if self._storage_fragment is not UNDEFINED:
+            return self._storage_fragment
+
+        storage_dict = self.as_storage_dict
+        try:
+            fragment = json_fragment(json_bytes(storage_dict))
+        except (ValueError, TypeError):
+            return storage_dict
+        object.__setattr__(self, "_storage_fragment", fragment)
+        return fragment
+
     @callback
     def write_unavailable_state(self, hass: HomeAssistant) -> None:
         """Write the unavailable state to the state machine."""
@@ -433,9 +485,12 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains five additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - device_id -> dict[entity_id, True]
+    - area_id -> dict[entity_id, True]
+    - config_entry_id -> dict[entity_id, True]
     """
 
     def __init__(self) -> None:
@@ -443,6 +498,9 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: RegistryIndexType = defaultdict(dict)
+        self._area_id_index: RegistryIndexType = defaultdict(dict)
+        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -451,19 +509,33 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
         if key in self:
-            old_entry = self[key]
-            del self._entry_ids[old_entry.id]
-            del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            self._unindex_entry(key)
         super().__setitem__(key, entry)
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        if (device_id := entry.device_id) is not None:
+            self._device_id_index[device_id][key] = True
+        if (area_id := entry.area_id) is not None:
+            self._area_id_index[area_id][key] = True
+        if (config_entry_id := entry.config_entry_id) is not None:
+            self._config_entry_id_index[config_entry_id][key] = True
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
+        self._unindex_entry(key)
+        super().__delitem__(key)
+
+    def _unindex_entry(self, key: str) -> None:
+        """Remove an entry from all indexes."""
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
-        super().__delitem__(key)
+        if (device_id := entry.device_id) is not None:
+            unindex_entry_value(self._device_id_index, key, device_id)
+        if (area_id := entry.area_id) is not None:
+            unindex_entry_value(self._area_id_index, key, area_id)
+        if (config_entry_id := entry.config_entry_id) is not None:
+            unindex_entry_value(self._config_entry_id_index, key, config_entry_id)
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
@@ -473,6 +545,31 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for device."""
+        data = self.data
+        return [
+            entry
+            for key in self._device_id_index.get(device_id, ())
+            if not (entry := data[key]).disabled_by or include_disabled_entities
+        ]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -1106,32 +1203,7 @@ class EntityRegistry:
         data: dict[str, Any] = {}
 
         data["entities"] = [
-            {
-                "aliases": list(entry.aliases),
-                "area_id": entry.area_id,
-                "capabilities": entry.capabilities,
-                "config_entry_id": entry.config_entry_id,
-                "device_class": entry.device_class,
-                "device_id": entry.device_id,
-                "disabled_by": entry.disabled_by,
-                "entity_category": entry.entity_category,
-                "entity_id": entry.entity_id,
-                "hidden_by": entry.hidden_by,
-                "icon": entry.icon,
-                "id": entry.id,
-                "has_entity_name": entry.has_entity_name,
-                "name": entry.name,
-                "options": entry.options,
-                "original_device_class": entry.original_device_class,
-                "original_icon": entry.original_icon,
-                "original_name": entry.original_name,
-                "platform": entry.platform,
-                "supported_features": entry.supported_features,
-                "translation_key": entry.translation_key,
-                "unique_id": entry.unique_id,
-                "unit_of_measurement": entry.unit_of_measurement,
-            }
-            for entry in self.entities.values()
+            entry.as_storage_fragment for entry in self.entities.values()
         ]
         data["deleted_entities"] = [
             {
@@ -1208,12 +1280,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    return registry.entities.get_entries_for_device_id(
+        device_id, include_disabled_entities
+    )
 
 
 @callback
@@ -1221,7 +1290,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -1229,11 +1298,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
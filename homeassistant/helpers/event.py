@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
 import logging
+import math
 from random import randint
 import time
 from typing import Any, Concatenate, ParamSpec, TypedDict, TypeVar
@@ -43,6 +44,7 @@ from .entity_registry import (
     EventEntityRegistryUpdatedData,
 )
 from .ratelimit import KeyedRateLimit
+from .singleton import singleton
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import EventType, TemplateVarsType
@@ -62,6 +64,11 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+TIMER_SCHEDULER = "timer_scheduler"
+
+# Default tick length in seconds when timers are coalesced on a timer wheel
+TIMER_WHEEL_RESOLUTION = 0.05
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -279,6 +286,56 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action)
 
 
+@bind_hass
+def async_track_state_change_event_batch(
+    hass: HomeAssistant,
+    entity_ids: str | Iterable[str],
+    action: Callable[[list[EventType[EventStateChangedData]]], Any],
+) -> CALLBACK_TYPE:
+    """Track specific state change events and pass them in batches.
+
+    State change events of the tracked entities are collected and
+    passed to the action as a single list once per loop iteration, so a
+    burst of state changes only creates a single job.
+    """
+    if not (entity_ids := _async_string_to_lower_list(entity_ids)):
+        return _remove_empty_listener
+
+    job = HassJob(action, f"track state changed event batch {entity_ids}")
+    pending: list[EventType[EventStateChangedData]] = []
+    flush_handle: asyncio.Handle | None = None
+
+    @callback
+    def _async_flush() -> None:
+        """Pass the pending events to the action."""
+        nonlocal flush_handle, pending
+        flush_handle = None
+        events, pending = pending, []
+        hass.async_run_hass_job(job, events)
+
+    @callback
+    def _async_collect(event: EventType[EventStateChangedData]) -> None:
+        """Collect a state change event."""
+        nonlocal flush_handle
+        pending.append(event)
+        if flush_handle is None:
+            flush_handle = hass.loop.call_soon(_async_flush)
+
+    remove_listener = _async_track_state_change_event(hass, entity_ids, _async_collect)
+
+    @callback
+    def _async_remove_listener() -> None:
+        """Remove the listener and drop pending events."""
+        nonlocal flush_handle
+        remove_listener()
+        if flush_handle is not None:
+            flush_handle.cancel()
+            flush_handle = None
+        pending.clear()
+
+    return _async_remove_listener
+
+
 @callback
 def _async_dispatch_entity_id_event(
     hass: HomeAssistant,
@@ -1349,6 +1406,160 @@ def async_track_same_state(
 track_same_state = threaded_listener_factory(async_track_same_state)
 
 
+class _WheelTimer:
+    """A timer coalesced on a timer wheel tick."""
+
+    __slots__ = ("_scheduler", "tick", "_when", "_callback", "_args", "_done")
+
+    def __init__(
+        self,
+        scheduler: _TimerScheduler,
+        tick: int,
+        when: float,
+        callback_: Callable[..., None],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Initialize the timer."""
+        self._scheduler = scheduler
+        self.tick = tick
+        self._when = when
+        self._callback = callback_
+        self._args = args
+        self._done = False
+
+    def when(self) -> float:
+        """Return the loop time the timer is due."""
+        return self._when
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if not self._done:
+            self._done = True
+            self._scheduler.async_cancel_wheel_timer(self)
+
+    def run(self) -> None:
+        """Run the timer callback unless it was cancelled."""
+        if not self._done:
+            self._done = True
+            self._callback(*self._args)
+
+
+class _TimerScheduler:
+    """Schedule the timers of the time tracking helpers.
+
+    By default every timer is its own loop timer. When a timer wheel
+    resolution is set, timers due in the same tick share a single loop
+    timer that fires at the end of the tick, so adding and cancelling a
+    timer is a dict operation instead of a heap operation.
+    """
+
+    __slots__ = (
+        "_loop",
+        "resolution",
+        "_buckets",
+        "timers_scheduled",
+        "timers_coalesced",
+        "timers_cancelled",
+        "ticks_fired",
+    )
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the scheduler."""
+        self._loop = loop
+        self.resolution: float | None = None
+        self._buckets: dict[
+            int, tuple[asyncio.TimerHandle, dict[_WheelTimer, None]]
+        ] = {}
+        self.timers_scheduled = 0
+        self.timers_coalesced = 0
+        self.timers_cancelled = 0
+        self.ticks_fired = 0
+
+    @callback
+    def async_call_at(
+        self, when: float, callback_: Callable[..., None], *args: Any
+    ) -> asyncio.TimerHandle | _WheelTimer:
+        """Call callback_ at loop time when."""
+        self.timers_scheduled += 1
+        if not (resolution := self.resolution):
+            return self._loop.call_at(when, callback_, *args)
+        tick = math.ceil(when / resolution)
+        timer = _WheelTimer(self, tick, when, callback_, args)
+        if bucket := self._buckets.get(tick):
+            self.timers_coalesced += 1
+            bucket[1][timer] = None
+        else:
+            self._buckets[tick] = (
+                self._loop.call_at(tick * resolution, self._async_fire_tick, tick),
+                {timer: None},
+            )
+        return timer
+
+    @callback
+    def async_cancel_wheel_timer(self, timer: _WheelTimer) -> None:
+        """Remove a cancelled timer from its tick."""
+        if not (bucket := self._buckets.get(timer.tick)) or timer not in bucket[1]:
+            return
+        handle, timers = bucket
+        del timers[timer]
+        self.timers_cancelled += 1
+        if not timers:
+            handle.cancel()
+            del self._buckets[timer.tick]
+
+    @callback
+    def _async_fire_tick(self, tick: int) -> None:
+        """Run the timers of a tick in the order they are due."""
+        _, timers = self._buckets.pop(tick)
+        self.ticks_fired += 1
+        for timer in sorted(timers, key=_WheelTimer.when):
+            # A failing timer must not keep the others of the tick from running
+            try:
+                timer.run()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running timer of tick %s", tick)
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return scheduler statistics."""
+        return {
+            "resolution": self.resolution,
+            "timers_scheduled": self.timers_scheduled,
+            "timers_coalesced": self.timers_coalesced,
+            "timers_cancelled": self.timers_cancelled,
+            "timers_pending": sum(len(timers) for _, timers in self._buckets.values()),
+            "ticks_pending": len(self._buckets),
+            "ticks_fired": self.ticks_fired,
+        }
+
+
+@singleton(TIMER_SCHEDULER)
+@callback
+def _async_get_timer_scheduler(hass: HomeAssistant) -> _TimerScheduler:
+    """Return the timer scheduler."""
+    return _TimerScheduler(hass.loop)
+
+
+@callback
+@bind_hass
+def async_enable_timer_wheel(
+    hass: HomeAssistant, resolution: float | None = TIMER_WHEEL_RESOLUTION
+) -> None:
+    """Coalesce timers due in the same tick of resolution seconds.
+
+    Timers fire at most resolution seconds late. Pass None to schedule
+    new timers individually again.
+    """
+    _async_get_timer_scheduler(hass).resolution = resolution
+
+
+@callback
+@bind_hass
+def async_timer_stats(hass: HomeAssistant) -> dict[str, Any]:
+    """Return statistics about the timers scheduled by the time tracking helpers."""
+    return _async_get_timer_scheduler(hass).async_stats()
+
+
 @callback
 @bind_hass
 def async_track_point_in_time(
@@ -1395,8 +1606,9 @@ def async_track_point_in_utc_time(
 
     # Since this is called once, we accept a HassJob so we can avoid
     # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    cancel_callback: asyncio.TimerHandle | _WheelTimer | None = None
     loop = hass.loop
+    scheduler = _async_get_timer_scheduler(hass)
 
     @callback
     def run_action(job: HassJob[[datetime], Coroutine[Any, Any, None] | None]) -> None:
@@ -1410,7 +1622,9 @@ def async_track_point_in_utc_time(
         if (delta := (expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
 
-            cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+            cancel_callback = scheduler.async_call_at(
+                loop.time() + delta, run_action, job
+            )
             return
 
         hass.async_run_hass_job(job, utc_point_in_time)
@@ -1421,7 +1635,7 @@ def async_track_point_in_utc_time(
         else HassJob(action, f"track point in utc time {utc_point_in_time}")
     )
     delta = expected_fire_timestamp - time.time()
-    cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+    cancel_callback = scheduler.async_call_at(loop.time() + delta, run_action, job)
 
     @callback
     def unsub_point_in_time_listener() -> None:
@@ -1455,7 +1669,9 @@ def async_call_at(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
-    cancel_callback = hass.loop.call_at(loop_time, run_action, job)
+    cancel_callback = _async_get_timer_scheduler(hass).async_call_at(
+        loop_time, run_action, job
+    )
 
     @callback
     def unsub_call_later_listener() -> None:
@@ -1488,7 +1704,9 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    cancel_callback = hass.loop.call_at(hass.loop.time() + delay, run_action, job)
+    cancel_callback = _async_get_timer_scheduler(hass).async_call_at(
+        hass.loop.time() + delay, run_action, job
+    )
 
     @callback
     def unsub_call_later_listener() -> None:
@@ -141,6 +141,9 @@ def json_dumps_sorted(data: Any) -> str:
 
 JSON_DUMP: Final = json_dumps
 
+json_fragment = orjson.Fragment
+"""Wrap pre-serialized json so it is embedded as is when dumping."""
+
 
 def _orjson_default_encoder(data: Any) -> str:
     """JSON encoder that uses orjson with hass defaults."""
@@ -0,0 +1,15 @@
+"""Provide helpers shared by the registries."""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Literal
+
+RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+
+
+def unindex_entry_value(index: RegistryIndexType, key: str, value: str) -> None:
+    """Remove a key from a secondary index, dropping the value once it is empty."""
+    entries = index[value]
+    del entries[key]
+    if not entries:
+        del index[value]
@@ -155,7 +155,12 @@ class Store(Generic[_T]):
 
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
-            data = deepcopy(data)
+            try:
+                data = deepcopy(data)
+            except TypeError:
+                # Data with pre-serialized json fragments can't be copied,
+                # round trip it through json instead.
+                data = json_util.json_loads(json_helper.json_bytes(data))
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -10,8 +10,11 @@ from contextlib import contextmanager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -20,6 +23,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType
 from typing import (
     Any,
@@ -55,9 +59,11 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -76,10 +82,15 @@ from homeassistant.util import (
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
-from homeassistant.util.thread import ThreadWithException
+from homeassistant.util.thread import (
+    InterruptibleJob,
+    InterruptibleThreadPool,
+    ThreadWithException,
+)
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .storage import Store
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -92,6 +103,8 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE = "template.bytecode_cache"
+_RENDER_WATCHDOG = "template.render_watchdog"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -147,6 +160,12 @@ EVAL_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
+BYTECODE_CACHE_MAX_ENTRIES = 16384
+MAX_RENDER_WATCHDOG_WORKERS = 4
+
 CACHED_TEMPLATE_LRU: MutableMapping[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: MutableMapping[State, TemplateState] = LRU(
     CACHED_TEMPLATE_STATES
@@ -641,10 +660,12 @@ class Template:
             kwargs.update(variables)
 
         self._exc_info = None
+        start_event = asyncio.Event()
         finish_event = asyncio.Event()
 
-        def _render_template() -> None:
+        def _render_template(started: asyncio.Event, finished: asyncio.Event) -> None:
             assert self.hass is not None, "hass variable not set on template"
+            run_callback_threadsafe(self.hass.loop, started.set)
             try:
                 _render_with_context(self.template, compiled, **kwargs)
             except TimeoutError:
@@ -652,20 +673,51 @@ class Template:
             except Exception:  # pylint: disable=broad-except
                 self._exc_info = sys.exc_info()
             finally:
-                run_callback_threadsafe(self.hass.loop, finish_event.set)
+                run_callback_threadsafe(self.hass.loop, finished.set)
 
+        assert self.hass is not None, "hass variable not set on template"
+        watchdog = _get_render_watchdog(self.hass)
+        job: InterruptibleJob | None
         try:
-            template_render_thread = ThreadWithException(target=_render_template)
+            job = watchdog.submit(partial(_render_template, start_event, finish_event))
+        except RuntimeError:
+            # The watchdog is shut down when Home Assistant stops
+            job = None
+        if job is not None:
+            try:
+                # The render may wait for a free worker, it only
+                # times out once it has started
+                async with asyncio.timeout(timeout):
+                    await start_event.wait()
+            except asyncio.TimeoutError:
+                # No worker picked the render up in time, they may all be
+                # stuck in code which cannot be interrupted
+                if watchdog.interrupt(job):
+                    job = None
+
+        template_render_thread: ThreadWithException | None = None
+        interrupt: Callable[[], Any]
+        if job is None:
+            # Render in a thread of its own instead
+            finish_event = asyncio.Event()
+            template_render_thread = ThreadWithException(
+                target=_render_template, args=(asyncio.Event(), finish_event)
+            )
             template_render_thread.start()
+            interrupt = partial(template_render_thread.raise_exc, TimeoutError)
+        else:
+            interrupt = partial(watchdog.interrupt, job)
+        try:
             async with asyncio.timeout(timeout):
                 await finish_event.wait()
             if self._exc_info:
                 raise TemplateError(self._exc_info[1].with_traceback(self._exc_info[2]))
         except asyncio.TimeoutError:
-            template_render_thread.raise_exc(TimeoutError)
+            interrupt()
             return True
         finally:
-            template_render_thread.join()
+            if template_render_thread is not None:
+                template_render_thread.join()
 
         return False
 
@@ -2271,6 +2323,106 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the compiled code of templates from the previous run."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+
+class TemplateBytecodeCache:
+    """Persist the compiled code of templates across restarts.
+
+    The code is keyed by the hash of the template source and the flavor
+    of the environment, and is discarded when the version of Home
+    Assistant, Jinja or Python changes. The most recently used code is
+    kept up to the maximum number of entries.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        self.hass = hass
+        self._store = Store[dict[str, Any]](
+            hass, BYTECODE_CACHE_STORAGE_VERSION, BYTECODE_CACHE_STORAGE_KEY
+        )
+        self._version = f"{__version__}-{jinja2.__version__}-{MAGIC_NUMBER.hex()}"
+        self._bytecode: LRU = LRU(BYTECODE_CACHE_MAX_ENTRIES)
+        self._lock = threading.Lock()
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load the cached bytecode."""
+        if (data := await self._store.async_load()) and data[
+            "version"
+        ] == self._version:
+            # The code is saved from the most to the least recently used
+            bytecode: dict[str, str] = data["bytecode"]
+            with self._lock:
+                for key in reversed(bytecode):
+                    self._bytecode[key] = bytecode[key]
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the cached code of a template.
+
+        Can be called from any thread.
+        """
+        with self._lock:
+            bytecode: str | None = self._bytecode.get(key)
+        if bytecode is None:
+            return None
+        try:
+            code = marshal.loads(base64.b64decode(bytecode))
+        except (EOFError, TypeError, ValueError):
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Cache the code of a template.
+
+        Can be called from any thread.
+        """
+        bytecode = base64.b64encode(marshal.dumps(code)).decode()
+        with self._lock:
+            self._bytecode[key] = bytecode
+            if self._save_scheduled:
+                return
+            self._save_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        with self._lock:
+            self._save_scheduled = False
+            bytecode = dict(self._bytecode.items())
+        return {"version": self._version, "bytecode": bytecode}
+
+
+@singleton(_RENDER_WATCHDOG)
+def _get_render_watchdog(hass: HomeAssistant) -> InterruptibleThreadPool:
+    """Return the pool of threads used to check for slow renders."""
+    watchdog = InterruptibleThreadPool(
+        MAX_RENDER_WATCHDOG_WORKERS, "TemplateRenderWatchdog"
+    )
+
+    async def _async_shutdown(_: Event) -> None:
+        await hass.async_add_executor_job(watchdog.shutdown)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+    return watchdog
+
+
+@callback
+def async_render_watchdog_stats(hass: HomeAssistant) -> dict[str, Any]:
+    """Return thread and latency statistics of the template render watchdog."""
+    return _get_render_watchdog(hass).stats()
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2317,6 +2469,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        if limited:
+            self.flavor = "limited"
+        elif strict:
+            self.flavor = "strict"
+        else:
+            self.flavor = "default"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
@@ -2604,9 +2762,24 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = self.template_cache[source] = self._compile_cached(source)
 
         return cached
 
+    def _compile_cached(self, source: str | jinja2.nodes.Template) -> CodeType:
+        """Compile the template or load its code from the bytecode cache."""
+        bytecode_cache: TemplateBytecodeCache | None = None
+        if self.hass is not None:
+            bytecode_cache = self.hass.data.get(_BYTECODE_CACHE)
+        if bytecode_cache is None or not isinstance(source, str):
+            return super().compile(source)
+
+        source_hash = hashlib.sha256(source.encode()).hexdigest()
+        key = f"{self.flavor}:{source_hash}"
+        if (code := bytecode_cache.get(key)) is None:
+            code = super().compile(source)
+            bytecode_cache.set(key, code)
+        return code
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
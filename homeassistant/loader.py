@@ -12,8 +12,10 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
 import sys
+import threading
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,6 +27,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -39,6 +42,7 @@ if TYPE_CHECKING:
     from .config_entries import ConfigEntry
     from .core import HomeAssistant
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
@@ -48,6 +52,10 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 60
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -173,6 +181,117 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
 
 
+class ManifestIndex:
+    """Index of the integration manifests that is persisted between restarts.
+
+    The manifests of the built-in integrations are trusted as long as the
+    Home Assistant version is unchanged, as they can only change with a new
+    version, so resolving them does not touch the file system. Other
+    manifests are trusted as long as the modification time and size of
+    their manifest.json are unchanged, which only needs a stat instead of
+    reading and parsing the file. This includes the built-in integrations
+    of development versions, as their manifests change without a new
+    version.
+
+    Lookups and updates happen in the executor while resolving
+    integrations.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest index."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] | None = None
+        self._load_task: asyncio.Task[None] | None = None
+        self._roots: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._trust_built_in = "dev" not in __version__
+
+    async def async_load(self) -> None:
+        """Load the index from storage, only the first call loads it."""
+        if self._load_task is None:
+            self._load_task = self.hass.async_create_task(
+                self._async_load(), "load manifest index"
+            )
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        """Load the index from storage."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._store = Store(
+            self.hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY
+        )
+        if (data := await self._store.async_load()) and data[
+            "ha_version"
+        ] == __version__:
+            with self._lock:
+                self._roots = data["roots"]
+
+    def get(self, base: str, domain: str, built_in: bool) -> Manifest | None:
+        """Return the manifest of an integration if it did not change."""
+        with self._lock:
+            if (root := self._roots.get(base)) is None or (
+                entry := root["integrations"].get(domain)
+            ) is None:
+                return None
+        if built_in and self._trust_built_in:
+            return cast(Manifest, dict(entry["manifest"]))
+        try:
+            stat = os.stat(os.path.join(base, domain, "manifest.json"))
+        except OSError:
+            return None
+        if [stat.st_mtime_ns, stat.st_size] != entry.get("stat"):
+            return None
+        return cast(Manifest, dict(entry["manifest"]))
+
+    def set(self, base: str, domain: str, manifest: Manifest) -> None:
+        """Add the manifest of an integration that was read from disk."""
+        try:
+            stat = os.stat(os.path.join(base, domain, "manifest.json"))
+        except OSError:
+            return
+        entry: dict[str, Any] = {
+            "manifest": dict(manifest),
+            "stat": [stat.st_mtime_ns, stat.st_size],
+        }
+        with self._lock:
+            self._roots.setdefault(base, {"integrations": {}})["integrations"][
+                domain
+            ] = entry
+            self._dirty = True
+
+    def async_schedule_save(self) -> None:
+        """Save the index if integrations were added to it.
+
+        Must be called from the event loop.
+        """
+        if self._store is None or not self._dirty:
+            return
+        self._dirty = False
+        self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the index to save."""
+        with self._lock:
+            return {
+                "ha_version": __version__,
+                "roots": {
+                    base: {"integrations": dict(root["integrations"])}
+                    for base, root in self._roots.items()
+                },
+            }
+
+
+async def _async_get_manifest_index(hass: HomeAssistant) -> ManifestIndex:
+    """Return the manifest index once it is loaded."""
+    if (index := hass.data.get(DATA_MANIFEST_INDEX)) is None:
+        index = hass.data[DATA_MANIFEST_INDEX] = ManifestIndex(hass)
+    await index.async_load()
+    return cast(ManifestIndex, index)
+
+
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     """Generate a manifest from a legacy module."""
     return {
@@ -209,12 +328,14 @@ async def _async_get_custom_components(
         get_sub_directories, custom_components.__path__
     )
 
+    manifest_index = await _async_get_manifest_index(hass)
     integrations = await hass.async_add_executor_job(
         _resolve_integrations_from_root,
         hass,
         custom_components,
         [comp.name for comp in dirs],
     )
+    manifest_index.async_schedule_save()
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -556,19 +677,28 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_index: ManifestIndex | None = hass.data.get(DATA_MANIFEST_INDEX)
+        built_in = root_module.__name__ == PACKAGE_BUILTIN
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
+            if (
+                manifest_index is None
+                or (manifest := manifest_index.get(base, domain, built_in)) is None
+            ):
+                if not manifest_path.is_file():
+                    continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                if manifest_index is not None:
+                    manifest_index.set(base, domain, manifest)
 
             integration = cls(
                 hass,
@@ -937,9 +1067,11 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        manifest_index = await _async_get_manifest_index(hass)
         integrations = await hass.async_add_executor_job(
             _resolve_integrations_from_root, hass, components, list(needed)
         )
+        manifest_index.async_schedule_save()
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -6,19 +6,24 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+import tempfile
 from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, EVENT_STATE_CHANGED
+from homeassistant.helpers import template
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
+    async_track_state_change_event_batch,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -61,12 +66,10 @@ def benchmark(func: _CallableT) -> _CallableT:
     return func
 
 
-@benchmark
-async def fire_events(hass):
-    """Fire a million events."""
+async def _fire_events(hass, listeners_count, events_to_fire=10**6):
+    """Fire events to a number of listeners."""
     count = 0
     event_name = "benchmark_event"
-    events_to_fire = 10**6
 
     @core.callback
     def listener(_):
@@ -74,20 +77,39 @@ async def fire_events(hass):
         nonlocal count
         count += 1
 
-    hass.bus.async_listen(event_name, listener)
+    for _ in range(listeners_count):
+        hass.bus.async_listen(event_name, listener)
+
+    start = timer()
 
     for _ in range(events_to_fire):
         hass.bus.async_fire(event_name)
 
-    start = timer()
-
     await hass.async_block_till_done()
 
-    assert count == events_to_fire
+    assert count == events_to_fire * listeners_count
 
     return timer() - start
 
 
+@benchmark
+async def fire_events(hass):
+    """Fire a million events with one listener."""
+    return await _fire_events(hass, 1)
+
+
+@benchmark
+async def fire_events_no_listeners(hass):
+    """Fire a million events without listeners."""
+    return await _fire_events(hass, 0)
+
+
+@benchmark
+async def fire_events_100_listeners(hass):
+    """Fire ten thousand events with 100 listeners."""
+    return await _fire_events(hass, 100, 10**4)
+
+
 @benchmark
 async def fire_events_with_filter(hass):
     """Fire a million events with a filter that rejects them."""
@@ -189,6 +211,62 @@ async def state_changed_event_helper(hass):
     return timer() - start
 
 
+async def _state_changed_event_dispatch(hass, batched):
+    """Restore 500 entities at once, 200 times, to a coroutine listener."""
+    entity_ids = [f"light.kitchen{idx}" for idx in range(500)]
+    events_to_fire = 200 * len(entity_ids)
+    count = 0
+
+    async def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    async def batch_listener(events):
+        """Handle batch of events."""
+        nonlocal count
+        count += len(events)
+
+    if batched:
+        async_track_state_change_event_batch(hass, entity_ids, batch_listener)
+    else:
+        async_track_state_change_event(hass, entity_ids, listener)
+
+    events_data = [
+        {
+            "entity_id": entity_id,
+            "old_state": core.State(entity_id, "off"),
+            "new_state": core.State(entity_id, "on"),
+        }
+        for entity_id in entity_ids
+    ]
+
+    start = timer()
+
+    for _ in range(200):
+        for event_data in events_data:
+            hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+        await asyncio.sleep(0)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def state_changed_event_dispatch(hass):
+    """Run state change bursts of 500 entities through a coroutine listener."""
+    return await _state_changed_event_dispatch(hass, False)
+
+
+@benchmark
+async def state_changed_event_dispatch_batched(hass):
+    """Run state change bursts of 500 entities through a batched listener."""
+    return await _state_changed_event_dispatch(hass, True)
+
+
 @benchmark
 async def state_changed_event_filter_helper(hass):
     """Run a million events through state changed event helper.
@@ -227,6 +305,373 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_machine_domain_filter(hass):
+    """Run 10k domain filtered queries against a state machine with 10k states."""
+    for domain in ("sensor", "light", "switch", "binary_sensor", "climate"):
+        for idx in range(2000):
+            hass.states.async_set(f"{domain}.entity_{idx}", "on")
+    await hass.async_block_till_done()
+
+    start = timer()
+
+    for _ in range(10**4):
+        hass.states.async_all("light")
+        hass.states.async_entity_ids(("climate", "switch"))
+        hass.states.async_entity_ids_count("sensor")
+
+    return timer() - start
+
+
+@benchmark
+async def state_machine_unchanged_attributes(hass):
+    """Change the state of 9k entities 10 times without changing attributes.
+
+    The states are kept alive and serialized like the recorder and websocket
+    connections do, and the memory allocated for them is reported.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import tracemalloc
+
+    attributes = {
+        "hvac_modes": ["off", "heat", "cool", "heat_cool", "auto", "dry", "fan_only"],
+        "min_temp": 7,
+        "max_temp": 35,
+        "target_temp_step": 0.5,
+        "fan_modes": ["auto", "low", "medium", "high"],
+        "preset_modes": ["none", "eco", "away", "boost", "comfort", "home"],
+        "swing_modes": ["off", "vertical", "horizontal", "both"],
+        "current_temperature": 21.5,
+        "temperature": 22,
+        "current_humidity": 45,
+        "fan_mode": "auto",
+        "hvac_action": "heating",
+        "preset_mode": "comfort",
+        "swing_mode": "off",
+        "friendly_name": "Living room",
+        "supported_features": 57,
+    }
+    entity_ids = [f"climate.entity_{idx}" for idx in range(9000)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "heat", attributes)
+    states = []
+
+    @core.callback
+    def listener(event):
+        """Keep the new state alive and serialize it."""
+        new_state = event.data["new_state"]
+        new_state.as_dict_json()
+        new_state.as_compressed_state_json()
+        states.append(new_state)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    await hass.async_block_till_done()
+
+    tracemalloc.start()
+    start = timer()
+
+    for idx in range(10):
+        new_state = "cool" if idx % 2 else "heat_cool"
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, new_state, dict(attributes))
+        await hass.async_block_till_done()
+
+    runtime = timer() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(states) == 10 * len(entity_ids)
+    print(f"Memory allocated for {len(states)} states: {allocated / 2**20:.1f} MiB")
+    return runtime
+
+
+@benchmark
+async def mqtt_retained_message_storm(hass):
+    """Hand off 100k retained MQTT messages from the paho thread."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import MQTT
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.models import MqttData
+
+    messages_to_receive = 10**5
+    count = 0
+    done = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+        if count == messages_to_receive:
+            done.set()
+
+    mqtt_client = MQTT(hass, None, {})
+    # pylint: disable-next=protected-access
+    mqtt_client._mqtt_data = MqttData(client=mqtt_client, config=[])
+    await mqtt_client.async_subscribe("zigbee2mqtt/#", listener, 0)
+
+    messages = []
+    for idx in range(messages_to_receive):
+        msg = MQTTMessage(topic=f"zigbee2mqtt/device_{idx}/state".encode())
+        msg.payload = b'{"state":"ON","linkquality":120}'
+        msg.retain = True
+        messages.append(msg)
+
+    def receive_messages():
+        """Receive the messages like the paho network thread."""
+        for msg in messages:
+            # pylint: disable-next=protected-access
+            mqtt_client._mqtt_on_message(None, None, msg)
+
+    start = timer()
+
+    await hass.async_add_executor_job(receive_messages)
+    await done.wait()
+
+    return timer() - start
+
+
+@benchmark
+async def stream_hls_segment_requests(hass):
+    """Serve synthetic fMP4 segments of 12 cameras to 5 viewers each."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream.core import Part, Segment
+
+    cameras = 12
+    viewers = 5
+    segments_per_camera = 50
+    parts_per_segment = 4
+    # A moov box as init and moof+mdat boxes of 256kB as parts
+    init = b"\x00\x00\x04\x00moov" + bytes(1016)
+    part_data = [
+        (256 * 1024).to_bytes(4, "big") + b"moof" + bytes([idx]) * (256 * 1024 - 8)
+        for idx in range(parts_per_segment)
+    ]
+    served = 0
+
+    start = timer()
+
+    for sequence in range(segments_per_camera):
+        for stream_id in range(cameras):
+            segment = Segment(
+                sequence=sequence,
+                init=init,
+                stream_id=stream_id,
+                start_time=dt_util.utcnow(),
+                stream_outputs=[],
+            )
+            for idx, data in enumerate(part_data, 1):
+                segment.async_add_part(
+                    Part(duration=0.5, has_keyframe=idx == 1, data=data),
+                    idx * 0.5 if idx == parts_per_segment else 0,
+                )
+            for _ in range(viewers):
+                # LL-HLS viewers fetch the parts, others the whole segment
+                for part in segment.parts:
+                    served += len(part.data)
+                served += len(segment.get_data())
+            # The stream recorder reads the segment with its init
+            served += len(segment.get_data_with_init())
+
+    assert served
+    return timer() - start
+
+
+@benchmark
+async def entity_write_ha_state(hass):
+    """Write the state of 2000 sensors 50 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.sensor import (
+        SensorDeviceClass,
+        SensorEntity,
+        SensorStateClass,
+    )
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    # pylint: enable=import-outside-toplevel
+
+    class BenchmarkSensor(SensorEntity):
+        """A temperature sensor."""
+
+        _attr_attribution = "Data provided by the benchmark"
+        _attr_device_class = SensorDeviceClass.TEMPERATURE
+        _attr_has_entity_name = True
+        _attr_native_unit_of_measurement = "°C"
+        _attr_state_class = SensorStateClass.MEASUREMENT
+
+        def __init__(self, idx: int) -> None:
+            """Initialize the sensor."""
+            self._attr_name = f"Temperature {idx}"
+            self._attr_native_value = 0
+
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    entities = [BenchmarkSensor(idx) for idx in range(2000)]
+    for idx, entity in enumerate(entities):
+        entity.hass = hass
+        entity.platform = platform
+        entity.entity_id = f"sensor.benchmark_{idx}"
+
+    start = timer()
+
+    for value in range(50):
+        for entity in entities:
+            entity._attr_native_value = value  # pylint: disable=protected-access
+            entity.async_write_ha_state()
+
+    return timer() - start
+
+
+def _compile_sensor_statistics(sensors_count):
+    """Calculate mean, min and max over five minutes of states for many sensors."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder.models.state import LazyState
+    from homeassistant.components.sensor import recorder
+
+    # pylint: enable=import-outside-toplevel
+
+    end = dt_util.utcnow()
+    start = end - timedelta(minutes=5)
+    entities_fstates = []
+    for idx in range(sensors_count):
+        entity_id = f"sensor.benchmark_{idx}"
+        # The statistics are compiled from the states read by the recorder
+        entities_fstates.append(
+            [
+                (
+                    float(second % 17),
+                    LazyState(
+                        None,
+                        {},
+                        None,
+                        entity_id,
+                        str(second % 17),
+                        (start + timedelta(seconds=second)).timestamp(),
+                        True,
+                    ),
+                )
+                for second in range(0, 300, 5)
+            ]
+        )
+
+    start_time = timer()
+    # pylint: disable-next=protected-access
+    recorder._time_weighted_averages_min_max(entities_fstates, start, end)
+    return timer() - start_time
+
+
+@benchmark
+async def compile_sensor_statistics_1k(hass):
+    """Compile sensor statistics for 1k sensors."""
+    return _compile_sensor_statistics(1000)
+
+
+@benchmark
+async def compile_sensor_statistics_5k(hass):
+    """Compile sensor statistics for 5k sensors."""
+    return _compile_sensor_statistics(5000)
+
+
+@benchmark
+async def compile_sensor_statistics_10k(hass):
+    """Compile sensor statistics for 10k sensors."""
+    return _compile_sensor_statistics(10000)
+
+
+@benchmark
+async def statistics_sensor_window(hass):
+    """Update statistics sensors with 5000 samples 5000 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    start = dt_util.utcnow()
+    states = [
+        core.State(
+            "sensor.benchmark",
+            str((second * 7919) % 1000 / 10),
+            last_updated=start + timedelta(seconds=second),
+        )
+        for second in range(10000)
+    ]
+    sensors = [
+        StatisticsSensor(
+            "sensor.benchmark",
+            characteristic,
+            None,
+            characteristic,
+            5000,
+            None,
+            2,
+            90,
+        )
+        for characteristic in (
+            "average_linear",
+            "mean",
+            "percentile",
+            "standard_deviation",
+            "value_max",
+        )
+    ]
+    for sensor in sensors:
+        sensor.hass = hass
+        sensor.entity_id = f"sensor.statistics_{sensor.name}"
+        # pylint: disable-next=protected-access
+        sensor._derive_unit_of_measurement = lambda new_state: None
+        for state in states[:5000]:
+            sensor._add_state_to_queue(state)  # pylint: disable=protected-access
+
+    start_time = timer()
+    for state in states[5000:]:
+        for sensor in sensors:
+            sensor._add_state_to_queue(state)  # pylint: disable=protected-access
+            sensor._update_value()  # pylint: disable=protected-access
+    return timer() - start_time
+
+
+@benchmark
+async def template_compile_bytecode_cache(hass):
+    """Compile 4000 templates with the bytecode cache of a previous run."""
+    sources = [
+        f"{{% if is_state('light.room_{idx}', 'on') %}}"
+        f"{{{{ states('sensor.power_{idx}') | float(0) * {idx} | round(2) }}}}"
+        f"{{% else %}}{{{{ state_attr('light.room_{idx}', 'brightness') }}}}"
+        "{% endif %}"
+        for idx in range(4000)
+    ]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await template.async_load_bytecode_cache(hass)
+
+        env = template.TemplateEnvironment(hass)
+        start = timer()
+        for source in sources:
+            env.compile(source)
+        print(f"Compiled without the bytecode cache in {timer() - start}s")
+
+        # Write the cache like on shutdown and load it like on the next start
+        await hass.async_block_till_done()
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        await template.async_load_bytecode_cache(hass)
+
+        env = template.TemplateEnvironment(hass)
+        start = timer()
+        for source in sources:
+            env.compile(source)
+        return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
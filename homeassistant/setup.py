@@ -54,6 +54,12 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_SETUP_TIMELINE is a dict [str, dict[str, Any]], indicating when bootstrap
+# started and finished setting up an integration, in seconds since bootstrap
+# started setting up integrations, and the chain of integrations it had to wait
+# for before its setup could start.
+DATA_SETUP_TIMELINE = "setup_timeline"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 SLOW_SETUP_WARNING = 10
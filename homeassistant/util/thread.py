@@ -1,12 +1,20 @@
 """Threading util helpers."""
+from __future__ import annotations
+
+from collections.abc import Callable
 import ctypes
 import inspect
 import logging
+import queue
 import threading
+import time
 from typing import Any
 
 THREADING_SHUTDOWN_TIMEOUT = 10
 
+# How long a worker waits for an interrupt which raced with its job finishing
+INTERRUPT_DELIVERY_TIMEOUT = 0.1
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -51,6 +59,11 @@ def async_raise(tid: int, exctype: Any) -> None:
     raise SystemError("PyThreadState_SetAsyncExc failed")
 
 
+def async_clear(tid: int) -> None:
+    """Clear an exception raised with async_raise which was not delivered yet."""
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(tid), None)
+
+
 class ThreadWithException(threading.Thread):
     """A thread class that supports raising exception in the thread from another thread.
 
@@ -63,3 +76,164 @@ class ThreadWithException(threading.Thread):
         """Raise the given exception type in the context of this thread."""
         assert self.ident
         async_raise(self.ident, exctype)
+
+
+class JobInterrupted(BaseException):
+    """Raised in a worker thread when the job it is running is interrupted.
+
+    This derives from BaseException so code that catches Exception in the
+    interrupted job does not swallow it.
+    """
+
+
+class InterruptibleJob:
+    """A job submitted to an InterruptibleThreadPool."""
+
+    __slots__ = ("target", "thread_id", "interrupted", "done", "submitted")
+
+    def __init__(self, target: Callable[[], None]) -> None:
+        """Initialize the job."""
+        self.target = target
+        self.thread_id: int | None = None
+        self.interrupted = False
+        self.done = False
+        self.submitted = time.monotonic()
+
+
+class InterruptibleThreadPool:
+    """A small pool of long-lived threads whose running jobs can be interrupted.
+
+    Jobs are interrupted by raising JobInterrupted in the worker thread that
+    runs them, the same way ThreadWithException does, without tearing down
+    the worker so it can be reused for the next job.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        """Initialize the pool."""
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._queue: queue.SimpleQueue[InterruptibleJob | None] = queue.SimpleQueue()
+        self._idle_semaphore = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._running: set[InterruptibleJob] = set()
+        self._shutdown = False
+        self.threads_created = 0
+        self.jobs_run = 0
+        self.jobs_interrupted = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def submit(self, target: Callable[[], None]) -> InterruptibleJob:
+        """Run target in a worker thread."""
+        job = InterruptibleJob(target)
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit jobs after shutdown")
+            self._queue.put(job)
+            if self._idle_semaphore.acquire(  # pylint: disable=consider-using-with
+                timeout=0
+            ):
+                return job
+            if len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+                self.threads_created += 1
+        return job
+
+    def interrupt(self, job: InterruptibleJob) -> bool:
+        """Interrupt a queued or running job.
+
+        Returns True if the job had not finished yet.
+        """
+        with self._lock:
+            if job.done or job.interrupted:
+                return False
+            job.interrupted = True
+            self.jobs_interrupted += 1
+            if job.thread_id is not None:
+                async_raise(job.thread_id, JobInterrupted)
+        return True
+
+    def shutdown(self) -> None:
+        """Interrupt running jobs and stop the worker threads.
+
+        This method blocks until the workers have exited.
+        """
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+            self._threads.clear()
+            running = list(self._running)
+        for job in running:
+            self.interrupt(job)
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(THREADING_SHUTDOWN_TIMEOUT)
+
+    def stats(self) -> dict[str, Any]:
+        """Return statistics about the pool."""
+        return {
+            "threads_created": self.threads_created,
+            "threads_alive": len(self._threads),
+            "jobs_run": self.jobs_run,
+            "jobs_interrupted": self.jobs_interrupted,
+            "total_latency": self.total_latency,
+            "max_latency": self.max_latency,
+        }
+
+    def _worker(self) -> None:
+        """Run jobs until shutdown."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            self._run_job(job)
+            self._idle_semaphore.release()
+
+    def _run_job(self, job: InterruptibleJob) -> None:
+        """Run a single job, absorbing any interrupt aimed at it."""
+        with self._lock:
+            if job.interrupted:
+                job.done = True
+                return
+            job.thread_id = threading.get_ident()
+            self._running.add(job)
+        try:
+            try:
+                job.target()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running job %s", job.target)
+            with self._lock:
+                interrupted = self._finish_job(job)
+            if interrupted:
+                # The interrupt raced with the job finishing; wait for it to
+                # be delivered here, and clear it if it was not delivered in
+                # time, so it cannot escape into the worker loop
+                deadline = time.monotonic() + INTERRUPT_DELIVERY_TIMEOUT
+                while time.monotonic() < deadline:
+                    time.sleep(0.001)
+                async_clear(threading.get_ident())
+        except JobInterrupted:
+            with self._lock:
+                if not job.done:
+                    self._finish_job(job)
+
+    def _finish_job(self, job: InterruptibleJob) -> bool:
+        """Mark a job done and record its latency, must hold the lock.
+
+        Returns True if the job was interrupted.
+        """
+        job.done = True
+        self._running.discard(job)
+        latency = time.monotonic() - job.submitted
+        self.jobs_run += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        return job.interrupted
@@ -1,12 +1,15 @@
 """Custom loader."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterator
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Any, TextIO, TypeVar, overload
 
 import yaml
@@ -33,6 +36,14 @@ _DictT = TypeVar("_DictT", bound=dict)
 
 _LOGGER = logging.getLogger(__name__)
 
+# The maximum total size in bytes of the YAML files
+# whose node trees are kept in the node cache
+NODE_CACHE_MAX_SIZE = 16 * 1024 * 1024
+# Files modified more recently than this are not cached, a file written again
+# within the timestamp granularity of the file system may keep the same
+# modification time and size
+NODE_CACHE_MIN_AGE_NS = 2_000_000_000
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -156,16 +167,165 @@ class SafeLineLoader(yaml.SafeLoader):
 LoaderType = SafeLineLoader | SafeLoader
 
 
+class NodeCache:
+    """Cache the composed node trees of YAML files.
+
+    Entries are keyed by the path of the file and are only used while
+    the modification time and size of the file are unchanged. The node
+    trees are composed before any tag is constructed, so they do not
+    depend on the included files, the secrets or the environment,
+    which are resolved again every time a tree is constructed.
+
+    The least recently used entries are evicted once the total size of
+    the cached files exceeds max_size.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the node cache."""
+        self.max_size = max_size
+        self._size = 0
+        self._entries: OrderedDict[
+            str,
+            tuple[
+                tuple[int, int],
+                type[SafeLoader] | type[SafeLineLoader],
+                yaml.nodes.Node | None,
+            ],
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, fname: str, stat: os.stat_result
+    ) -> tuple[type[SafeLoader] | type[SafeLineLoader], yaml.nodes.Node | None] | None:
+        """Return the loader and node tree of an unchanged file."""
+        with self._lock:
+            if (entry := self._entries.get(fname)) is None:
+                return None
+            if entry[0] != (stat.st_mtime_ns, stat.st_size):
+                self._remove(fname)
+                return None
+            self._entries.move_to_end(fname)
+            return entry[1], entry[2]
+
+    def set(
+        self,
+        fname: str,
+        stat: os.stat_result,
+        loader: type[SafeLoader] | type[SafeLineLoader],
+        node: yaml.nodes.Node | None,
+    ) -> None:
+        """Cache the loader and node tree of a file."""
+        if stat.st_size > self.max_size:
+            return
+        with self._lock:
+            if fname in self._entries:
+                self._remove(fname)
+            self._entries[fname] = ((stat.st_mtime_ns, stat.st_size), loader, node)
+            self._size += stat.st_size
+            while self._size > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, fname: str) -> None:
+        """Remove an entry, the lock must be held."""
+        self._size -= self._entries.pop(fname)[0][1]
+
+
+_NODE_CACHE = NodeCache(NODE_CACHE_MAX_SIZE)
+
+
+def clear_node_cache() -> None:
+    """Clear the cache of parsed YAML files."""
+    _NODE_CACHE.clear()
+
+
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            return _load_yaml_file(fname, conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
 
+def _load_yaml_file(
+    fname: str, conf_file: TextIO, secrets: Secrets | None = None
+) -> JSON_TYPE:
+    """Load an open YAML file, reusing its node tree if it did not change."""
+    try:
+        stat = os.fstat(conf_file.fileno())
+    except (AttributeError, OSError):
+        # Not backed by a real file so there is nothing to key the cache on
+        return parse_yaml(conf_file, secrets)
+
+    if (cached := _NODE_CACHE.get(fname, stat)) is None:
+        cached = _compose_yaml(conf_file)
+        if time.time_ns() - stat.st_mtime_ns >= NODE_CACHE_MIN_AGE_NS:
+            _NODE_CACHE.set(fname, stat, *cached)
+
+    loader, node = cached
+    try:
+        return _construct_yaml(loader, fname, node, secrets)
+    except yaml.YAMLError as exc:
+        if loader is SafeLineLoader:
+            _LOGGER.error(str(exc))
+            raise HomeAssistantError(exc) from exc
+        # Constructing failed, so we now load with the slow line loader
+        # since the C one will not give us line numbers
+        conf_file.seek(0, 0)
+        return _parse_yaml_pure_python(conf_file, secrets)
+
+
+def _compose_yaml(
+    content: TextIO,
+) -> tuple[type[SafeLoader] | type[SafeLineLoader], yaml.nodes.Node | None]:
+    """Compose the node tree of a YAML file with the fastest available loader."""
+    if HAS_C_LOADER:
+        loader = SafeLoader(content)
+        try:
+            return SafeLoader, loader.get_single_node()
+        except yaml.YAMLError:
+            # Composing failed, so we now compose with the slow line loader
+            # since the C one will not give us line numbers
+            content.seek(0, 0)
+        finally:
+            loader.dispose()
+    line_loader = SafeLineLoader(content)
+    try:
+        return SafeLineLoader, line_loader.get_single_node()
+    except yaml.YAMLError as exc:
+        _LOGGER.error(str(exc))
+        raise HomeAssistantError(exc) from exc
+    finally:
+        line_loader.dispose()
+
+
+def _construct_yaml(
+    loader: type[SafeLoader] | type[SafeLineLoader],
+    fname: str,
+    node: yaml.nodes.Node | None,
+    secrets: Secrets | None = None,
+) -> JSON_TYPE:
+    """Construct the data of a composed YAML node tree."""
+    # If configuration file is empty YAML returns None
+    # We convert that to an empty dict
+    if node is None:
+        return NodeDictClass()
+    stream = StringIO()
+    stream.name = fname
+    constructor = loader(stream, secrets)
+    try:
+        return constructor.construct_document(node) or NodeDictClass()
+    finally:
+        constructor.dispose()
+
+
 def parse_yaml(
     content: str | TextIO | StringIO, secrets: Secrets | None = None
 ) -> JSON_TYPE:
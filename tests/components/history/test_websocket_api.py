@@ -1,6 +1,7 @@
 """The tests the History component websocket_api."""
 import asyncio
 from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -8,6 +9,7 @@ import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
+from homeassistant.components.history.const import HISTORY_MIN_BATCH_SIZE
 from homeassistant.components.recorder import Recorder
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
@@ -401,6 +403,132 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric series with max_points."""
+    start = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for second in range(100):
+        state = str(second % 10)
+        if second == 42:
+            state = "unavailable"
+        elif second == 77:
+            state = "1000"
+        with freeze_time(start + timedelta(seconds=second)):
+            hass.states.async_set("sensor.power", state)
+            hass.states.async_set("sensor.mode", "on" if second % 2 else "off")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": (start - timedelta(seconds=1)).isoformat(),
+            "end_time": (start + timedelta(seconds=100)).isoformat(),
+            "entity_ids": ["sensor.power", "sensor.mode"],
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    power_history = response["result"]["sensor.power"]
+    assert len(power_history) <= 16
+    states = [state["s"] for state in power_history]
+    assert states[0] == "0"
+    assert states[-1] == "9"
+    assert "unavailable" in states
+    assert "1000" in states
+    last_updated = [state["lu"] for state in power_history]
+    assert last_updated == sorted(last_updated)
+    # Non numeric series are not downsampled
+    assert len(response["result"]["sensor.mode"]) == 100
+
+
+async def test_history_during_period_batches(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends the states in batches."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    last_updated: dict[str, list[float]] = {"sensor.one": [], "sensor.two": []}
+    states = [str(state) for state in range(HISTORY_MIN_BATCH_SIZE + 1)]
+    for state in states:
+        for entity_id, timestamps in last_updated.items():
+            hass.states.async_set(entity_id, state)
+            timestamps.append(hass.states.get(entity_id).last_updated.timestamp())
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "batch_size": HISTORY_MIN_BATCH_SIZE,
+        }
+    )
+    events = [await client.receive_json() for _ in range(4)]
+    assert all(event["id"] == 1 and event["type"] == "event" for event in events)
+    assert [event["event"] for event in events] == [
+        {
+            "states": {
+                entity_id: [
+                    {"lu": timestamp, "s": state}
+                    for timestamp, state in zip(timestamps[start:end], states[start:])
+                ]
+            }
+        }
+        for entity_id, timestamps in last_updated.items()
+        for start, end in (
+            (0, HISTORY_MIN_BATCH_SIZE),
+            (HISTORY_MIN_BATCH_SIZE, HISTORY_MIN_BATCH_SIZE + 1),
+        )
+    ]
+    response = await client.receive_json()
+    assert response["id"] == 1
+    assert response["success"]
+    assert response["result"] == {}
+
+
+async def test_history_during_period_batch_size_too_small(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period rejects batches that are too small."""
+    await async_setup_component(hass, "history", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": dt_util.utcnow().isoformat(),
+            "entity_ids": ["sensor.one"],
+            "batch_size": HISTORY_MIN_BATCH_SIZE - 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_bad_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -523,6 +651,65 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_batches(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends the historical states in batches."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    last_updated: dict[str, list[float]] = {"sensor.one": [], "sensor.two": []}
+    states = [str(state) for state in range(HISTORY_MIN_BATCH_SIZE + 1)]
+    for state in states:
+        for entity_id, timestamps in last_updated.items():
+            hass.states.async_set(entity_id, state)
+            timestamps.append(hass.states.get(entity_id).last_updated.timestamp())
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "batch_size": HISTORY_MIN_BATCH_SIZE,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    def _states(entity_id: str, start: int, end: int | None) -> list[dict[str, Any]]:
+        return [
+            {"lu": timestamp, "s": state}
+            for timestamp, state in zip(
+                last_updated[entity_id][start:end], states[start:end]
+            )
+        ]
+
+    events = [(await client.receive_json())["event"] for _ in range(4)]
+    assert events[:3] == [
+        {"states": {"sensor.one": _states("sensor.one", 0, HISTORY_MIN_BATCH_SIZE)}},
+        {"states": {"sensor.one": _states("sensor.one", HISTORY_MIN_BATCH_SIZE, None)}},
+        {"states": {"sensor.two": _states("sensor.two", 0, HISTORY_MIN_BATCH_SIZE)}},
+    ]
+    assert events[3] == {
+        "end_time": last_updated["sensor.two"][-1],
+        "start_time": now.timestamp(),
+        "states": {"sensor.two": _states("sensor.two", HISTORY_MIN_BATCH_SIZE, None)},
+    }
+
+
 async def test_history_stream_significant_domain_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
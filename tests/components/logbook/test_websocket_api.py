@@ -11,6 +11,7 @@ from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.queries import statement_for_request
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -295,6 +296,202 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_reuses_settled_events(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events only selects events which are not settled yet."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    with freeze_time(now - timedelta(hours=1)):
+        hass.states.async_set("light.kitchen", STATE_OFF)
+        await hass.async_block_till_done()
+        hass.states.async_set("light.kitchen", STATE_ON)
+        await hass.async_block_till_done()
+    with freeze_time(now - timedelta(minutes=30)):
+        hass.states.async_set("light.kitchen", STATE_OFF)
+        await hass.async_block_till_done()
+    with freeze_time(now):
+        hass.states.async_set("light.kitchen", STATE_ON)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    start_time = now - timedelta(hours=2)
+    settled_time = now - timedelta(minutes=5)
+
+    with freeze_time(now), patch(
+        "homeassistant.components.logbook.processor.statement_for_request",
+        wraps=statement_for_request,
+    ) as mock_statement_for_request:
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/get_events",
+                "start_time": start_time.isoformat(),
+                "end_time": (now + timedelta(seconds=1)).isoformat(),
+                "entity_ids": ["light.kitchen"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        results = response["result"]
+        assert [result["state"] for result in results] == ["on", "off", "on"]
+        assert [
+            call.args[:2] for call in mock_statement_for_request.call_args_list
+        ] == [
+            (start_time, settled_time + timedelta(seconds=1)),
+            (settled_time, now + timedelta(seconds=1)),
+        ]
+        mock_statement_for_request.reset_mock()
+
+        # Only the events which are not settled are selected again
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "logbook/get_events",
+                "start_time": (start_time + timedelta(minutes=1)).isoformat(),
+                "end_time": (now + timedelta(seconds=1)).isoformat(),
+                "entity_ids": ["light.kitchen"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == results
+        assert [
+            call.args[:2] for call in mock_statement_for_request.call_args_list
+        ] == [(settled_time, now + timedelta(seconds=1))]
+        mock_statement_for_request.reset_mock()
+
+        # Settled time windows are answered from the cache
+        await client.send_json(
+            {
+                "id": 3,
+                "type": "logbook/get_events",
+                "start_time": (start_time + timedelta(minutes=1)).isoformat(),
+                "end_time": (now - timedelta(minutes=45)).isoformat(),
+                "entity_ids": ["light.kitchen"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == results[:1]
+        assert not mock_statement_for_request.called
+
+
+async def test_get_events_includes_events_at_cache_end(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events includes events at the end of the cached events."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    with freeze_time(now - timedelta(minutes=10)):
+        hass.states.async_set("light.kitchen", STATE_ON)
+        await hass.async_block_till_done()
+        hass.states.async_set("light.kitchen", STATE_OFF)
+        await hass.async_block_till_done()
+    with freeze_time(now - timedelta(minutes=5)):
+        hass.states.async_set("light.kitchen", STATE_ON)
+        await hass.async_block_till_done()
+    with freeze_time(now - timedelta(minutes=4)):
+        hass.states.async_set("light.kitchen", STATE_OFF)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    start_time = now - timedelta(hours=1)
+
+    # The cached events end exactly at the second event
+    for msg_id, frozen_time in enumerate((now, now + timedelta(minutes=1)), 1):
+        with freeze_time(frozen_time):
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "logbook/get_events",
+                    "start_time": start_time.isoformat(),
+                    "end_time": (now + timedelta(seconds=1)).isoformat(),
+                    "entity_ids": ["light.kitchen"],
+                }
+            )
+            response = await client.receive_json()
+        assert response["success"]
+        assert [result["state"] for result in response["result"]] == [
+            "off",
+            "on",
+            "off",
+        ]
+
+
+async def test_get_events_does_not_cache_large_windows(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events does not cache windows with too many events."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    with freeze_time(now - timedelta(hours=1)):
+        hass.states.async_set("light.kitchen", STATE_ON)
+        await hass.async_block_till_done()
+        hass.states.async_set("light.kitchen", STATE_OFF)
+        await hass.async_block_till_done()
+        hass.states.async_set("light.kitchen", STATE_ON)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    start_time = now - timedelta(hours=2)
+    end_time = now - timedelta(minutes=30)
+
+    with freeze_time(now), patch(
+        "homeassistant.components.logbook.processor.LOGBOOK_CACHE_MAX_EVENTS", 1
+    ), patch(
+        "homeassistant.components.logbook.processor.statement_for_request",
+        wraps=statement_for_request,
+    ) as mock_statement_for_request:
+        for msg_id in (1, 2):
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "logbook/get_events",
+                    "start_time": start_time.isoformat(),
+                    "end_time": end_time.isoformat(),
+                    "entity_ids": ["light.kitchen"],
+                }
+            )
+            response = await client.receive_json()
+            assert response["success"]
+            assert [result["state"] for result in response["result"]] == [
+                "off",
+                "on",
+            ]
+        # The events are selected from the database for every request
+        assert [
+            call.args[:2] for call in mock_statement_for_request.call_args_list
+        ] == [
+            (start_time, end_time + timedelta(seconds=1)),
+            (start_time, end_time),
+        ]
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -48,6 +48,7 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [],
         "mqtt_config": default_config,
+        "message_queue": {"depth": 0, "max_depth": 0, "max_latency": 0.0},
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
 
@@ -132,6 +133,7 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": default_config,
+        "message_queue": {"depth": 0, "max_depth": 0, "max_latency": 0.0},
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -141,6 +143,7 @@ async def test_entry_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": default_config,
+        "message_queue": {"depth": 0, "max_depth": 0, "max_latency": 0.0},
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -259,6 +262,7 @@ async def test_redact_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": expected_config,
+        "message_queue": {"depth": 0, "max_depth": 0, "max_latency": 0.0},
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -268,5 +272,6 @@ async def test_redact_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": expected_config,
+        "message_queue": {"depth": 0, "max_depth": 0, "max_latency": 0.0},
         "mqtt_debug_info": expected_debug_info,
     }
@@ -13,7 +13,11 @@ import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -1277,6 +1281,127 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0].payload == "test-payload"
 
 
+def test_subscription_trie() -> None:
+    """Test matching, adding and removing subscriptions in the trie."""
+    trie = SubscriptionTrie()
+    job = ha.HassJob(lambda msg: None)
+    subscriptions = {
+        topic: Subscription(topic, job)
+        for topic in (
+            "home/+/state",
+            "home/#",
+            "home/+/+",
+            "+/kitchen/state",
+            "#",
+            "$SYS/#",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+    other = Subscription("home/#", job)
+    trie.add(other)
+
+    def matching(topic: str) -> set[str]:
+        return {subscription.topic for subscription in trie.match(topic)}
+
+    assert matching("home/kitchen/state") == {
+        "home/+/state",
+        "home/#",
+        "home/+/+",
+        "+/kitchen/state",
+        "#",
+    }
+    assert matching("home") == {"home/#", "#"}
+    assert matching("home/kitchen") == {"home/#", "#"}
+    assert matching("office/kitchen/state") == {"+/kitchen/state", "#"}
+    assert matching("$SYS/broker/uptime") == {"$SYS/#"}
+    assert len(trie.match("home/kitchen")) == 3
+    assert trie.has_topic("home/+/state")
+    assert not trie.has_topic("home/+")
+    assert not trie.has_topic("home/+/state/extra")
+    assert set(trie) == {*subscriptions.values(), other}
+
+    trie.remove(subscriptions["home/#"])
+    assert matching("home/kitchen") == {"home/#", "#"}
+    trie.remove(other)
+    assert matching("home/kitchen") == {"#"}
+    for topic in ("home/+/state", "home/+/+", "+/kitchen/state", "#", "$SYS/#"):
+        trie.remove(subscriptions[topic])
+    assert not list(trie)
+    assert not trie._root.children
+
+    with pytest.raises(KeyError):
+        trie.remove(other)
+
+
+async def test_messages_handed_off_in_batches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test received messages are handled in order in batches."""
+    mqtt_mock = await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    with patch(
+        "homeassistant.components.mqtt.client.MAX_MESSAGES_PER_BATCH", 10
+    ), patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as call_soon_threadsafe:
+        for index in range(25):
+            msg = ReceiveMessage(
+                f"test-topic/{index % 3}", str(index).encode(), 0, False
+            )
+            mqtt_client_mock.on_message(mqtt_client_mock, None, msg)
+        assert mqtt_mock.message_queue_diagnostics()["depth"] == 25
+        await asyncio.sleep(0)
+        assert len(calls) == 10
+        await asyncio.sleep(0)
+        assert len(calls) == 20
+        await hass.async_block_till_done()
+
+    assert call_soon_threadsafe.call_count == 1
+    assert [msg.payload for msg in calls] == [str(index) for index in range(25)]
+    diagnostics = mqtt_mock.message_queue_diagnostics()
+    assert diagnostics["depth"] == 0
+    assert diagnostics["max_depth"] == 25
+    assert diagnostics["max_latency"] > 0
+
+
+async def test_messages_handled_after_failing_subscriber(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test messages are still handled after a subscriber raised."""
+    await mqtt_mock_entry()
+
+    @callback
+    def failing_callback(msg: ReceiveMessage) -> None:
+        raise ValueError("subscriber failed")
+
+    await mqtt.async_subscribe(hass, "test-topic/fail", failing_callback)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    for topic in ("test-topic/fail", "test-topic/ok"):
+        mqtt_client_mock.on_message(
+            mqtt_client_mock, None, ReceiveMessage(topic, b"1", 0, False)
+        )
+    await hass.async_block_till_done()
+    assert "Error handling message on test-topic/fail" in caplog.text
+
+    mqtt_client_mock.on_message(
+        mqtt_client_mock, None, ReceiveMessage("test-topic/later", b"2", 0, False)
+    )
+    await hass.async_block_till_done()
+    assert [msg.topic for msg in calls] == ["test-topic/ok", "test-topic/later"]
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
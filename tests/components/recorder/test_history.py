@@ -27,7 +27,10 @@ from homeassistant.components.recorder.models.legacy import (
     LegacyLazyState,
     LegacyLazyStatePreSchema31,
 )
-from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.recorder.util import (
+    execute_stmt_lambda_element,
+    session_scope,
+)
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.json import JSONEncoder
@@ -522,6 +525,49 @@ def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+def test_get_significant_states_batches(
+    hass_recorder: Callable[..., HomeAssistant], minimal_response: bool
+) -> None:
+    """Test significant states batches match the significant states."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids=list(states),
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+    with patch(
+        "homeassistant.components.recorder.history.modern.execute_stmt_lambda_element",
+        wraps=execute_stmt_lambda_element,
+    ) as execute_mock:
+        batches = list(
+            history.get_significant_states_batches(
+                hass,
+                zero,
+                four,
+                list(states),
+                True,
+                True,
+                minimal_response,
+                False,
+                True,
+                1,
+            )
+        )
+    # The rows are streamed from the database
+    assert execute_mock.call_args.kwargs["stream"] is True
+    assert all(len(batch) == 1 for _, batch in batches)
+    assert len(batches) == sum(len(entity_states) for entity_states in hist.values())
+    hist_from_batches: dict[str, list] = {}
+    for entity_id, batch in batches:
+        hist_from_batches.setdefault(entity_id, []).extend(batch)
+    assert hist_from_batches == hist
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 def test_get_significant_states_with_initial(
     time_zone, hass_recorder: Callable[..., HomeAssistant]
@@ -378,6 +378,9 @@ def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
+    # States are only in the session when using the ORM path
+    get_instance(hass)._bulk_insert_states = False
+
     def _throw_if_state_in_session(*args, **kwargs):
         for obj in get_instance(hass).event_session:
             if isinstance(obj, States):
@@ -408,6 +411,44 @@ def test_saving_state_with_exception(
     assert "Error saving events" not in caplog.text
 
 
+def test_saving_state_with_exception_during_bulk_insert(
+    hass_recorder: Callable[..., HomeAssistant],
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test saving a state when the bulk insert of the states fails."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+
+    entity_id = "test.recorder"
+    state = "restoring_from_db"
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    with patch("time.sleep"), patch.object(
+        instance.states_manager,
+        "write_bulk_pending",
+        side_effect=OperationalError(
+            "insert the state", "fake params", "forced to fail"
+        ),
+    ):
+        hass.states.set(entity_id, "fail", attributes)
+        wait_recording_done(hass)
+
+    assert "Error executing query" in caplog.text
+
+    caplog.clear()
+    hass.states.set(entity_id, state, attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 1
+        assert db_states[0].state == state
+
+    assert "Error executing query" not in caplog.text
+    assert "Error saving events" not in caplog.text
+
+
 def test_saving_state_with_sqlalchemy_exception(
     hass_recorder: Callable[..., HomeAssistant],
     hass: HomeAssistant,
@@ -420,6 +461,9 @@ def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
+    # States are only in the session when using the ORM path
+    get_instance(hass)._bulk_insert_states = False
+
     def _throw_if_state_in_session(*args, **kwargs):
         for obj in get_instance(hass).event_session:
             if isinstance(obj, States):
@@ -1391,6 +1435,57 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_insert_states", (True, False))
+def test_saving_sets_old_state_in_same_commit(
+    hass_recorder: Callable[..., HomeAssistant], bulk_insert_states: bool
+) -> None:
+    """Test saving links old states that are written in the same commit."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+    assert instance._bulk_insert_states is True
+    instance._bulk_insert_states = bulk_insert_states
+
+    hass.states.set("test.one", "s1", {"attr": 1})
+    wait_recording_done(hass)
+    with patch.object(instance, "_commit_event_session_or_retry"):
+        hass.states.set("test.one", "s2", {"attr": 2})
+        hass.states.set("test.two", "s3", {"attr": 2})
+        hass.states.set("test.one", "s4", {"attr": 2})
+        hass.states.set("test.one", "s5", {"attr": 3})
+        hass.states.remove("test.two")
+        wait_recording_done(hass)
+    wait_recording_done(hass)
+
+    assert instance.commit_events_per_second is not None
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id is None
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state[None].entity_id == "test.two"
+        assert states_by_state[None].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s3"].shared_attrs == '{"attr":2}'
+        assert states_by_state["s4"].shared_attrs == '{"attr":2}'
+        assert states_by_state["s5"].shared_attrs == '{"attr":3}'
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -2205,6 +2300,7 @@ async def test_connect_args_priority(hass: HomeAssistant, config_url) -> None:
 
         __bases__ = []
         _has_events = False
+        insert_executemany_returning_sort_by_parameter_order = False
 
         def __init__(*args, **kwargs):
             ...
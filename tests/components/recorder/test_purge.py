@@ -2,6 +2,7 @@
 from datetime import datetime, timedelta
 import json
 import sqlite3
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -12,6 +13,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder import purge, queries
 from homeassistant.components.recorder.const import (
+    PURGE_CURSOR_STORAGE_KEY,
     SQLITE_MAX_BIND_VARS,
     SupportedDialect,
 )
@@ -47,6 +49,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
+from tests.common import async_fire_time_changed
 from tests.typing import RecorderInstanceGenerator
 
 TEST_EVENT_TYPES = (
@@ -1654,6 +1657,130 @@ async def test_purge_many_old_events(
             assert events.count() == 0
 
 
+async def test_purge_runs_are_throttled_and_resumed(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test an unfinished purge reports progress and is resumed after a restart."""
+    with patch.object(queries, "SQLITE_MAX_BIND_VARS", 1), patch.object(
+        purge, "SQLITE_MAX_BIND_VARS", 1
+    ):
+        instance = await async_setup_recorder_instance(hass)
+        await _add_test_states(hass)
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        instance.purge_progress = purge.PurgeProgress(
+            purge_before, False, False, states_batch_size=1, events_batch_size=1
+        )
+
+        with patch.object(instance, "queue_task") as queue_task:
+            PurgeTask(purge_before, False, False).run(instance)
+        assert queue_task.call_args[0][0] == PurgeTask(purge_before, False, False)
+        progress = instance.purge_progress
+        assert progress.runs == 1
+        assert progress.states_purged == 1
+        # The run was fast so the next one is larger
+        assert progress.states_batch_size == 2
+        await async_wait_recording_done(hass)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert hass_storage[PURGE_CURSOR_STORAGE_KEY]["data"] == {
+            "purge_before": purge_before.isoformat(),
+            "repack": False,
+            "apply_filter": False,
+        }
+
+        # Restart in the middle of the purge
+        instance.purge_progress = None
+        with patch.object(instance, "queue_task") as queue_task:
+            await instance._async_resume_purge()
+        assert queue_task.call_args[0][0] == PurgeTask(purge_before, False, False)
+        assert instance.purge_progress.cursor_saved
+
+        with patch.object(instance, "queue_task") as queue_task:
+            PurgeTask(purge_before, False, False).run(instance)
+        assert queue_task.call_count == 0
+        assert instance.purge_progress is None
+        await async_wait_recording_done(hass)
+        assert PURGE_CURSOR_STORAGE_KEY not in hass_storage
+
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 2
+
+
+async def test_purge_runs_merge_purges(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test a resumed purge and a nightly purge share their progress."""
+    with patch.object(queries, "SQLITE_MAX_BIND_VARS", 1), patch.object(
+        purge, "SQLITE_MAX_BIND_VARS", 1
+    ):
+        instance = await async_setup_recorder_instance(hass)
+        await _add_test_states(hass)
+        resumed_purge_before = dt_util.utcnow() - timedelta(days=5)
+        nightly_purge_before = dt_util.utcnow() - timedelta(days=4)
+        instance.purge_progress = progress = purge.PurgeProgress(
+            resumed_purge_before,
+            False,
+            False,
+            states_batch_size=1,
+            events_batch_size=1,
+            cursor_saved=True,
+        )
+
+        # The nightly purge takes over the progress of the resumed purge
+        with patch.object(instance, "queue_task") as queue_task:
+            PurgeTask(nightly_purge_before, True, False).run(instance)
+        assert queue_task.call_args[0][0] == PurgeTask(
+            nightly_purge_before, True, False
+        )
+        assert instance.purge_progress is progress
+        assert progress.purge_before == nightly_purge_before
+        assert progress.runs == 1
+        assert progress.states_purged == 1
+        assert progress.states_batch_size == 2
+        await async_wait_recording_done(hass)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert hass_storage[PURGE_CURSOR_STORAGE_KEY]["data"] == {
+            "purge_before": nightly_purge_before.isoformat(),
+            "repack": True,
+            "apply_filter": False,
+        }
+
+        # The resumed purge is covered by the nightly purge
+        with patch.object(instance, "queue_task") as queue_task:
+            PurgeTask(resumed_purge_before, False, True).run(instance)
+        assert queue_task.call_count == 0
+        assert progress.runs == 1
+        assert progress.states_batch_size == 2
+        assert progress.purge_before == nightly_purge_before
+        assert progress.apply_filter is True
+
+
+def test_purge_progress_adjust_batch_sizes() -> None:
+    """Test purge runs are sized to the run time budget and the backlog."""
+    progress = purge.PurgeProgress(dt_util.utcnow(), False, False)
+    progress.adjust_batch_sizes(purge.PURGE_RUN_TIME_BUDGET * 4, False)
+    assert progress.states_batch_size == purge.DEFAULT_STATES_BATCHES_PER_PURGE // 4
+    assert progress.events_batch_size == purge.DEFAULT_EVENTS_BATCHES_PER_PURGE // 4
+
+    progress.adjust_batch_sizes(purge.PURGE_RUN_TIME_BUDGET, False)
+    assert progress.states_batch_size == purge.DEFAULT_STATES_BATCHES_PER_PURGE // 4
+
+    progress.adjust_batch_sizes(0, False)
+    progress.adjust_batch_sizes(0, False)
+    progress.adjust_batch_sizes(0, False)
+    assert progress.states_batch_size == purge.DEFAULT_STATES_BATCHES_PER_PURGE
+    assert progress.events_batch_size == purge.DEFAULT_EVENTS_BATCHES_PER_PURGE
+
+    progress.adjust_batch_sizes(0, True)
+    assert progress.states_batch_size == 1
+    assert progress.events_batch_size == 1
+
+
 async def test_purge_old_events_purges_the_event_type_ids(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
@@ -33,6 +33,11 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
+from homeassistant.components.sensor.recorder import (
+    _datetime_to_us,
+    _time_weighted_averages_min_max,
+    _timestamps_to_us,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
@@ -5193,3 +5198,63 @@ async def test_exclude_attributes(
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+def test_time_weighted_averages_min_max() -> None:
+    """Test the batched time weighted average, min and max calculation."""
+    start = datetime(2023, 9, 1, 12, 0, tzinfo=dt_util.UTC)
+    end = start + timedelta(minutes=5)
+
+    def _fstates(*values_offsets: tuple[float, timedelta]):
+        return [
+            (value, State("sensor.test", str(value), last_updated=start + offset))
+            for value, offset in values_offsets
+        ]
+
+    entities_fstates = [
+        # First state is before the period, so it counts from start
+        _fstates(
+            (10.0, timedelta(minutes=-10)),
+            (20.0, timedelta(minutes=1)),
+            (5.0, timedelta(minutes=4)),
+        ),
+        # First state is within the period, so the period starts with it
+        _fstates((1.0, timedelta(minutes=1)), (3.0, timedelta(minutes=3))),
+        # A single state at the end of the period
+        _fstates((7.0, timedelta(minutes=5))),
+        # Durations which are not whole seconds
+        _fstates(
+            (0.1, timedelta(microseconds=123457)),
+            (0.3, timedelta(seconds=100, microseconds=1)),
+        ),
+    ]
+
+    def _reference_average(fstates):
+        period_start = max(fstates[0][1].last_updated, start)
+        accumulated = 0.0
+        old_fstate, old_time = fstates[0][0], period_start
+        for fstate, state in fstates[1:]:
+            accumulated += old_fstate * (state.last_updated - old_time).total_seconds()
+            old_fstate, old_time = fstate, state.last_updated
+        accumulated += old_fstate * (end - old_time).total_seconds()
+        return accumulated / (end - period_start).total_seconds()
+
+    results = _time_weighted_averages_min_max(entities_fstates, start, end)
+    assert results == [
+        (_reference_average(entities_fstates[0]), 5.0, 20.0),
+        (_reference_average(entities_fstates[1]), 1.0, 3.0),
+        (0.0, 7.0, 7.0),
+        (_reference_average(entities_fstates[3]), 0.1, 0.3),
+    ]
+    assert results[0][0] == (10.0 * 60 + 20.0 * 180 + 5.0 * 60) / 300
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [1693569600.0, 1693569600.123456, 1693569600.9999995, 1693569600.0000005, 0.5],
+)
+def test_timestamps_to_us(timestamp: float) -> None:
+    """Test timestamps are converted to the microseconds datetime rounds to."""
+    assert _timestamps_to_us([timestamp]) == [
+        _datetime_to_us(dt_util.utc_from_timestamp(timestamp))
+    ]
@@ -0,0 +1,115 @@
+"""Test the aggregates of the statistics sensor."""
+from datetime import datetime, timedelta
+import math
+import random
+import statistics
+
+from homeassistant.components.statistics.aggregates import SampleWindow
+from homeassistant.util import dt as dt_util
+
+
+def _sample_values(rnd: random.Random, count: int) -> list[float]:
+    """Return sample values with repeated and widely ranging values."""
+    values: list[float] = []
+    for _ in range(count):
+        kind = rnd.randrange(4)
+        if kind == 0:
+            values.append(float(rnd.randrange(-3, 4)))
+        elif kind == 1:
+            values.append(rnd.uniform(-1e6, 1e6))
+        elif kind == 2:
+            values.append(rnd.gauss(20.0, 0.1))
+        else:
+            values.append(rnd.choice((0.1, -0.0, 1e-300, 1e150)))
+    return values
+
+
+def test_window_matches_full_computation() -> None:
+    """Test the aggregates match computing them from all samples."""
+    rnd = random.Random(1234)
+    window = SampleWindow(
+        25,
+        values=True,
+        squares=True,
+        extremes=True,
+        ordered=True,
+        differences=True,
+        areas=True,
+    )
+    age = dt_util.utcnow()
+    for value in _sample_values(rnd, 400):
+        age += timedelta(seconds=rnd.randrange(1, 100), microseconds=7)
+        window.append(value, age)
+        if rnd.randrange(10) == 0:
+            window.popleft()
+        states = list(window.states)
+        ages = list(window.ages)
+        count = len(states)
+        if count < 2:
+            continue
+
+        assert window.values.mean(count) == statistics.mean(states)
+        assert window.values.variance(count) == statistics.variance(states)
+        assert window.values.stdev(count) == statistics.stdev(states)
+        assert window.maximum.value == max(states)
+        assert window.minimum.value == min(states)
+        assert (
+            window.age_of_index(window.maximum.index) == ages[states.index(max(states))]
+        )
+        assert (
+            window.age_of_index(window.minimum.index) == ages[states.index(min(states))]
+        )
+        assert window.sorted_values.median() == statistics.median(states)
+        percentiles = statistics.quantiles(states, n=100, method="exclusive")
+        for percentile in (1, 50, 99):
+            assert (
+                window.sorted_values.percentile(percentile)
+                == percentiles[percentile - 1]
+            )
+        pairs = list(zip(states, states[1:]))
+        seconds = [(j - i).total_seconds() for i, j in zip(ages, ages[1:])]
+        # The terms are kept in order, so summing them is rounded the same
+        # as computing them from all samples
+        assert list(window.differences) == [abs(j - i) for i, j in pairs]
+        assert list(window.nonnegative_differences) == [
+            j - i if j >= i else j - 0 for i, j in pairs
+        ]
+        assert list(window.step_area) == [
+            i * delta for (i, _), delta in zip(pairs, seconds)
+        ]
+        assert list(window.linear_area) == [
+            0.5 * (i + j) * delta for (i, j), delta in zip(pairs, seconds)
+        ]
+
+
+def test_window_non_finite_values() -> None:
+    """Test values which are not finite are accounted for."""
+    window = SampleWindow(3, values=True, squares=True, extremes=True)
+    age = datetime(2023, 1, 1)
+    window.append(1.0, age)
+    window.append(math.inf, age)
+    assert not window.values.exact
+    assert window.values.mean(2) == math.inf
+    window.append(-math.inf, age)
+    assert math.isnan(window.values.mean(3))
+    window.append(math.nan, age)
+    assert window.nan_count == 1
+    assert math.isnan(window.values.mean(3))
+    window.append(2.0, age)
+    window.append(4.0, age)
+    window.append(3.0, age)
+    assert window.nan_count == 0
+    assert window.values.exact
+    assert window.values.mean(3) == 3.0
+    assert window.maximum.value == 4.0
+    assert window.minimum.value == 2.0
+
+
+def test_binary_window() -> None:
+    """Test the aggregates of a binary window."""
+    window = SampleWindow(3, is_binary=True, areas=True)
+    age = datetime(2023, 1, 1)
+    for state, seconds in ((True, 0), (False, 10), (True, 30), (True, 100)):
+        window.append(state, age + timedelta(seconds=seconds))
+    assert window.on_count == 2
+    assert list(window.step_area) == [0, 70.0]
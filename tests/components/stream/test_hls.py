@@ -577,3 +577,21 @@ async def test_hls_stream_rotate(
 
     # Stop stream, if it hasn't quit already
     await stream.stop()
+
+
+async def test_complete_segment_data_is_shared_with_parts(hass: HomeAssistant) -> None:
+    """Test a complete segment joins its data once and its parts share it."""
+    segment = Segment(sequence=0, init=INIT_BYTES)
+    segment.async_add_part(Part(duration=1, has_keyframe=True, data=b"part0"), 0)
+    assert segment.get_data() == b"part0"
+    assert segment.get_data_with_init() == INIT_BYTES + b"part0"
+
+    segment.async_add_part(Part(duration=1, has_keyframe=False, data=b"part1"), 2)
+    data_with_init = segment.get_data_with_init()
+    assert data_with_init == INIT_BYTES + b"part0part1"
+    assert segment.get_data_with_init() is data_with_init
+    assert segment.get_data() == b"part0part1"
+    assert [part.data for part in segment.parts] == [b"part0", b"part1"]
+    for part in segment.parts:
+        assert isinstance(part.data, memoryview)
+        assert part.data.obj is data_with_init
@@ -23,7 +23,11 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
+    async_setup_component,
+)
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -2348,6 +2352,33 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_setup_info_timeline(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test the bootstrap timeline is included in the setup info."""
+    hass.data[DATA_SETUP_TIME] = {
+        "august": datetime.timedelta(seconds=12.5),
+        "isy994": datetime.timedelta(seconds=12.8),
+    }
+    hass.data[DATA_SETUP_TIMELINE] = {
+        "august": {"started": 1.0, "finished": 13.5, "critical_path": ["http"]},
+    }
+    await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "domain": "august",
+            "seconds": 12.5,
+            "started": 1.0,
+            "finished": 13.5,
+            "critical_path": ["http"],
+        },
+        {"domain": "isy994", "seconds": 12.8},
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
@@ -431,6 +431,81 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_conflate_state_changes(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test state changes are conflated per entity when the client falls behind."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.bed", "off")
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_CONFLATE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    await websocket_client.send_json({"id": 2, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "off"
+
+    with patch("homeassistant.components.websocket_api.http.CONFLATE_MSG_THRESHOLD", 1):
+        # Fall behind with a pending message before the state changes
+        instance._send_message({"id": 3, "type": "pong"})
+        hass.states.async_set("light.kitchen", "on", {"brightness": 50})
+        hass.states.async_set("light.bed", "on")
+        hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+        hass.states.async_set("light.bed", "off")
+        hass.states.async_remove("light.bed")
+
+    assert instance._conflated_count == 3
+    assert instance._queue_depth_peak == 3
+
+    msg = await websocket_client.receive_json()
+    assert msg == {"id": 3, "type": "pong"}
+    msg = await websocket_client.receive_json()
+    kitchen = hass.states.get("light.kitchen")
+    assert msg["event"] == {
+        "c": {
+            "light.kitchen": {
+                "+": {
+                    "s": "on",
+                    "a": {"brightness": 100},
+                    "c": kitchen.context.id,
+                    "lc": kitchen.last_changed.timestamp(),
+                }
+            }
+        }
+    }
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.bed"]}
+
+    # The client caught up so state changes are sent right away again
+    hass.states.async_set("light.kitchen", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "off"
+    assert instance._conflated_count == 3
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
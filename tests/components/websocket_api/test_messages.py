@@ -2,6 +2,7 @@
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
+    StateChangedMessage,
     _cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
@@ -9,6 +10,7 @@ from homeassistant.components.websocket_api.messages import (
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -238,6 +240,40 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_state_changed_message_conflate(hass: HomeAssistant) -> None:
+    """Test conflating state changed messages of an entity."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.window", "off", {"color": "blue"})
+    hass.states.async_set("light.window", "off", {"color": "red"})
+    await hass.async_block_till_done()
+    last_state: State = state_change_events[-1].data["new_state"]
+
+    message = StateChangedMessage(5, state_change_events[1], False)
+    assert message.key == (5, "light.window")
+    assert message.as_json() == cached_event_message(5, state_change_events[1])
+    message.conflate(StateChangedMessage(5, state_change_events[2], False))
+    event_message = json_loads(message.as_json())
+    assert event_message["id"] == 5
+    assert event_message["event"]["data"]["old_state"]["state"] == "on"
+    assert event_message["event"]["data"]["new_state"]["attributes"] == {"color": "red"}
+
+    message = StateChangedMessage(6, state_change_events[1], True)
+    message.conflate(StateChangedMessage(6, state_change_events[2], True))
+    assert json_loads(message.as_json())["event"] == {
+        "c": {
+            "light.window": {
+                "+": {
+                    "a": {"color": "red"},
+                    "c": last_state.context.id,
+                    "lc": last_state.last_changed.timestamp(),
+                    "s": "off",
+                }
+            }
+        }
+    }
+
+
 async def test_message_to_json(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
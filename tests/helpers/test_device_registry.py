@@ -1877,3 +1877,37 @@ async def test_loading_invalid_configuration_url_from_storage(
         identifiers={("serial", "12:34:56:AB:CD:EF")},
     )
     assert entry.configuration_url == "invalid"
+
+
+async def test_entries_for_area_and_config_entry(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test looking up devices by area and config entry follows updates."""
+    for entry_id in ("entry1", "entry2"):
+        MockConfigEntry(entry_id=entry_id).add_to_hass(hass)
+    device1 = device_registry.async_get_or_create(
+        config_entry_id="entry1",
+        identifiers={("bridgeid", "0123")},
+    )
+    device2 = device_registry.async_get_or_create(
+        config_entry_id="entry1",
+        identifiers={("bridgeid", "4567")},
+    )
+    assert dr.async_entries_for_config_entry(device_registry, "entry1") == [
+        device1,
+        device2,
+    ]
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+
+    device1 = device_registry.async_update_device(device1.id, area_id="kitchen")
+    device2 = device_registry.async_get_or_create(
+        config_entry_id="entry2",
+        identifiers={("bridgeid", "4567")},
+    )
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [device1]
+    assert dr.async_entries_for_config_entry(device_registry, "entry2") == [device2]
+
+    device_registry.async_remove_device(device1.id)
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+    assert dr.async_entries_for_config_entry(device_registry, "entry1") == [device2]
+    assert dr.async_entries_for_config_entry(device_registry, "entry3") == []
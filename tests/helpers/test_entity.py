@@ -15,6 +15,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -118,8 +119,8 @@ class TestHelpersEntity:
         """Test device class attribute."""
         state = self.hass.states.get(self.entity.entity_id)
         assert state.attributes.get(ATTR_DEVICE_CLASS) is None
-        with patch(
-            "homeassistant.helpers.entity.Entity.device_class", new="test_class"
+        with patch.object(
+            self.entity, "_attr_device_class", new="test_class", create=True
         ):
             self.entity.schedule_update_ha_state()
             self.hass.block_till_done()
@@ -894,6 +895,74 @@ async def test_attribution_attribute(hass: HomeAssistant) -> None:
     assert state.attributes.get(ATTR_ATTRIBUTION) == "Home Assistant"
 
 
+async def test_static_attributes_memoized(hass: HomeAssistant) -> None:
+    """Test static attributes are only calculated again when their sources change."""
+    mock_entity = entity.Entity()
+    mock_entity.hass = hass
+    mock_entity.entity_id = "hello.world"
+    mock_entity._attr_icon = "mdi:one"
+    mock_entity._attr_name = "One"
+
+    with patch.object(
+        entity.Entity,
+        "_friendly_name_internal",
+        autospec=True,
+        side_effect=entity.Entity._friendly_name_internal,
+    ) as mock_friendly_name_internal:
+        mock_entity.async_write_ha_state()
+        mock_entity._attr_state = "on"
+        mock_entity.async_write_ha_state()
+
+        state = hass.states.get("hello.world")
+        assert state.state == "on"
+        assert state.attributes == {ATTR_FRIENDLY_NAME: "One", ATTR_ICON: "mdi:one"}
+        assert mock_friendly_name_internal.call_count == 1
+
+        mock_entity._attr_icon = "mdi:two"
+        mock_entity.async_write_ha_state()
+
+        state = hass.states.get("hello.world")
+        assert state.attributes == {ATTR_FRIENDLY_NAME: "One", ATTR_ICON: "mdi:two"}
+        assert mock_friendly_name_internal.call_count == 2
+
+        mock_entity.registry_entry = er.RegistryEntry(
+            entity_id="hello.world",
+            unique_id="one",
+            platform="hello",
+            name="Registry name",
+        )
+        mock_entity.async_write_ha_state()
+
+        state = hass.states.get("hello.world")
+        assert state.attributes == {
+            ATTR_FRIENDLY_NAME: "Registry name",
+            ATTR_ICON: "mdi:two",
+        }
+
+
+async def test_static_attributes_overridden_property(hass: HomeAssistant) -> None:
+    """Test static attributes of overridden properties are not memoized."""
+
+    class IconEntity(entity.Entity):
+        """Entity with an icon depending on its state."""
+
+        @property
+        def icon(self) -> str:
+            """Return the icon."""
+            return f"mdi:{self.state}"
+
+    mock_entity = IconEntity()
+    mock_entity.hass = hass
+    mock_entity.entity_id = "hello.world"
+    mock_entity._attr_state = "one"
+    mock_entity.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes[ATTR_ICON] == "mdi:one"
+
+    mock_entity._attr_state = "two"
+    mock_entity.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes[ATTR_ICON] == "mdi:two"
+
+
 async def test_entity_category_property(hass: HomeAssistant) -> None:
     """Test entity category property."""
     mock_entity1 = entity.Entity()
@@ -354,6 +354,29 @@ def test_is_registered(entity_registry: er.EntityRegistry) -> None:
     assert not entity_registry.async_is_registered("light.non_existing")
 
 
+async def test_saving_reuses_storage_fragments(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test only new and changed entries are serialized when saving."""
+    entry1 = entity_registry.async_get_or_create("light", "hue", "1234")
+    entry2 = entity_registry.async_get_or_create("light", "hue", "5678")
+    await flush_store(entity_registry._store)
+    fragment1 = entry1.as_storage_fragment
+    fragment2 = entry2.as_storage_fragment
+
+    entity_registry.async_update_entity(entry2.entity_id, name="New name")
+    await flush_store(entity_registry._store)
+    entry2 = entity_registry.async_get(entry2.entity_id)
+
+    assert entry1.as_storage_fragment is fragment1
+    assert entry2.as_storage_fragment is not fragment2
+    stored_entities = hass_storage[er.STORAGE_KEY]["data"]["entities"]
+    assert stored_entities == [entry1.as_storage_dict, entry2.as_storage_dict]
+    assert stored_entities[1]["name"] == "New name"
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_filter_on_load(
     hass: HomeAssistant, hass_storage: dict[str, Any]
@@ -1475,6 +1498,53 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_secondary_indexes() -> None:
+    """Test the EntityRegistryItems device, area and config entry indexes."""
+    entities = er.EntityRegistryItems()
+    assert entities.get_entries_for_device_id("device") == []
+    assert entities.get_entries_for_area_id("area") == []
+    assert entities.get_entries_for_config_entry_id("config_entry") == []
+
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="area",
+        config_entry_id="config_entry",
+        device_id="device",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        config_entry_id="config_entry",
+        device_id="device",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device") == [entry1]
+    assert entities.get_entries_for_device_id("device", True) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("area") == [entry1]
+    assert entities.get_entries_for_config_entry_id("config_entry") == [
+        entry1,
+        entry2,
+    ]
+
+    entry1_moved = attr.evolve(entry1, area_id="other_area", device_id=None)
+    entities["test.entity1"] = entry1_moved
+    assert entities.get_entries_for_device_id("device", True) == [entry2]
+    assert entities.get_entries_for_area_id("area") == []
+    assert entities.get_entries_for_area_id("other_area") == [entry1_moved]
+
+    del entities["test.entity1"]
+    del entities["test.entity2"]
+    assert entities._device_id_index == {}
+    assert entities._area_id_index == {}
+    assert entities._config_entry_id_index == {}
+
+
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+import math
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -24,7 +25,10 @@ from homeassistant.helpers.event import (
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    async_call_at,
     async_call_later,
+    async_enable_timer_wheel,
+    async_timer_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -33,6 +37,7 @@ from homeassistant.helpers.event import (
     async_track_state_added_domain,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_state_change_event_batch,
     async_track_state_change_filtered,
     async_track_state_removed_domain,
     async_track_sunrise,
@@ -522,6 +527,50 @@ async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     unsub_throws()
 
 
+async def test_async_track_state_change_event_batch(hass: HomeAssistant) -> None:
+    """Test state change events are passed in batches once per loop iteration."""
+    batches: list[list[tuple[str, str]]] = []
+
+    @ha.callback
+    def batch_callback(events: list[EventType[EventStateChangedData]]) -> None:
+        batches.append(
+            [
+                (event.data["entity_id"], event.data["new_state"].state)
+                for event in events
+            ]
+        )
+
+    unsub = async_track_state_change_event_batch(
+        hass, ["light.Bowl", "switch.side"], batch_callback
+    )
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.side", "on")
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.bowl", "off")
+    assert batches == []
+    # The batch is passed the loop iteration after the events are dispatched
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert batches == [
+        [("light.bowl", "on"), ("switch.side", "on"), ("light.bowl", "off")]
+    ]
+
+    hass.states.async_set("switch.side", "off")
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert batches[1:] == [[("switch.side", "off")]]
+
+    # Pending events are dropped on unsubscribe
+    hass.states.async_set("switch.side", "on")
+    await hass.async_block_till_done()
+    unsub()
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+    assert async_track_state_change_event_batch(hass, [], batch_callback) is not None
+
+
 async def test_async_track_state_change_event_with_empty_list(
     hass: HomeAssistant,
 ) -> None:
@@ -4412,6 +4461,59 @@ async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
             assert await future, "callback not canceled"
 
 
+async def test_timer_wheel(hass: HomeAssistant) -> None:
+    """Test timers due in the same tick share a loop timer."""
+    async_enable_timer_wheel(hass, 1)
+    calls: list[str] = []
+
+    def loop_timers() -> int:
+        return sum(not handle.cancelled() for handle in hass.loop._scheduled)
+
+    loop_timers_before = loop_timers()
+    scheduled_before = async_timer_stats(hass)["timers_scheduled"]
+
+    def action(name: str) -> Callable[[datetime], None]:
+        return callback(lambda _now: calls.append(name))
+
+    loop_time = hass.loop.time()
+    tick_end = math.ceil(loop_time + 5)
+    async_call_at(hass, action("second"), tick_end - 0.1)
+    async_call_at(hass, action("first"), tick_end - 0.2)
+    remove_third = async_call_at(hass, action("third"), tick_end)
+    remove_later = async_call_at(hass, action("later"), tick_end + 10)
+
+    assert loop_timers() == loop_timers_before + 2
+    assert async_timer_stats(hass) == {
+        "resolution": 1,
+        "timers_scheduled": scheduled_before + 4,
+        "timers_coalesced": 2,
+        "timers_cancelled": 0,
+        "timers_pending": 4,
+        "ticks_pending": 2,
+        "ticks_fired": 0,
+    }
+
+    remove_third()
+    remove_later()
+    # Cancelling the last timer of a tick cancels its loop timer
+    assert loop_timers() == loop_timers_before + 1
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=tick_end - loop_time)
+    )
+    assert calls == ["first", "second"]
+    stats = async_timer_stats(hass)
+    assert stats["timers_cancelled"] == 2
+    assert stats["timers_pending"] == 0
+    assert stats["ticks_fired"] == 1
+
+    async_enable_timer_wheel(hass, None)
+    remove = async_call_later(hass, 5, action("unused"))
+    assert async_timer_stats(hass)["timers_scheduled"] == scheduled_before + 5
+    assert async_timer_stats(hass)["ticks_pending"] == 0
+    remove()
+
+
 async def test_track_state_change_event_chain_multple_entity(
     hass: HomeAssistant,
 ) -> None:
@@ -4787,3 +4889,28 @@ async def test_async_track_device_registry_updated_event_with_a_callback_that_th
     unsub2()
 
     assert event_data[0] == {"action": "create", "device_id": device_id}
+
+
+async def test_timer_wheel_failing_timer(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing timer does not keep the others of its tick from running."""
+    async_enable_timer_wheel(hass, 1)
+    calls: list[str] = []
+
+    @callback
+    def failing_action(_now: datetime) -> None:
+        raise ValueError("timer failed")
+
+    loop_time = hass.loop.time()
+    tick_end = math.ceil(loop_time + 5)
+    async_call_at(hass, failing_action, tick_end - 0.2)
+    async_call_at(hass, callback(lambda _now: calls.append("after")), tick_end - 0.1)
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=tick_end - loop_time)
+    )
+    assert calls == ["after"]
+    assert "Error running timer" in caplog.text
+    assert "timer failed" in caplog.text
+    async_enable_timer_wheel(hass, None)
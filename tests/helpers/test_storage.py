@@ -16,6 +16,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
+from homeassistant.helpers.json import json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -224,6 +225,23 @@ async def test_loading_while_delay(
     assert data == {"delay": "yes"}
 
 
+async def test_loading_while_delay_with_json_fragments(
+    hass: HomeAssistant, store, hass_storage: dict[str, Any]
+) -> None:
+    """Test we load pending data that contains json fragments."""
+    store.async_delay_save(
+        lambda: {"items": [json_fragment(b'{"delay":"yes"}'), {"delay": "no"}]}, 1
+    )
+
+    data = await store.async_load()
+    assert data == {"items": [{"delay": "yes"}, {"delay": "no"}]}
+
+    await store._async_handle_write_data()
+    assert hass_storage[store.key]["data"] == {
+        "items": [{"delay": "yes"}, {"delay": "no"}]
+    }
+
+
 async def test_writing_while_writing_delay(
     hass: HomeAssistant, store, hass_storage: dict[str, Any]
 ) -> None:
@@ -3,10 +3,13 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime, timedelta
+from functools import partial
+import hashlib
 import json
 import logging
 import math
 import random
+import threading
 from typing import Any
 from unittest.mock import patch
 
@@ -307,6 +310,67 @@ async def test_import_change(hass: HomeAssistant) -> None:
     assert to_test.async_render() == "macro2 variable2"
 
 
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the compiled code of templates is persisted across restarts."""
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    template.TemplateEnvironment(hass, limited=True).compile("{{ 2 + 2 }}")
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY + 1),
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert data["version"].startswith(
+        f"{template.__version__}-{template.jinja2.__version__}-"
+    )
+    assert len(data["bytecode"]) == 2
+    assert sum(key.startswith("limited:") for key in data["bytecode"]) == 1
+
+    # Store the code of another template for the source to show it is used
+    default_key = next(key for key in data["bytecode"] if key.startswith("default:"))
+    limited_key = next(key for key in data["bytecode"] if key.startswith("limited:"))
+    data["bytecode"][default_key] = data["bytecode"][limited_key]
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 4
+
+    # The cache is discarded when the version changes
+    data["version"] = "2000.1.0"
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+
+async def test_bytecode_cache_max_entries(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the bytecode cache keeps the most recently used code."""
+    with patch.object(template, "BYTECODE_CACHE_MAX_ENTRIES", 2):
+        await template.async_load_bytecode_cache(hass)
+    env = template.TemplateEnvironment(hass)
+    for source in ("{{ 1 }}", "{{ 2 }}", "{{ 3 }}"):
+        env.compile(source)
+    # Using the code of the second template keeps it
+    template.TemplateEnvironment(hass).compile("{{ 2 }}")
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY + 1),
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert list(data["bytecode"]) == [
+        f"default:{hashlib.sha256(source.encode()).hexdigest()}"
+        for source in ("{{ 2 }}", "{{ 3 }}")
+    ]
+
+
 def test_loop_controls(hass: HomeAssistant) -> None:
     """Test that loop controls are enabled."""
     assert (
@@ -4238,6 +4302,81 @@ async def test_template_timeout(hass: HomeAssistant) -> None:
     tmp5 = template.Template(slow_template_str, hass)
     assert await tmp5.async_render_will_timeout(0.000001) is True
 
+    for _ in range(5):
+        assert await tmp.async_render_will_timeout(3) is False
+    stats = template.async_render_watchdog_stats(hass)
+    assert stats["threads_created"] <= template.MAX_RENDER_WATCHDOG_WORKERS
+    assert stats["jobs_interrupted"] == 1
+
+
+async def test_template_timeout_waits_for_worker(hass: HomeAssistant) -> None:
+    """Test a render waiting for a busy watchdog worker does not time out."""
+    release = threading.Event()
+    with patch.object(template, "MAX_RENDER_WATCHDOG_WORKERS", 1):
+        watchdog = template._get_render_watchdog(hass)
+    watchdog.submit(partial(release.wait, 5))
+    hass.loop.call_later(0.2, release.set)
+
+    # The render waits longer for the worker than it takes to render
+    tmp = template.Template("{{ 1 + 1 }}", hass)
+    assert await tmp.async_render_will_timeout(0.5) is False
+    assert release.is_set()
+    assert watchdog.stats()["jobs_interrupted"] == 0
+
+
+async def test_template_timeout_with_stuck_workers(hass: HomeAssistant) -> None:
+    """Test a render is not held up by workers which cannot be interrupted."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def _stuck() -> None:
+        started.set()
+        release.wait(5)
+
+    with patch.object(template, "MAX_RENDER_WATCHDOG_WORKERS", 1):
+        watchdog = template._get_render_watchdog(hass)
+    stuck_job = watchdog.submit(_stuck)
+    assert await hass.async_add_executor_job(started.wait, 5)
+    # The interrupt is not delivered while the worker waits for the event
+    assert watchdog.interrupt(stuck_job) is True
+
+    try:
+        tmp = template.Template("{{ 1 + 1 }}", hass)
+        assert await tmp.async_render_will_timeout(0.1) is False
+        assert not release.is_set()
+
+        slow_template_str = """
+{% for var in range(1000) -%}
+  {% for var in range(1000) -%}
+    {{ var }}
+  {%- endfor %}
+{%- endfor %}
+"""
+        tmp2 = template.Template(slow_template_str, hass)
+        assert await tmp2.async_render_will_timeout(0.000001) is True
+    finally:
+        release.set()
+    # The renders which did not start were taken off the queue
+    assert watchdog.stats()["jobs_interrupted"] == 3
+
+
+async def test_template_timeout_after_watchdog_shutdown(hass: HomeAssistant) -> None:
+    """Test renders are still checked after the watchdog was shut down."""
+    await hass.async_add_executor_job(template._get_render_watchdog(hass).shutdown)
+
+    tmp = template.Template("{{ 1 + 1 }}", hass)
+    assert await tmp.async_render_will_timeout(3) is False
+
+    slow_template_str = """
+{% for var in range(1000) -%}
+  {% for var in range(1000) -%}
+    {{ var }}
+  {%- endfor %}
+{%- endfor %}
+"""
+    tmp2 = template.Template(slow_template_str, hass)
+    assert await tmp2.async_render_will_timeout(0.000001) is True
+
 
 async def test_template_timeout_raise(hass: HomeAssistant) -> None:
     """Test we can raise from."""
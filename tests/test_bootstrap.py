@@ -17,6 +17,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+from homeassistant.setup import DATA_SETUP_TIMELINE
 
 from .common import (
     MockConfigEntry,
@@ -220,6 +221,63 @@ async def test_setup_after_deps_in_stage_1_ignored(hass: HomeAssistant) -> None:
     assert order == ["cloud", "an_after_dep", "normal_integration"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_not_blocked_by_unrelated_stage_1(hass: HomeAssistant) -> None:
+    """Test integrations do not wait for stage 1 integrations they do not need."""
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    order = []
+    cloud_continue = asyncio.Event()
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            if domain == "cloud":
+                await cloud_continue.wait()
+            if domain == "normal_integration":
+                cloud_continue.set()
+            order.append(domain)
+            return True
+
+        return async_setup
+
+    mock_integration(
+        hass, MockModule(domain="root", async_setup=gen_domain_setup("root"))
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="normal_integration",
+            async_setup=gen_domain_setup("normal_integration"),
+            dependencies=["root"],
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="after_cloud",
+            async_setup=gen_domain_setup("after_cloud"),
+            partial_manifest={"after_dependencies": ["cloud"]},
+        ),
+    )
+    mock_integration(
+        hass, MockModule(domain="cloud", async_setup=gen_domain_setup("cloud"))
+    )
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"cloud": {}, "normal_integration": {}, "after_cloud": {}}
+    )
+
+    assert order == ["root", "normal_integration", "cloud", "after_cloud"]
+    timeline = hass.data[DATA_SETUP_TIMELINE]
+    assert timeline["root"]["critical_path"] == []
+    assert timeline["normal_integration"]["critical_path"] == ["root"]
+    assert timeline["after_cloud"]["critical_path"] == ["cloud"]
+    assert (
+        timeline["normal_integration"]["finished"]
+        <= timeline["cloud"]["finished"]
+        <= timeline["after_cloud"]["started"]
+    )
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_frontend_before_recorder(hass: HomeAssistant) -> None:
     """Test frontend is setup before recorder."""
@@ -807,6 +865,33 @@ async def test_warning_logged_on_wrap_up_timeout(
     assert "Setup timed out for bootstrap - moving forward" in caplog.text
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_warning_logged_on_stage_1_timeout(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a stage 1 timeout is logged and stage 2 still gets its own timeout."""
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    cloud_continue = asyncio.Event()
+
+    async def cloud_setup(hass, config):
+        await cloud_continue.wait()
+        return True
+
+    mock_integration(hass, MockModule(domain="cloud", async_setup=cloud_setup))
+    mock_integration(hass, MockModule(domain="normal_integration"))
+
+    hass.loop.call_later(0.1, cloud_continue.set)
+    with patch.object(bootstrap, "STAGE_1_TIMEOUT", 0):
+        await bootstrap._async_set_up_integrations(
+            hass, {"cloud": {}, "normal_integration": {}}
+        )
+
+    assert "Setup timed out for stage 1 - moving forward" in caplog.text
+    assert "Setup timed out for stage 2 - moving forward" not in caplog.text
+    assert "cloud" in hass.config.components
+    assert "normal_integration" in hass.config.components
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_bootstrap_is_cancellation_safe(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
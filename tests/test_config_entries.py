@@ -28,10 +28,12 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.setup import async_set_domains_to_be_loaded, async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .common import (
     MockConfigEntry,
@@ -888,6 +890,39 @@ async def test_updating_entry_data(manager: config_entries.ConfigEntries) -> Non
     assert entry.data == {"second": True}
 
 
+async def test_entry_json_fragment_cache(
+    manager: config_entries.ConfigEntries,
+) -> None:
+    """Test the cached JSON fragment is cleared when the entry changes."""
+    entry = MockConfigEntry(domain="not_loaded", title="Original")
+    entry.add_to_manager(manager)
+
+    # Not cached while the handler is not loaded
+    fragment = entry.as_json_fragment
+    assert json_loads(json_bytes(fragment))["supports_options"] is False
+    assert entry.as_json_fragment is not fragment
+
+    class TestFlow(config_entries.ConfigFlow):
+        """Test flow."""
+
+        @staticmethod
+        @callback
+        def async_get_options_flow(config_entry):
+            """Test options flow."""
+
+    with patch.dict(config_entries.HANDLERS, {"not_loaded": TestFlow}):
+        fragment = entry.as_json_fragment
+        assert entry.as_json_fragment is fragment
+        assert json_loads(json_bytes(fragment))["supports_options"] is True
+
+        manager.async_update_entry(entry, title="Updated")
+        assert entry.as_json_fragment is not fragment
+        assert json_loads(json_bytes(entry.as_json_fragment))["title"] == "Updated"
+
+        entry.reason = "Failed"
+        assert json_loads(json_bytes(entry.as_json_fragment))["reason"] == "Failed"
+
+
 async def test_updating_entry_system_options(
     manager: config_entries.ConfigEntries,
 ) -> None:
@@ -1112,6 +1112,25 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_shares_unchanged_attributes(hass: HomeAssistant) -> None:
+    """Test unchanged attributes are shared with the previous state."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    assert state.as_dict_json()
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state2 = hass.states.get("light.bowl")
+    assert state2.attributes is state.attributes
+    assert '"attributes":{"brightness":100}' in state2.as_dict_json()
+    assert '"a":{"brightness":100}' in state2.as_compressed_state_json()
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    state3 = hass.states.get("light.bowl")
+    assert state3.attributes is not state2.attributes
+    assert state3.attributes == {"brightness": 50}
+    assert '"attributes":{"brightness":50}' in state3.as_dict_json()
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1940,6 +1959,30 @@ async def test_async_entity_ids_count(hass: HomeAssistant) -> None:
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_statemachine_domain_index(hass: HomeAssistant) -> None:
+    """Test domain filtered queries follow state additions and removals."""
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.frog", "on")
+
+    assert hass.states.async_entity_ids("light") == ["light.bowl", "light.frog"]
+    assert hass.states.async_entity_ids_count(["light", "switch"]) == 3
+    assert hass.states.async_entity_ids("vacuum") == []
+    assert hass.states.async_all("vacuum") == []
+
+    hass.states.async_set("light.bowl", "off")
+    assert [state.state for state in hass.states.async_all("light")] == ["off", "on"]
+
+    assert hass.states.async_remove("light.bowl")
+    assert hass.states.async_entity_ids("light") == ["light.frog"]
+    assert hass.states.async_entity_ids_count("LIGHT") == 1
+
+    assert hass.states.async_remove("light.frog")
+    assert hass.states.async_entity_ids("light") == []
+    assert hass.states.async_entity_ids_count("light") == 0
+    assert hass.states.async_entity_ids() == ["switch.link"]
+
+
 async def test_hassjob_forbid_coroutine() -> None:
     """Test hassjob forbids coroutines."""
 
@@ -2471,3 +2514,51 @@ async def test_validate_state(hass: HomeAssistant) -> None:
     assert ha.validate_state("test") == "test"
     with pytest.raises(InvalidStateError):
         ha.validate_state("t" * 256)
+
+
+async def test_eventbus_dispatch_follows_listener_changes(hass: HomeAssistant) -> None:
+    """Test listeners added and removed are reflected when firing events."""
+    calls = []
+
+    @ha.callback
+    def match_all_listener(event):
+        calls.append(("match_all", event.event_type))
+
+    @ha.callback
+    def listener(event):
+        calls.append(("listener", event.event_type))
+
+    unsub_listener = hass.bus.async_listen("test_event", listener)
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("other_event")
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+    assert calls == [
+        ("match_all", "test_event"),
+        ("listener", "test_event"),
+        ("match_all", "other_event"),
+    ]
+
+    calls.clear()
+    unsub_match_all()
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("other_event")
+    await hass.async_block_till_done()
+    assert calls == [("listener", "test_event")]
+
+    calls.clear()
+    unsub_listener()
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert calls == []
+    assert "test_event" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_skips_event_creation_without_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test no Event is created when an event has no listeners."""
+    with patch("homeassistant.core.Event") as mock_event:
+        hass.bus.async_fire("no_listeners_event")
+    assert not mock_event.called
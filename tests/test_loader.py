@@ -1,5 +1,8 @@
 """Test to verify that we can load components."""
-from unittest.mock import patch
+from datetime import timedelta
+import pathlib
+from typing import Any
+from unittest.mock import call, patch
 
 import pytest
 
@@ -7,8 +10,14 @@ from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass: HomeAssistant) -> None:
@@ -494,6 +503,98 @@ async def test_get_custom_components(
         mock_get.assert_called_once_with(hass)
 
 
+async def test_manifest_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+) -> None:
+    """Test manifests are reused from the persisted manifest index."""
+    await loader.async_get_integration(hass, "http")
+    await loader.async_get_integration(hass, "test_package")
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    roots = data["roots"]
+    built_in_root = roots[str(pathlib.Path(http.__file__).parent.parent)]
+    assert built_in_root["integrations"]["http"]["manifest"]["domain"] == "http"
+    custom_entry = next(
+        root["integrations"]["test_package"]
+        for root in roots.values()
+        if "test_package" in root["integrations"]
+    )
+    assert custom_entry["manifest"]["domain"] == "test_package"
+
+    def _restart() -> None:
+        for key in (
+            loader.DATA_CUSTOM_COMPONENTS,
+            loader.DATA_INTEGRATIONS,
+            loader.DATA_MANIFEST_INDEX,
+        ):
+            hass.data.pop(key, None)
+        hass.data[loader.DATA_INTEGRATIONS] = {}
+
+    read_text_orig = pathlib.Path.read_text
+    _restart()
+    with patch.object(
+        pathlib.Path, "read_text", side_effect=AssertionError
+    ) as read_text:
+        http_integration = await loader.async_get_integration(hass, "http")
+        custom_integration = await loader.async_get_integration(hass, "test_package")
+    assert read_text.call_count == 0
+    assert http_integration.domain == "http"
+    assert http_integration.is_built_in
+    assert custom_integration.domain == "test_package"
+    assert not custom_integration.is_built_in
+
+    # A changed custom manifest is read from disk again
+    custom_stat = custom_entry["stat"]
+    custom_entry["stat"] = [0, 0]
+    _restart()
+    with patch.object(
+        pathlib.Path, "read_text", autospec=True, side_effect=read_text_orig
+    ) as read_text:
+        await loader.async_get_integration(hass, "http")
+        await loader.async_get_integration(hass, "test_package")
+    assert read_text.call_count == 1
+
+    # Built-in manifests only change with a new version
+    custom_entry["stat"] = custom_stat
+    built_in_root["integrations"]["http"]["stat"] = [0, 0]
+    _restart()
+    with patch.object(
+        pathlib.Path, "read_text", side_effect=AssertionError
+    ) as read_text:
+        await loader.async_get_integration(hass, "http")
+    assert read_text.call_count == 0
+
+    # Unless it is a development version
+    data["ha_version"] = "2023.12.0.dev0"
+    _restart()
+    with patch.object(
+        pathlib.Path, "read_text", autospec=True, side_effect=read_text_orig
+    ) as read_text, patch("homeassistant.loader.__version__", "2023.12.0.dev0"):
+        await loader.async_get_integration(hass, "http")
+        await loader.async_get_integration(hass, "test_package")
+    assert read_text.call_args_list == [
+        call(pathlib.Path(http.__file__).parent / "manifest.json")
+    ]
+
+    # A new version drops the whole index
+    data["ha_version"] = "0.0.0"
+    _restart()
+    with patch.object(
+        pathlib.Path, "read_text", autospec=True, side_effect=read_text_orig
+    ) as read_text:
+        await loader.async_get_integration(hass, "http")
+    assert (
+        call(pathlib.Path(http.__file__).parent / "manifest.json")
+        in read_text.call_args_list
+    )
+
+
 async def test_get_config_flows(hass: HomeAssistant) -> None:
     """Verify that custom components with config_flow are available."""
     test_1_integration = _get_test_integration(hass, "test_1", False)
@@ -1,6 +1,9 @@
 """Test Home Assistant thread utils."""
 
 import asyncio
+from functools import partial
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -110,3 +113,115 @@ async def test_deadlock_safe_shutdown() -> None:
     assert not dead_thread_mock.join.called
     assert not daemon_thread_mock.join.called
     assert exception_thread_mock.join.call_args[0] == (expected_timeout,)
+
+
+async def _async_wait_for_jobs_run(
+    pool: thread.InterruptibleThreadPool, jobs_run: int
+) -> None:
+    """Wait for the pool to record a number of finished jobs.
+
+    Jobs are recorded after their target returns, so this can lag behind
+    anything the target signals.
+    """
+    async with asyncio.timeout(5):
+        while pool.stats()["jobs_run"] < jobs_run:
+            await asyncio.sleep(0.001)
+
+
+async def test_interruptible_thread_pool_reuses_threads() -> None:
+    """Test the pool reuses its worker threads."""
+    pool = thread.InterruptibleThreadPool(2, "test_pool")
+    results = []
+    done = threading.Event()
+
+    def _job(idx: int) -> None:
+        results.append(idx)
+        if len(results) == 10:
+            done.set()
+
+    for idx in range(10):
+        pool.submit(partial(_job, idx))
+    assert await asyncio.get_running_loop().run_in_executor(None, done.wait, 5)
+    await _async_wait_for_jobs_run(pool, 10)
+
+    assert sorted(results) == list(range(10))
+    stats = pool.stats()
+    assert stats["threads_created"] <= 2
+    assert stats["jobs_run"] == 10
+    assert stats["jobs_interrupted"] == 0
+    pool.shutdown()
+    assert pool.stats()["threads_alive"] == 0
+
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
+
+
+async def test_interruptible_thread_pool_interrupt() -> None:
+    """Test interrupting a running job keeps the worker usable."""
+    pool = thread.InterruptibleThreadPool(1, "test_pool")
+    started = threading.Event()
+    finished = threading.Event()
+    interrupted = threading.Event()
+
+    def _slow_job() -> None:
+        started.set()
+        try:
+            while True:
+                time.sleep(0.001)
+        except thread.JobInterrupted:
+            interrupted.set()
+            raise
+
+    job = pool.submit(_slow_job)
+    loop = asyncio.get_running_loop()
+    assert await loop.run_in_executor(None, started.wait, 5)
+    assert pool.interrupt(job) is True
+    assert pool.interrupt(job) is False
+    assert await loop.run_in_executor(None, interrupted.wait, 5)
+
+    queued_job = pool.submit(finished.set)
+    assert await loop.run_in_executor(None, finished.wait, 5)
+    await _async_wait_for_jobs_run(pool, 2)
+    assert pool.interrupt(queued_job) is False
+
+    stats = pool.stats()
+    assert stats["threads_created"] == 1
+    assert stats["jobs_interrupted"] == 1
+    assert stats["jobs_run"] == 2
+    pool.shutdown()
+
+
+async def test_interruptible_thread_pool_interrupt_races_finish() -> None:
+    """Test an interrupt delivered after its job finished keeps the worker usable."""
+    pool = thread.InterruptibleThreadPool(1, "test_pool")
+    # Let the test interrupt while holding the lock the worker is waiting for
+    pool._lock = threading.RLock()
+    running = threading.Event()
+    locked = threading.Event()
+    finished = threading.Event()
+
+    def _job() -> None:
+        running.set()
+        assert locked.wait(5)
+
+    def _interrupt_while_finishing(job: thread.InterruptibleJob) -> bool:
+        assert running.wait(5)
+        with pool._lock:
+            locked.set()
+            # Give the job time to finish and block on the lock
+            time.sleep(0.05)
+            return pool.interrupt(job)
+
+    job = pool.submit(_job)
+    loop = asyncio.get_running_loop()
+    assert await loop.run_in_executor(None, _interrupt_while_finishing, job)
+
+    pool.submit(finished.set)
+    assert await loop.run_in_executor(None, finished.wait, 5)
+    await _async_wait_for_jobs_run(pool, 2)
+
+    stats = pool.stats()
+    assert stats["threads_created"] == 1
+    assert stats["jobs_interrupted"] == 1
+    assert stats["jobs_run"] == 2
+    pool.shutdown()
@@ -3,6 +3,7 @@ import importlib
 import io
 import os
 import pathlib
+import time
 from typing import Any
 import unittest
 from unittest.mock import patch
@@ -547,3 +548,66 @@ async def test_loading_actual_file_with_syntax(
             "fixtures", "bad.yaml.txt"
         )
         await hass.async_add_executor_job(load_yaml_config_file, fixture_path)
+
+
+def test_load_yaml_reuses_unchanged_node_trees(
+    try_both_loaders, tmp_path: pathlib.Path
+) -> None:
+    """Test unchanged files are not parsed again."""
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text("automation: !include automations.yaml\npw: !secret pw\n")
+    automations_file = tmp_path / "automations.yaml"
+    automations_file.write_text("- alias: one\n")
+    secrets_file = tmp_path / "secrets.yaml"
+    secrets_file.write_text("pw: abc\n")
+    modified = time.time_ns() - 10 * yaml_loader.NODE_CACHE_MIN_AGE_NS
+    for file in (config_file, automations_file, secrets_file):
+        os.utime(file, ns=(modified, modified))
+    yaml_loader.clear_node_cache()
+
+    def _load() -> dict[str, Any]:
+        return yaml_loader.load_yaml(str(config_file), yaml.Secrets(tmp_path))
+
+    with patch.object(
+        yaml_loader, "_compose_yaml", wraps=yaml_loader._compose_yaml
+    ) as compose_yaml:
+        first = _load()
+        assert first == {"automation": [{"alias": "one"}], "pw": "abc"}
+        assert compose_yaml.call_count == 3
+
+        # Results are constructed again so they can be changed safely
+        first["automation"].append("changed")
+        assert _load() == {"automation": [{"alias": "one"}], "pw": "abc"}
+        assert compose_yaml.call_count == 3
+
+        secrets_file.write_text("pw: abcdef\n")
+        automations_file.write_text("- alias: two\n- alias: three\n")
+        second = _load()
+        assert second == {
+            "automation": [{"alias": "two"}, {"alias": "three"}],
+            "pw": "abcdef",
+        }
+        assert compose_yaml.call_count == 5
+        assert second["automation"].__config_file__ == str(config_file)
+        assert second["automation"][0].__config_file__ == str(automations_file)
+
+        # Recently modified files are not cached
+        assert _load() == second
+        assert compose_yaml.call_count == 7
+
+
+def test_node_cache_is_bounded() -> None:
+    """Test the least recently used node trees are evicted."""
+    node_cache = yaml_loader.NodeCache(10)
+    stat = os.stat_result((0, 0, 0, 0, 0, 0, 4, 0, 0, 0))
+    node = pyyaml.compose("a: 1")
+    for fname in ("one", "two", "three"):
+        node_cache.set(fname, stat, yaml_loader.SafeLoader, node)
+        assert node_cache.get("one", stat) is not None
+
+    assert node_cache.get("two", stat) is None
+    assert node_cache.get("three", stat) is not None
+
+    changed = os.stat_result((0, 0, 0, 0, 0, 0, 5, 0, 0, 1))
+    assert node_cache.get("three", changed) is None
+    assert node_cache.get("three", stat) is None